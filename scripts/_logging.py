@@ -0,0 +1,37 @@
+"""
+Buffered console logging shared by the seed and discovery scripts.
+Per-result output is written in chunks instead of one write per line.
+"""
+
+import sys
+import logging
+import logging.handlers
+from typing import TextIO, Tuple
+
+# Rule printed around script headers and summaries
+BANNER = "=" * 70
+
+
+def buffered_logger(name: str, capacity: int = 64,
+                    stream: TextIO = None) -> Tuple[logging.Logger, logging.handlers.MemoryHandler]:
+    """
+    Set up a logger whose messages are buffered before reaching the console.
+    Errors flush the buffer immediately; call flush() on the handler at checkpoints.
+
+    Args:
+        name: Logger name
+        capacity: Records held before the buffer is written out
+        stream: Console stream (default: stdout)
+
+    Returns:
+        (logger, buffering handler)
+    """
+    console = logging.StreamHandler(stream or sys.stdout)
+    console.setFormatter(logging.Formatter('%(message)s'))
+    output = logging.handlers.MemoryHandler(capacity=capacity, target=console)
+
+    logger = logging.getLogger(name)
+    logger.addHandler(output)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger, output
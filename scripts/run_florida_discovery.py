@@ -6,20 +6,66 @@ Searches across all major Florida regions for procurement opportunities.
 
 import sys
 import os
-import time
+import re
+import asyncio
 import logging
+import functools
+from itertools import product
+from typing import Dict, Tuple
+from urllib.parse import quote_plus
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src import database as db
-from src.discovery import DiscoveryEngine
+from src import seed_data
+from src.discovery import DiscoveryEngine, FLORIDA_COUNTIES, FLORIDA_CITIES
+from src.dedup import ArticleFingerprints, SeenURLs, canonicalize_url
+from src.query_batcher import QueryBatcher
+from scripts._logging import BANNER, buffered_logger
 
 logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
 
+# Console output for this script goes through a buffer so lines are written in chunks
+# rather than one write per result; errors and progress checkpoints flush it immediately
+logger, _output = buffered_logger(__name__, capacity=256, stream=sys.stderr)
 
-def get_comprehensive_florida_queries():
-    """Get comprehensive Florida-wide search queries."""
+
+# Counties and cities big enough to get their own targeted searches
+MAJOR_COUNTY_MIN_POPULATION = 250_000
+MAJOR_CITY_MIN_POPULATION = 250_000
+
+# Search templates expanded over every major county / city. County names like Orange, Lake,
+# Lee, Polk, Marion and Seminole exist in other states too, so county searches name Florida.
+COUNTY_TEMPLATES = [
+    '{name} County Florida procurement scandal',
+    '{name} County Florida bid rigging',
+    '{name} County Florida audit findings',
+]
+SCHOOL_TEMPLATES = [
+    '{name} County Florida schools construction contract',
+    '{name} County Florida schools procurement',
+]
+CITY_TEMPLATES = [
+    '{name} city contract scandal',
+    '{name} city corruption investigation',
+]
+
+# Earlier hand-picked searches the templates don't cover: a metro under the population
+# cutoff, and corruption searches for counties that have had such coverage
+ADDITIONAL_METRO_SEARCHES = [
+    'Fort Lauderdale contract scandal',
+    'Manatee County Florida corruption',
+    'Sarasota County Florida corruption',
+    'Pasco County Florida corruption',
+]
+
+
+@functools.cache
+def get_comprehensive_florida_queries() -> Tuple[Tuple[str, str], ...]:
+    """
+    Get comprehensive Florida-wide search queries.
+    Returns (query, url_encoded_query) pairs, built and encoded once per process.
+    """
     queries = []
 
     # General statewide searches
@@ -47,70 +93,19 @@ def get_comprehensive_florida_queries():
     ]
     queries.extend(statewide_terms)
 
-    # Major metro area searches
-    metro_searches = [
-        # South Florida
-        'Miami-Dade County procurement scandal',
-        'Broward County bid rigging',
-        'Palm Beach County contract fraud',
-        'Miami city corruption investigation',
-        'Fort Lauderdale contract scandal',
-        # Central Florida
-        'Orange County Florida procurement',
-        'Orlando city contract investigation',
-        'Seminole County audit findings',
-        'Osceola County bid rigging',
-        # Tampa Bay
-        'Hillsborough County procurement scandal',
-        'Tampa city contract fraud',
-        'Pinellas County audit findings',
-        'Pasco County corruption',
-        'St. Petersburg city procurement',
-        # Jacksonville
-        'Duval County procurement scandal',
-        'Jacksonville city contract fraud',
-        'JEA scandal investigation',
-        # Other major counties
-        'Lee County Florida procurement',
-        'Polk County contract scandal',
-        'Brevard County bid rigging',
-        'Volusia County audit findings',
-        'Sarasota County corruption',
-        'Collier County contract fraud',
-        'Leon County procurement scandal',
-        'Escambia County bid rigging',
-        'Alachua County contract investigation',
-        'Marion County procurement scandal',
-        'St. Johns County audit findings',
-        'Manatee County corruption',
-        'Lake County Florida procurement',
-    ]
-    queries.extend(metro_searches)
+    # Major metro area searches: every template for every major county and city
+    major_counties = [name for name, population in seed_data.florida_counties()
+                      if population >= MAJOR_COUNTY_MIN_POPULATION]
+    major_cities = [name for name, _, population in seed_data.florida_cities()
+                    if population >= MAJOR_CITY_MIN_POPULATION]
+
+    queries.extend(template.format(name=name) for name, template in product(major_counties, COUNTY_TEMPLATES))
+    queries.extend(template.format(name=name) for name, template in product(major_cities, CITY_TEMPLATES))
+    queries.extend(ADDITIONAL_METRO_SEARCHES)
+    queries.append('JEA scandal investigation')
 
     # School district specific searches
-    school_searches = [
-        'Miami-Dade schools construction scandal',
-        'Broward County schools bid rigging',
-        'Hillsborough schools contract fraud',
-        'Orange County schools procurement',
-        'Duval County schools construction',
-        'Palm Beach schools audit findings',
-        'Polk County schools contract scandal',
-        'Pinellas County schools procurement',
-        'Lee County schools construction bid',
-        'Brevard County schools contract',
-        'Volusia County schools procurement',
-        'Pasco County schools bid rigging',
-        'Seminole County schools construction',
-        'Sarasota County schools contract',
-        'Collier County schools procurement',
-        'Marion County schools construction investigation',
-        'Osceola County schools contract fraud',
-        'Manatee County schools bid scandal',
-        'St. Lucie County schools procurement',
-        'Escambia County schools construction',
-    ]
-    queries.extend(school_searches)
+    queries.extend(template.format(name=name) for name, template in product(major_counties, SCHOOL_TEMPLATES))
 
     # Issue-specific searches
     issue_searches = [
@@ -132,83 +127,196 @@ def get_comprehensive_florida_queries():
     ]
     queries.extend(issue_searches)
 
-    return queries
+    return tuple((query, quote_plus(query)) for query in queries)
 
 
-def run_comprehensive_discovery():
-    """Run comprehensive Florida-wide discovery."""
-    print("=" * 70)
-    print("COMPREHENSIVE FLORIDA-WIDE PROCUREMENT INTELLIGENCE DISCOVERY")
-    print("=" * 70)
+# Words that don't change what a query finds once place and kind are known
+_FILLER_WORDS = {'florida', 'county', 'the', 'of', 'in', 'and'}
+_PLACE_NAMES = sorted(FLORIDA_COUNTIES + FLORIDA_CITIES + ['JEA'], key=len, reverse=True)
 
-    # Initialize
-    engine = DiscoveryEngine()
-    queries = get_comprehensive_florida_queries()
 
-    print(f"\nTotal search queries: {len(queries)}")
-    print("This may take a while...\n")
+def query_signature(query: str) -> str:
+    """
+    Collapse a search phrase to a place::kind|issue-tags signature, so
+    near-identical phrasings of the same search share one key.
+    """
+    text = query.lower()
 
-    all_results = []
-    processed_urls = set()
+    place = 'statewide'
+    for name in _PLACE_NAMES:
+        if name.lower() in text:
+            place = name
+            text = text.replace(name.lower(), ' ')
+            break
 
-    for i, query in enumerate(queries):
-        print(f"[{i+1}/{len(queries)}] Searching: {query}")
+    tags = set()
+    for word in re.findall(r'[a-z0-9-]+', text):
+        if word in _FILLER_WORDS:
+            continue
+        # Singularize so "schools"/"school" and "findings"/"finding" collapse
+        if len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+            word = word[:-1]
+        tags.add(word)
 
-        try:
-            urls = engine.search_google_news(query, num_results=5)
-            print(f"    Found {len(urls)} articles")
+    if 'school' in tags:
+        entity_kind = 'school_board'
+    elif tags & {'city', 'municipal'}:
+        entity_kind = 'city'
+    else:
+        entity_kind = 'government'
+    tags -= {'school', 'city', 'board', 'district', 'government', 'municipal'}
+
+    return f"{place}::{entity_kind}|{sorted(tags)}"
+
+
+def dedupe_queries(queries) -> dict:
+    """Map each distinct query signature to the first (query, encoded) pair that produced it."""
+    unique = {}
+    for query, encoded in queries:
+        unique.setdefault(query_signature(query), (query, encoded))
+    return unique
 
+
+async def _discover_async(engine: DiscoveryEngine, queries: dict, concurrency: int, run_id: int) -> dict:
+    """
+    Search queries in rate-limited batches and process the articles they turn up concurrently.
+    Results are written to the run's discovery_results as they arrive; only counters stay in memory.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    processed_urls = SeenURLs()
+    signatures = {query: signature for signature, (query, _) in queries.items()}
+    tasks = []
+    stats = {
+        'queries_done': 0,
+        'articles_processed': 0,
+        'opportunities_found': 0,
+    }
+
+    async def polite_process(url):
+        # Per-host politeness is handled by the engine's rate limiter
+        async with semaphore:
+            try:
+                results = await engine.process_article_async(url)
+                engine.fingerprints.add_url(url)
+                return results
+            except Exception as e:
+                logger.debug("Error processing %s: %s", url, e)
+                return None
+
+    async def process_query(query, urls):
+        try:
+            new_urls = []
             for url in urls:
-                if url in processed_urls:
+                canonical = canonicalize_url(url)
+                if processed_urls.check_and_add(canonical) or engine.fingerprints.seen_url(canonical):
                     continue
-                processed_urls.add(url)
+                new_urls.append(url)
 
-                try:
-                    results = engine.process_article(url)
-                    if results:
-                        all_results.extend(results)
-                        for r in results:
-                            print(f"    + {r['entity']['name']} ({r['entity']['entity_type']}) - Score: {r['heat_score']}")
-                except Exception as e:
-                    logger.debug(f"Error processing {url}: {e}")
+            stats['articles_processed'] += len(new_urls)
+            for results in await asyncio.gather(*(polite_process(url) for url in new_urls)):
+                if results:
+                    db.insert_discovery_results(run_id, results)
+                    stats['opportunities_found'] += len(results)
+                    for r in results:
+                        logger.debug("    + %s (%s) - Score: %s",
+                                     r['entity']['name'], r['entity']['entity_type'], r['heat_score'])
 
-                # Be nice to servers
-                time.sleep(0.5)
+            db.mark_query_run(signatures[query], query)
 
         except Exception as e:
-            logger.error(f"Error with query '{query}': {e}")
+            logger.error("Error with query '%s': %s", query, e)
 
         # Progress update every 10 queries
-        if (i + 1) % 10 == 0:
-            print(f"\n--- Progress: {i+1}/{len(queries)} queries, {len(all_results)} opportunities found ---\n")
-
-    print("\n" + "=" * 70)
-    print(f"DISCOVERY COMPLETE")
-    print(f"Total opportunities found: {len(all_results)}")
-    print(f"Total unique articles processed: {len(processed_urls)}")
-    print("=" * 70)
-
-    # Summary by entity type
-    entity_types = {}
-    for r in all_results:
-        et = r['entity']['entity_type']
-        entity_types[et] = entity_types.get(et, 0) + 1
-
-    print("\nOpportunities by entity type:")
-    for et, count in sorted(entity_types.items(), key=lambda x: x[1], reverse=True):
-        print(f"  {et}: {count}")
-
-    # Summary by issue type
-    issue_types = {}
-    for r in all_results:
-        it = r.get('issue_type', 'unknown')
-        issue_types[it] = issue_types.get(it, 0) + 1
-
-    print("\nOpportunities by issue type:")
-    for it, count in sorted(issue_types.items(), key=lambda x: x[1], reverse=True):
-        print(f"  {it}: {count}")
-
-    return all_results
+        stats['queries_done'] += 1
+        if stats['queries_done'] % 10 == 0:
+            db.update_discovery_run(run_id, queries_done=stats['queries_done'],
+                                    articles_processed=stats['articles_processed'],
+                                    opportunities_found=stats['opportunities_found'])
+            logger.info("\n--- Progress: %d/%d queries, %d opportunities found ---\n",
+                        stats['queries_done'], len(queries), stats['opportunities_found'])
+            _output.flush()
+
+    async def on_urls(query, urls):
+        logger.info("Searched: %s - found %d articles", query, len(urls))
+        # Article processing runs in the background while the next batch is searched
+        tasks.append(asyncio.create_task(process_query(query, urls)))
+
+    async with engine:
+        await engine.prewarm()
+        batcher = QueryBatcher(engine, num_results=5)
+        for i, (query, encoded) in enumerate(queries.values()):
+            batcher.add(query, encoded)
+            if batcher.should_flush():
+                logger.info("[%d/%d] Searching batch of %d queries", i + 1, len(queries), len(batcher.pending))
+                await batcher.flush_into(on_urls)
+        if batcher.pending:
+            logger.info("[%d/%d] Searching batch of %d queries", len(queries), len(queries), len(batcher.pending))
+            await batcher.flush_into(on_urls)
+
+        await asyncio.gather(*tasks)
+
+    return stats
+
+
+def run_comprehensive_discovery(concurrency: int = 20, skip_recent_days: int = 1) -> Dict:
+    """
+    Run comprehensive Florida-wide discovery.
+    Queries whose signature was searched within skip_recent_days are skipped (0 runs everything),
+    so an interrupted run can simply be restarted. Returns the run's summary stats.
+    """
+    logger.info(BANNER)
+    logger.info("COMPREHENSIVE FLORIDA-WIDE PROCUREMENT INTELLIGENCE DISCOVERY")
+    logger.info(BANNER)
+
+    # Initialize
+    db.init_database()
+    engine = DiscoveryEngine()
+    engine.fingerprints = ArticleFingerprints()
+    all_queries = get_comprehensive_florida_queries()
+    queries = dedupe_queries(all_queries)
+
+    if skip_recent_days > 0:
+        recent = db.get_recent_query_signatures(skip_recent_days)
+        queries = {sig: q for sig, q in queries.items() if sig not in recent}
+
+    logger.info("\nTotal search queries: %d (%d duplicate or recently run skipped)",
+                len(queries), len(all_queries) - len(queries))
+    logger.info("Searching in rate-limited batches, processing up to %d articles concurrently...\n", concurrency)
+    _output.flush()
+
+    run_id = db.create_discovery_run(queries_total=len(queries))
+    try:
+        stats = asyncio.run(_discover_async(engine, queries, concurrency, run_id))
+    except BaseException:
+        db.update_discovery_run(run_id, status='failed')
+        raise
+    finally:
+        engine.fingerprints.save()
+        engine.close()
+        _output.flush()
+
+    db.update_discovery_run(run_id, status='completed', queries_done=stats['queries_done'],
+                            articles_processed=stats['articles_processed'],
+                            opportunities_found=stats['opportunities_found'])
+
+    logger.info("\n%s", BANNER)
+    logger.info("DISCOVERY COMPLETE (run #%d)", run_id)
+    logger.info("Total opportunities found: %d", stats['opportunities_found'])
+    logger.info("Total unique articles processed: %d", stats['articles_processed'])
+    logger.info(BANNER)
+
+    # Aggregate in SQLite rather than re-walking results in Python
+    logger.info("\nOpportunities by entity type:")
+    for et, count in db.get_discovery_run_breakdown(run_id, 'entity_type'):
+        logger.info("  %s: %d", et, count)
+
+    logger.info("\nOpportunities by issue type:")
+    for it, count in db.get_discovery_run_breakdown(run_id, 'issue_type'):
+        logger.info("  %s: %d", it, count)
+    _output.flush()
+
+    stats['run_id'] = run_id
+    return stats
 
 
 if __name__ == '__main__':
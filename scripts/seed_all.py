@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""
+Seed every known, real and verified Florida procurement article in one run.
+Articles are de-duplicated across the three lists and split by host: each host's
+articles are fetched one after another, while different hosts run in parallel processes.
+"""
+
+import sys
+import os
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.discovery import manual_add_articles
+from scripts._logging import BANNER, buffered_logger
+from scripts._article_registry import ARTICLE_INDEX, unseeded
+
+logger, _output = buffered_logger(__name__)
+
+
+def _run_host_serially(urls: List[str]) -> List[Tuple[str, list, str]]:
+    """
+    Seed one host's articles one at a time (runs in a worker process).
+    Returns (url, results, error) per article; errors are sent back as text
+    since not every exception survives pickling.
+    """
+    outcomes = []
+    for url, results in zip(urls, manual_add_articles(urls, concurrency=1)):
+        if isinstance(results, Exception):
+            outcomes.append((url, None, str(results)))
+        else:
+            outcomes.append((url, results, None))
+    return outcomes
+
+
+def seed_all(max_workers: int = 16):
+    """Seed the union of all article lists, parallel across hosts."""
+    urls = unseeded([url for _, url, _ in ARTICLE_INDEX])
+    pending = set(urls)
+    hosts = defaultdict(list)
+    for host, url, _ in ARTICLE_INDEX:
+        if url in pending:
+            hosts[host].append(url)
+
+    logger.info("%s\nSEEDING ALL FLORIDA PROCUREMENT ARTICLES\n%s", BANNER, BANNER)
+    logger.info("Total articles to process: %d across %d hosts (%d already seeded)\n",
+                len(urls), len(hosts), len(ARTICLE_INDEX) - len(urls))
+
+    successful = 0
+    failed = 0
+    entity_types = Counter()
+    issue_types = Counter()
+
+    if hosts:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(hosts))) as executor:
+            for outcomes in executor.map(_run_host_serially, hosts.values()):
+                for url, results, error in outcomes:
+                    logger.info("%.70s...", url)
+                    if error:
+                        failed += 1
+                        logger.info("    ! Error: %.50s", error)
+                    elif results:
+                        successful += 1
+                        for r in results:
+                            logger.info("    + %s (%s) - Score: %s",
+                                        r['entity']['name'], r['entity']['entity_type'], r['heat_score'])
+                            entity_types[r['entity']['entity_type']] += 1
+                            issue_types[r.get('issue_type') or 'unknown'] += 1
+                    else:
+                        failed += 1
+                        logger.info("    - No opportunities found")
+
+    entity_lines = ''.join(f"  {et}: {count}\n" for et, count in entity_types.most_common())
+    issue_lines = ''.join(f"  {it}: {count}\n" for it, count in issue_types.most_common())
+    logger.info(f"\n{BANNER}\n"
+                f"SEEDING COMPLETE\n"
+                f"{BANNER}\n"
+                f"Articles processed successfully: {successful}\n"
+                f"Articles failed: {failed}\n"
+                f"Total opportunities created: {sum(entity_types.values())}\n\n"
+                f"By Entity Type:\n{entity_lines}"
+                f"\nBy Issue Type:\n{issue_lines}"
+                f"{BANNER}")
+    _output.flush()
+
+
+if __name__ == '__main__':
+    seed_all()
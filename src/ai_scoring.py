@@ -10,10 +10,16 @@ Supports:
 
 import os
 import sys
+import json
+import importlib.util
+import random
+import asyncio
 import logging
 import re
+import heapq
 from typing import List, Dict, Optional, Tuple
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -30,11 +36,34 @@ except ImportError:
     OPENAI_AVAILABLE = False
 
 try:
+    import numpy as np
     from sentence_transformers import SentenceTransformer, util
+    from src.embedding_cache import EmbeddingCache, text_key
     SENTENCE_TRANSFORMERS_AVAILABLE = True
 except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# ONNX Runtime backend for sentence-transformers (pip install "sentence-transformers[onnx]").
+# Only checked for here; the runtime itself is loaded with the model.
+ONNX_AVAILABLE = all(importlib.util.find_spec(name) for name in ('onnxruntime', 'optimum'))
+
+
+# RFPs read per query, and score updates written per transaction, by rescore_all_rfps
+RESCORE_READ_BATCH = 500
+RESCORE_WRITE_BATCH = 1000
+
+# RFPs per keyword-scoring task sent to a worker process
+KEYWORD_TASK_SIZE = 200
+
+# Keyword matches kept in a combined scoring result
+TOP_KEYWORD_MATCHES = 10
+
 
 class KeywordScorer:
     """
@@ -161,19 +190,152 @@ class KeywordScorer:
         'paper products': -4.0,
     }
 
-    def __init__(self):
-        """Initialize the keyword scorer."""
-        self.all_keywords = {}
-        self.all_keywords.update(self.HIGH_VALUE_KEYWORDS)
-        self.all_keywords.update(self.MEDIUM_VALUE_KEYWORDS)
-        self.all_keywords.update(self.NEGATIVE_KEYWORDS)
+    # Terms that indicate each category; ties go to the category listed first
+    CATEGORY_KEYWORDS = {
+        'it_consulting': ['it assessment', 'technology assessment', 'it consulting',
+                        'digital transformation', 'it modernization', 'technology roadmap'],
+        'cybersecurity': ['cybersecurity', 'security audit', 'penetration testing',
+                        'vulnerability', 'security assessment'],
+        'software': ['software implementation', 'erp', 'system implementation',
+                   'software development', 'application'],
+        'cloud': ['cloud migration', 'cloud computing', 'cloud services',
+                'aws', 'azure', 'infrastructure'],
+        'data': ['data analytics', 'business intelligence', 'data governance',
+               'database', 'data warehouse', 'reporting'],
+        'professional_services': ['consulting', 'assessment', 'study',
+                                'analysis', 'planning', 'review'],
+    }
+
+    # Negative keyword score at or below which an RFP is vetoed without further scoring
+    NEGATIVE_VETO_THRESHOLD = -6.0
+
+    # Combined keyword table, built once for the class rather than per instance
+    all_keywords = {**HIGH_VALUE_KEYWORDS, **MEDIUM_VALUE_KEYWORDS, **NEGATIVE_KEYWORDS}
+    keyword_list = list(all_keywords)
+
+    # Every term one scan looks for: the scoring keywords first, then category-only terms
+    scan_terms = list(dict.fromkeys(keyword_list + [term for terms in CATEGORY_KEYWORDS.values()
+                                                    for term in terms]))
+
+    _automaton = None
+    _count_plan = None
+
+    @classmethod
+    def get_automaton(cls):
+        """
+        Build (on first use) and return the shared Aho-Corasick automaton over all scan terms.
+        With pyahocorasick installed, one automaton pass finds every keyword and category
+        term instead of scanning the text once per term. Returns None if pyahocorasick isn't installed.
+        """
+        if cls._automaton is None and AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for index, term in enumerate(cls.scan_terms):
+                automaton.add_word(term.lower(), index)
+            automaton.make_automaton()
+            cls._automaton = automaton
+        return cls._automaton
+
+    @classmethod
+    def get_count_plan(cls) -> List[Tuple[str, Optional[str]]]:
+        """
+        Build (on first use) and return the str.count plan used without pyahocorasick.
+        Terms are counted shortest first, each paired with the longest shorter term it
+        contains: when that term is absent, the longer one can't occur and is skipped.
+        """
+        if cls._count_plan is None:
+            by_length = sorted(cls.scan_terms, key=len)
+            plan = []
+            for i, term in enumerate(by_length):
+                contained = [other for other in by_length[:i] if other in term]
+                plan.append((term, contained[-1] if contained else None))
+            cls._count_plan = plan
+        return cls._count_plan
+
+    def scan(self, text_lower: str) -> Dict[str, int]:
+        """
+        Count occurrences of every scan term in already-lowercased text.
+
+        Returns:
+            term -> count for every term present, in scan-term order
+        """
+        automaton = self.get_automaton()
+        if automaton is not None:
+            counts = Counter(index for _, index in automaton.iter(text_lower))
+            return {self.scan_terms[index]: counts[index] for index in sorted(counts)}
+
+        counts = {}
+        for term, contained in self.get_count_plan():
+            if contained is not None and contained not in counts:
+                continue
+            count = text_lower.count(term)
+            if count > 0:
+                counts[term] = count
+        return {term: counts[term] for term in self.scan_terms if term in counts}
+
+    def count_keywords(self, text_lower: str) -> List[Tuple[str, int]]:
+        """
+        Count occurrences of each keyword in already-lowercased text.
+
+        Returns:
+            (keyword, count) for every keyword present, in keyword-table order
+        """
+        return [(term, count) for term, count in self.scan(text_lower).items()
+                if term in self.all_keywords]
+
+    def analyze(self, text: str, text_lower: str = None,
+                topk: int = None) -> Tuple[float, List[Dict], str, Optional[float]]:
+        """
+        Score and categorize text with a single scan.
+
+        Args:
+            text: Text to analyze
+            text_lower: text.lower(), if the caller already has it
+            topk: Only return this many of the highest-scoring matches
+
+        Returns:
+            Tuple of (score, list of matched keywords with weights, category, veto score),
+            where the veto score is set only for clear negatives (see veto_score)
+        """
+        if not text:
+            return 0.0, [], 'general', None
+
+        counts = self.scan(text_lower if text_lower is not None else text.lower())
+        score, matches = self._score_counts(counts, topk)
+        return score, matches, self._categorize_counts(counts), self.veto_score(counts)
+
+    def veto_score(self, counts: Dict[str, int]) -> Optional[float]:
+        """
+        Confidence-gated fast path for obvious negatives.
+        Text whose negative keywords add up to NEGATIVE_VETO_THRESHOLD or below, with no
+        high-value keyword, gets its final score from the keywords alone and skips the
+        semantic and OpenAI scorers. With keyword scoring alone such text can't reach the
+        relevance threshold; with semantic or OpenAI scoring active it might have (keyword
+        weight 0.4 or lower), so the veto deliberately overrides them for clear negatives.
+
+        Args:
+            counts: Term counts from scan()
+
+        Returns:
+            Final score for a clear negative, or None if the text needs full scoring
+        """
+        if any(term in self.HIGH_VALUE_KEYWORDS for term in counts):
+            return None
+
+        negative = sum(self.NEGATIVE_KEYWORDS[term] * (1 + 0.2 * (count - 1))
+                       for term, count in counts.items() if term in self.NEGATIVE_KEYWORDS)
+        if negative > self.NEGATIVE_VETO_THRESHOLD:
+            return None
 
-    def score_text(self, text: str) -> Tuple[float, List[Dict]]:
+        return max(0.0, 25 + negative * 5)
+
+    def score_text(self, text: str, text_lower: str = None, topk: int = None) -> Tuple[float, List[Dict]]:
         """
         Score text based on keyword presence and weights.
 
         Args:
             text: Text to score
+            text_lower: text.lower(), if the caller already has it
+            topk: Only return this many of the highest-scoring matches
 
         Returns:
             Tuple of (score, list of matched keywords with weights)
@@ -181,60 +343,53 @@ class KeywordScorer:
         if not text:
             return 0.0, []
 
-        text_lower = text.lower()
+        return self._score_counts(self.scan(text_lower if text_lower is not None else text.lower()), topk)
+
+    def _score_counts(self, counts: Dict[str, int], topk: int = None) -> Tuple[float, List[Dict]]:
+        """Score from the term counts of one scan, keeping the top `topk` matches if given."""
         matches = []
         total_score = 0.0
 
-        # Check each keyword
-        for keyword, weight in self.all_keywords.items():
-            count = text_lower.count(keyword.lower())
-            if count > 0:
-                # Diminishing returns for multiple occurrences
-                keyword_score = weight * (1 + 0.2 * (count - 1))
-                total_score += keyword_score
-                matches.append({
-                    'keyword': keyword,
-                    'weight': weight,
-                    'count': count,
-                    'score': keyword_score
-                })
+        for keyword, count in counts.items():
+            weight = self.all_keywords.get(keyword)
+            if weight is None:
+                continue
+            # Diminishing returns for multiple occurrences
+            keyword_score = weight * (1 + 0.2 * (count - 1))
+            total_score += keyword_score
+            matches.append({
+                'keyword': keyword,
+                'weight': weight,
+                'count': count,
+                'score': keyword_score
+            })
 
         # Normalize score to 0-100 range
         # Typical high-value RFP might score 15-25 raw
         normalized_score = min(100, max(0, (total_score / 25) * 100))
 
+        if topk is not None:
+            return normalized_score, heapq.nlargest(topk, matches, key=lambda x: x['score'])
         return normalized_score, sorted(matches, key=lambda x: x['score'], reverse=True)
 
-    def categorize_rfp(self, text: str) -> str:
+    def categorize_rfp(self, text: str, text_lower: str = None) -> str:
         """
         Categorize an RFP based on content.
 
         Args:
             text: RFP text
+            text_lower: text.lower(), if the caller already has it
 
         Returns:
             Category string
         """
-        text_lower = text.lower()
-
-        categories = {
-            'it_consulting': ['it assessment', 'technology assessment', 'it consulting',
-                            'digital transformation', 'it modernization', 'technology roadmap'],
-            'cybersecurity': ['cybersecurity', 'security audit', 'penetration testing',
-                            'vulnerability', 'security assessment'],
-            'software': ['software implementation', 'erp', 'system implementation',
-                       'software development', 'application'],
-            'cloud': ['cloud migration', 'cloud computing', 'cloud services',
-                    'aws', 'azure', 'infrastructure'],
-            'data': ['data analytics', 'business intelligence', 'data governance',
-                   'database', 'data warehouse', 'reporting'],
-            'professional_services': ['consulting', 'assessment', 'study',
-                                    'analysis', 'planning', 'review'],
-        }
+        return self._categorize_counts(self.scan(text_lower if text_lower is not None else text.lower()))
 
+    def _categorize_counts(self, counts: Dict[str, int]) -> str:
+        """Pick the category with the most distinct terms present in one scan's counts."""
         category_scores = {}
-        for category, keywords in categories.items():
-            score = sum(1 for kw in keywords if kw in text_lower)
+        for category, terms in self.CATEGORY_KEYWORDS.items():
+            score = sum(1 for term in terms if term in counts)
             if score > 0:
                 category_scores[category] = score
 
@@ -262,18 +417,42 @@ class SemanticScorer:
         "Management consulting for technology and organizational improvement"
     ]
 
-    def __init__(self, model_name: str = 'all-MiniLM-L6-v2'):
+    # Tokens the model reads per text; anything longer is truncated by the tokenizer
+    MAX_SEQ_LENGTH = 256
+
+    # Characters kept before tokenizing - comfortably more than MAX_SEQ_LENGTH tokens,
+    # so the tokenizer isn't handed a long tail it would throw away
+    MAX_TEXT_CHARS = 2000
+
+    def __init__(self, model_name: str = 'all-MiniLM-L6-v2', cache: 'EmbeddingCache' = None,
+                 backend: str = None):
         """
         Initialize the semantic scorer.
 
         Args:
             model_name: Sentence transformer model to use
+            cache: Embedding cache (defaults to the on-disk cache for this model)
+            backend: 'onnx' or 'torch' (defaults to ONNX Runtime when installed, which encodes faster on CPU)
         """
         if not SENTENCE_TRANSFORMERS_AVAILABLE:
             raise RuntimeError("sentence-transformers not installed. Run: pip install sentence-transformers")
 
-        self.model = SentenceTransformer(model_name)
+        self.backend = backend or ('onnx' if ONNX_AVAILABLE else 'torch')
+        if self.backend == 'torch':
+            self.model = SentenceTransformer(model_name)
+        else:
+            try:
+                self.model = SentenceTransformer(model_name, backend=self.backend)
+            except Exception as e:
+                # Older sentence-transformers has no backend option; exporting can also fail
+                logger.warning(f"Could not load {model_name} with the {self.backend} backend, using torch: {e}")
+                self.backend = 'torch'
+                self.model = SentenceTransformer(model_name)
+
+        self.model.max_seq_length = min(self.model.max_seq_length or self.MAX_SEQ_LENGTH, self.MAX_SEQ_LENGTH)
         self.target_embeddings = self.model.encode(self.TARGET_DESCRIPTIONS)
+        # Embeddings depend on the backend and sequence length as well as the model
+        self.cache = cache or EmbeddingCache(f"{model_name}:{self.backend}:{self.model.max_seq_length}")
 
     def score_text(self, text: str) -> Tuple[float, str]:
         """
@@ -285,27 +464,77 @@ class SemanticScorer:
         Returns:
             Tuple of (score, most similar target description)
         """
-        if not text:
-            return 0.0, ""
+        return self.score_texts([text])[0]
+
+    def score_texts(self, texts: List[str], batch_size: int = 64) -> List[Tuple[float, str]]:
+        """
+        Score many texts with one batched encode call.
+        Texts already in the embedding cache (up to case, whitespace and punctuation) are not encoded again.
+
+        Args:
+            texts: Texts to score
+            batch_size: Texts per forward pass
+
+        Returns:
+            (score, most similar target description) for each text, in order
+        """
+        results = [(0.0, "")] * len(texts)
 
-        # Truncate very long text
-        text = text[:2000]
+        # Truncate very long text; empty texts keep the zero result
+        indices = [i for i, text in enumerate(texts) if text]
+        if not indices:
+            return results
 
-        # Encode the input text
-        text_embedding = self.model.encode([text])[0]
+        truncated = {i: texts[i][:self.MAX_TEXT_CHARS] for i in indices}
+        keys = {i: text_key(truncated[i]) for i in indices}
 
-        # Calculate similarities
-        similarities = util.cos_sim(text_embedding, self.target_embeddings)[0]
+        # One lookup for every hash, then encode only the misses
+        cached = self.cache.get_many(keys.values())
+        misses = {}
+        for i in indices:
+            if keys[i] not in cached:
+                misses.setdefault(keys[i], truncated[i])
 
-        # Get best match
-        best_idx = similarities.argmax().item()
-        best_score = similarities[best_idx].item()
-        best_match = self.TARGET_DESCRIPTIONS[best_idx]
+        if misses:
+            encoded = self.model.encode(list(misses.values()), batch_size=batch_size)
+            new_embeddings = dict(zip(misses, encoded))
+            self.cache.put_many(new_embeddings)
+            cached.update(new_embeddings)
 
-        # Convert to 0-100 scale (similarity is typically 0-1)
-        normalized_score = best_score * 100
+        embeddings = np.stack([cached[keys[i]] for i in indices]).astype(np.float32)
 
-        return normalized_score, best_match
+        # (N, targets) similarity matrix, best target per row
+        similarities = util.cos_sim(embeddings, self.target_embeddings)
+        best_scores, best_indices = similarities.max(dim=1)
+
+        for row, i in enumerate(indices):
+            # Convert to 0-100 scale (similarity is typically 0-1)
+            results[i] = (best_scores[row].item() * 100, self.TARGET_DESCRIPTIONS[best_indices[row].item()])
+
+        return results
+
+
+SYSTEM_PROMPT = """Analyze government RFPs for relevance to IT consulting services.
+
+Rate the relevance from 0-100 based on:
+- Is this IT, technology, or consulting related?
+- Is this a good opportunity for a consulting firm?
+- Exclude construction, physical services, commodities
+
+Give a short category, a brief reason and the key services the RFP asks for."""
+
+# Response schema enforced by OpenAI structured outputs, so replies always parse
+SCORE_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'score': {'type': 'integer', 'description': 'Relevance from 0 to 100'},
+        'category': {'type': 'string'},
+        'reason': {'type': 'string'},
+        'key_services': {'type': 'array', 'items': {'type': 'string'}}
+    },
+    'required': ['score', 'category', 'reason', 'key_services'],
+    'additionalProperties': False
+}
 
 
 class OpenAIScorer:
@@ -314,6 +543,9 @@ class OpenAIScorer:
     Provides natural language analysis.
     """
 
+    # Structured outputs (json_schema response_format) need gpt-4o-mini or newer
+    MODEL = "gpt-4o-mini"
+
     def __init__(self, api_key: str = None):
         """
         Initialize the OpenAI scorer.
@@ -328,7 +560,40 @@ class OpenAIScorer:
         if not self.api_key:
             raise ValueError("OpenAI API key not provided")
 
-        openai.api_key = self.api_key
+        self.client = openai.OpenAI(api_key=self.api_key)
+
+    def build_request(self, title: str, description: str = None) -> Dict:
+        """Build the chat-completion request body for one RFP."""
+        user_content = f"RFP Title: {title}"
+        if description:
+            user_content += f"\nDescription: {description[:1000]}"
+
+        return {
+            'model': self.MODEL,
+            'messages': [
+                {'role': 'system', 'content': SYSTEM_PROMPT},
+                {'role': 'user', 'content': user_content}
+            ],
+            'response_format': {
+                'type': 'json_schema',
+                'json_schema': {'name': 'rfp_score', 'schema': SCORE_SCHEMA, 'strict': True}
+            },
+            'max_tokens': 120,
+            'temperature': 0.3
+        }
+
+    @staticmethod
+    def parse_response(result_text: str) -> Dict:
+        """Parse the model's JSON reply (guaranteed to match SCORE_SCHEMA) into a scoring result."""
+        result = json.loads(result_text)
+
+        return {
+            'score': float(result.get('score', 0)),
+            'category': result.get('category', 'unknown'),
+            'reason': result.get('reason', ''),
+            'key_services': result.get('key_services', []),
+            'model': OpenAIScorer.MODEL
+        }
 
     def score_rfp(self, title: str, description: str = None) -> Dict:
         """
@@ -341,40 +606,10 @@ class OpenAIScorer:
         Returns:
             Dict with score, category, and analysis
         """
-        prompt = f"""Analyze this government RFP for relevance to IT consulting services.
-
-RFP Title: {title}
-{f'Description: {description[:1000]}' if description else ''}
-
-Rate the relevance from 0-100 based on:
-- Is this IT, technology, or consulting related?
-- Is this a good opportunity for a consulting firm?
-- Exclude construction, physical services, commodities
-
-Respond in this exact JSON format:
-{{"score": <0-100>, "category": "<category>", "reason": "<brief reason>", "key_services": ["<service1>", "<service2>"]}}"""
-
         try:
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=200,
-                temperature=0.3
-            )
-
-            result_text = response.choices[0].message.content.strip()
+            response = self.client.chat.completions.create(**self.build_request(title, description))
 
-            # Parse JSON response
-            import json
-            result = json.loads(result_text)
-
-            return {
-                'score': float(result.get('score', 0)),
-                'category': result.get('category', 'unknown'),
-                'reason': result.get('reason', ''),
-                'key_services': result.get('key_services', []),
-                'model': 'gpt-3.5-turbo'
-            }
+            return self.parse_response(response.choices[0].message.content)
 
         except Exception as e:
             logger.error(f"OpenAI scoring failed: {e}")
@@ -383,6 +618,120 @@ Respond in this exact JSON format:
                 'error': str(e)
             }
 
+    async def ascore_rfp(self, client: 'openai.AsyncOpenAI', title: str, description: str = None,
+                         max_retries: int = 5, backoff: float = 1.0) -> Dict:
+        """
+        Score an RFP using OpenAI without blocking the event loop.
+        Rate-limit (429), server (5xx) and connection errors are retried with exponential backoff.
+
+        Args:
+            client: Async client opened in the running event loop (see ascore_rfps)
+            title: RFP title
+            description: RFP description
+            max_retries: Retries before giving up
+            backoff: Initial backoff in seconds, doubled on every retry
+
+        Returns:
+            Dict with score, category, and analysis
+        """
+        for attempt in range(max_retries + 1):
+            try:
+                response = await client.chat.completions.create(
+                    **self.build_request(title, description))
+                return self.parse_response(response.choices[0].message.content)
+
+            except (openai.RateLimitError, openai.InternalServerError, openai.APIConnectionError) as e:
+                if attempt == max_retries:
+                    error = e
+                    break
+                delay = backoff * 2 ** attempt + random.uniform(0, 1)
+                logger.warning(f"OpenAI request failed ({e}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+            except Exception as e:
+                error = e
+                break
+
+        logger.error(f"OpenAI scoring failed: {error}")
+        return {
+            'score': 0,
+            'error': str(error)
+        }
+
+    async def ascore_rfps(self, rfps: List[Dict], concurrency: int = 10) -> List[Dict]:
+        """
+        Score many RFPs concurrently, at most `concurrency` requests in flight.
+        The async client is opened per call: its connection pool is bound to the event loop,
+        and callers start a new loop (asyncio.run) for every page of RFPs.
+
+        Args:
+            rfps: RFP dicts with 'title' and 'description'
+            concurrency: Maximum simultaneous requests
+
+        Returns:
+            Scoring result for each RFP, in order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with openai.AsyncOpenAI(api_key=self.api_key) as client:
+            async def score_one(rfp: Dict) -> Dict:
+                async with semaphore:
+                    return await self.ascore_rfp(client, rfp['title'], rfp.get('description'))
+
+            results = await asyncio.gather(*(score_one(rfp) for rfp in rfps), return_exceptions=True)
+        return [{'score': 0, 'error': str(r)} if isinstance(r, Exception) else r for r in results]
+
+    def submit_batch(self, rfps: List[Dict]) -> str:
+        """
+        Submit RFPs to the OpenAI Batch API for scoring within 24 hours,
+        at half the price of real-time requests and outside the per-minute rate limits.
+
+        Args:
+            rfps: RFP dicts with 'id', 'title' and 'description'
+
+        Returns:
+            Batch ID to pass to fetch_batch_results
+        """
+        lines = [json.dumps({
+            'custom_id': str(rfp['id']),
+            'method': 'POST',
+            'url': '/v1/chat/completions',
+            'body': self.build_request(rfp['title'], rfp.get('description'))
+        }) for rfp in rfps]
+
+        batch_file = self.client.files.create(file=('rfp_batch.jsonl', '\n'.join(lines).encode('utf-8')),
+                                              purpose='batch')
+        batch = self.client.batches.create(input_file_id=batch_file.id, endpoint='/v1/chat/completions',
+                                           completion_window='24h')
+        logger.info(f"Submitted OpenAI batch {batch.id} with {len(rfps)} RFPs")
+        return batch.id
+
+    def fetch_batch_results(self, batch_id: str) -> Optional[Dict[int, Dict]]:
+        """
+        Download the results of a batch submitted with submit_batch.
+
+        Args:
+            batch_id: Batch ID returned by submit_batch
+
+        Returns:
+            Scoring result per RFP ID, or None if the batch hasn't completed
+        """
+        batch = self.client.batches.retrieve(batch_id)
+        if batch.status != 'completed':
+            logger.info(f"OpenAI batch {batch_id} is {batch.status}")
+            return None
+
+        results = {}
+        for line in self.client.files.content(batch.output_file_id).text.splitlines():
+            item = json.loads(line)
+            try:
+                content = item['response']['body']['choices'][0]['message']['content']
+                results[int(item['custom_id'])] = self.parse_response(content)
+            except (KeyError, IndexError, TypeError, ValueError) as e:
+                logger.warning(f"No usable batch result for RFP {item.get('custom_id')}: {e}")
+
+        return results
+
 
 class AIRelevanceScorer:
     """
@@ -390,6 +739,14 @@ class AIRelevanceScorer:
     Falls back gracefully based on available libraries.
     """
 
+    # Weighted-average weights by number of methods that produced a score.
+    # Two methods: keyword 40%, other 60%. Three: keyword 30%, semantic 35%, OpenAI 35%
+    _WEIGHT_TABLE = {
+        1: (1.0,),
+        2: (0.4, 0.6),
+        3: (0.3, 0.35, 0.35),
+    }
+
     def __init__(self, use_openai: bool = False, use_semantic: bool = False):
         """
         Initialize the combined scorer.
@@ -416,17 +773,23 @@ class AIRelevanceScorer:
             except Exception as e:
                 logger.warning(f"Failed to initialize OpenAI scorer: {e}")
 
-    def score_rfp(self, title: str, description: str = None) -> Dict:
+    def score_rfp(self, title: str, description: str = None,
+                  keyword: Tuple[float, List[Dict], str, Optional[float]] = None,
+                  semantic: Tuple[float, str] = None, ai_result: Dict = None) -> Dict:
         """
         Score an RFP using all available methods.
 
         Args:
             title: RFP title
             description: RFP description
+            keyword: Precomputed result of KeywordScorer.analyze, if batched
+            semantic: Precomputed (score, match) from SemanticScorer.score_texts, if batched
+            ai_result: Precomputed result from OpenAIScorer.ascore_rfps, if batched
 
         Returns:
             Combined scoring result
         """
+        # Build and lowercase the combined text once; every keyword lookup uses the lowered copy
         text = f"{title} {description or ''}"
 
         result = {
@@ -435,18 +798,26 @@ class AIRelevanceScorer:
         }
 
         # Keyword scoring (always available)
-        kw_score, kw_matches = self.keyword_scorer.score_text(text)
+        kw_score, kw_matches, category, veto = keyword or self.keyword_scorer.analyze(
+            text, text.lower(), topk=TOP_KEYWORD_MATCHES)
         result['keyword_score'] = kw_score
-        result['keyword_matches'] = kw_matches[:10]  # Top 10 matches
-        result['category'] = self.keyword_scorer.categorize_rfp(text)
+        result['keyword_matches'] = kw_matches
+        result['category'] = category
         result['methods_used'].append('keyword')
 
+        # Clear negatives can't become relevant; skip the semantic and OpenAI scorers
+        if veto is not None:
+            result['final_score'] = veto
+            result['is_relevant'] = False
+            result['negative_veto'] = True
+            return result
+
         scores = [kw_score]
 
         # Semantic scoring
         if self.semantic_scorer:
             try:
-                sem_score, best_match = self.semantic_scorer.score_text(text)
+                sem_score, best_match = semantic or self.semantic_scorer.score_text(text)
                 result['semantic_score'] = sem_score
                 result['semantic_match'] = best_match
                 result['methods_used'].append('semantic')
@@ -457,7 +828,7 @@ class AIRelevanceScorer:
         # OpenAI scoring
         if self.openai_scorer:
             try:
-                ai_result = self.openai_scorer.score_rfp(title, description)
+                ai_result = ai_result or self.openai_scorer.score_rfp(title, description)
                 result['openai_score'] = ai_result.get('score', 0)
                 result['openai_reason'] = ai_result.get('reason', '')
                 result['openai_services'] = ai_result.get('key_services', [])
@@ -468,44 +839,107 @@ class AIRelevanceScorer:
                 logger.warning(f"OpenAI scoring failed: {e}")
 
         # Calculate combined score (weighted average)
-        if len(scores) == 1:
-            result['final_score'] = scores[0]
-        elif len(scores) == 2:
-            result['final_score'] = (scores[0] * 0.4 + scores[1] * 0.6)
-        else:
-            # Keyword: 30%, Semantic: 35%, OpenAI: 35%
-            result['final_score'] = (scores[0] * 0.3 + scores[1] * 0.35 + scores[2] * 0.35)
+        result['final_score'] = sum(score * weight for score, weight in zip(scores, self._WEIGHT_TABLE[len(scores)]))
 
         result['is_relevant'] = result['final_score'] >= 40
 
         return result
 
-    def rescore_all_rfps(self) -> Dict:
+    def rescore_all_rfps(self, ai_results: Dict[int, Dict] = None, workers: int = None) -> Dict:
         """
         Rescore all RFPs in the database.
+        Keyword scoring is spread over worker processes once the table fills a whole page;
+        semantic scoring stays in this process.
+
+        Args:
+            ai_results: OpenAI results per RFP ID from a finished batch, used instead of real-time requests
+            workers: Keyword-scoring processes (defaults to the CPU count)
 
         Returns:
             Scoring statistics
         """
-        rfps = db.get_all_rfps()
-
         stats = {
-            'total': len(rfps),
+            'total': 0,
             'rescored': 0,
             'high_relevance': 0,
             'medium_relevance': 0,
             'low_relevance': 0
         }
 
-        for rfp in rfps:
+        # Stream RFPs a page at a time instead of loading the whole table
+        updates = []
+        pool = None
+        try:
+            for rfps in db.iter_rfps(batch=RESCORE_READ_BATCH):
+                stats['total'] += len(rfps)
+                updates += self._rescore_page(rfps, stats, ai_results, pool)
+
+                # Small tables are scored in-process; start workers once a full page shows up
+                if pool is None and len(rfps) == RESCORE_READ_BATCH:
+                    pool = ProcessPoolExecutor(max_workers=workers)
+
+                # Write scores back in large transactions rather than one commit per RFP
+                if len(updates) >= RESCORE_WRITE_BATCH:
+                    db.bulk_update_rfp_scores(updates)
+                    updates = []
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        if updates:
+            db.bulk_update_rfp_scores(updates)
+
+        return stats
+
+    def _rescore_page(self, rfps: List[Dict], stats: Dict, ai_results: Optional[Dict[int, Dict]],
+                      pool: Optional[ProcessPoolExecutor]) -> List[tuple]:
+        """Score one page of RFPs, updating stats; returns rows for db.bulk_update_rfp_scores."""
+        texts = [f"{rfp['title']} {rfp.get('description') or ''}" for rfp in rfps]
+
+        # Keyword-score the page first (in the workers, if started) so vetoed RFPs skip the rest
+        if pool is not None:
+            keyword_batches = pool.map(_score_keyword_batch,
+                                       [texts[i:i + KEYWORD_TASK_SIZE]
+                                        for i in range(0, len(texts), KEYWORD_TASK_SIZE)])
+            keyword_results = [result for batch in keyword_batches for result in batch]
+        else:
+            keyword_results = [self.keyword_scorer.analyze(text, topk=TOP_KEYWORD_MATCHES) for text in texts]
+
+        candidates = [i for i, keyword in enumerate(keyword_results) if keyword[3] is None]
+
+        # Encode the remaining RFPs for semantic scoring in one batched call
+        semantic_results = [None] * len(rfps)
+        if self.semantic_scorer and candidates:
             try:
-                result = self.score_rfp(rfp['title'], rfp.get('description'))
+                scored = self.semantic_scorer.score_texts([texts[i] for i in candidates])
+                for i, semantic in zip(candidates, scored):
+                    semantic_results[i] = semantic
+            except Exception as e:
+                logger.warning(f"Batched semantic scoring failed, scoring RFPs individually: {e}")
+
+        # Run the OpenAI requests concurrently rather than one round trip per RFP
+        page_ai_results = [None] * len(rfps)
+        if ai_results is not None:
+            page_ai_results = [ai_results.get(rfp['id']) for rfp in rfps]
+        elif self.openai_scorer and candidates:
+            scored = asyncio.run(self.openai_scorer.ascore_rfps([rfps[i] for i in candidates]))
+            for i, ai_result in zip(candidates, scored):
+                page_ai_results[i] = ai_result
+
+        updates = []
+        for rfp, keyword, semantic, ai_result in zip(rfps, keyword_results, semantic_results, page_ai_results):
+            # Applying a batch: RFPs missing from its output keep their previous score, rather than
+            # each costing a blocking real-time request
+            if ai_results is not None and ai_result is None and keyword[3] is None:
+                stats['not_in_batch'] = stats.get('not_in_batch', 0) + 1
+                continue
+
+            try:
+                result = self.score_rfp(rfp['title'], rfp.get('description'), keyword=keyword,
+                                        semantic=semantic, ai_result=ai_result)
 
-                # Update database
-                db.update_rfp(rfp['id'],
-                             relevance_score=result['final_score'],
-                             is_relevant=1 if result['is_relevant'] else 0,
-                             category=result.get('category'))
+                updates.append((result['final_score'], 1 if result['is_relevant'] else 0,
+                                result.get('category'), rfp['id']))
 
                 stats['rescored'] += 1
 
@@ -519,13 +953,44 @@ class AIRelevanceScorer:
             except Exception as e:
                 logger.error(f"Failed to rescore RFP {rfp['id']}: {e}")
 
-        return stats
+        return updates
+
+    def poll_and_apply_batch(self, batch_id: str) -> Optional[Dict]:
+        """
+        Rescore all RFPs using the results of a finished OpenAI batch.
+
+        Args:
+            batch_id: Batch ID returned by OpenAIScorer.submit_batch
+
+        Returns:
+            Scoring statistics, or None if OpenAI is unavailable or the batch hasn't completed
+        """
+        if not self.openai_scorer:
+            logger.error("OpenAI scoring is not enabled")
+            return None
+
+        ai_results = self.openai_scorer.fetch_batch_results(batch_id)
+        if ai_results is None:
+            return None
+
+        return self.rescore_all_rfps(ai_results=ai_results)
+
+
+def _score_keyword_batch(texts: List[str]) -> List[Tuple[float, List[Dict], str, Optional[float]]]:
+    """Keyword-score and categorize a batch of RFP texts (runs in a worker process)."""
+    scorer = KeywordScorer()
+    return [scorer.analyze(text, topk=TOP_KEYWORD_MATCHES) for text in texts]
+
+
+_default_scorer: Optional[AIRelevanceScorer] = None
 
 
 def score_rfp(title: str, description: str = None) -> Dict:
     """Convenience function to score an RFP."""
-    scorer = AIRelevanceScorer()
-    return scorer.score_rfp(title, description)
+    global _default_scorer
+    if _default_scorer is None:
+        _default_scorer = AIRelevanceScorer()
+    return _default_scorer.score_rfp(title, description)
 
 
 def rescore_all_rfps() -> Dict:
@@ -535,11 +1000,31 @@ def rescore_all_rfps() -> Dict:
 
 
 if __name__ == '__main__':
+    import argparse
+
     logging.basicConfig(level=logging.INFO)
 
+    parser = argparse.ArgumentParser(description='AI relevance scoring for RFPs')
+    parser.add_argument('--batch', action='store_true',
+                        help='Submit every RFP to the OpenAI Batch API for overnight rescoring')
+    parser.add_argument('--apply-batch', metavar='BATCH_ID',
+                        help='Rescore all RFPs with the results of a finished OpenAI batch')
+    args = parser.parse_args()
+
+    if args.batch or args.apply_batch:
+        scorer = AIRelevanceScorer(use_openai=True)
+        if not scorer.openai_scorer:
+            sys.exit("OpenAI scoring is not enabled (install openai and set OPENAI_API_KEY)")
+        if args.batch:
+            print(f"Submitted batch: {scorer.openai_scorer.submit_batch(db.get_all_rfps())}")
+        else:
+            print(scorer.poll_and_apply_batch(args.apply_batch) or "Batch not complete yet")
+        sys.exit(0)
+
     print("AI Relevance Scoring Test")
     print(f"OpenAI available: {OPENAI_AVAILABLE}")
     print(f"Sentence Transformers available: {SENTENCE_TRANSFORMERS_AVAILABLE}")
+    print(f"ONNX Runtime available: {ONNX_AVAILABLE}")
 
     # Test scoring
     test_cases = [
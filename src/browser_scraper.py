@@ -6,71 +6,298 @@ Install with: pip install playwright && playwright install chromium
 """
 
 import os
+import re
 import sys
+import atexit
+import signal
 import logging
 import asyncio
-from typing import List, Dict, Optional, Callable
+import functools
+import threading
+from typing import List, Dict, Optional, Callable, Tuple, Awaitable
 from datetime import datetime
 
+from dateutil import parser as date_parser
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from src.http_cache import ResponseCache
+from src.calendar_export import format_ics_date
+
 logger = logging.getLogger(__name__)
 
 # Check if Playwright is available
 try:
-    from playwright.async_api import async_playwright, Browser, Page
+    from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Locator
+    from playwright.async_api import Error as PlaywrightError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
     logger.warning("Playwright not installed. Run: pip install playwright && playwright install chromium")
 
 
+# Resource types no scraper needs; blocking them saves bandwidth and renderer memory
+BLOCKED_RESOURCE_TYPES = {'image', 'stylesheet', 'font', 'media'}
+
+# Chromium flags for long-running headless scraping: no GPU, no /dev/shm reliance
+# and no background work the scrapers don't need
+CHROMIUM_ARGS = [
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-accelerated-2d-canvas',
+    '--no-first-run',
+    '--disable-background-networking',
+    '--disable-renderer-backgrounding',
+]
+
+# Only for containers where Chromium's sandbox can't start (e.g. running as root without user
+# namespaces). Opt in with no_sandbox=True or BROWSER_NO_SANDBOX=1; the renderers then run
+# third-party portal pages unsandboxed. --no-zygote requires --no-sandbox.
+NO_SANDBOX_ARGS = ['--no-sandbox', '--no-zygote']
+
+# Resource types kept in the response cache: pages, the scripts that render them and their API calls
+CACHED_RESOURCE_TYPES = {'document', 'script', 'xhr', 'fetch'}
+
+
+# Extracts fields from list/table rows in a single in-page call (see BrowserScraper.extract_rows)
+EXTRACT_ROWS_JS = """
+(args) => [...document.querySelectorAll(args.rows)].slice(0, args.limit).map(row => {
+    const item = {};
+    for (const [name, [selector, attribute]] of Object.entries(args.fields)) {
+        const el = row.querySelector(selector);
+        item[name] = el ? (attribute ? el.getAttribute(attribute) : el.textContent) : null;
+    }
+    if (args.cells) {
+        item.cells = [...row.querySelectorAll('td')].map(td => td.textContent);
+    }
+    return item;
+})
+"""
+
+
+async def _safe_text(loc: 'Locator') -> Optional[str]:
+    """Text of the first element a locator matches, or None - in one round trip and without waiting."""
+    try:
+        return await loc.evaluate_all('els => els.length ? els[0].textContent : null')
+    except PlaywrightError:
+        return None
+
+
+async def _safe_attr(loc: 'Locator', attribute: str) -> Optional[str]:
+    """Attribute of the first element a locator matches, or None - in one round trip and without waiting."""
+    try:
+        return await loc.evaluate_all('(els, name) => els.length ? els[0].getAttribute(name) : null', attribute)
+    except PlaywrightError:
+        return None
+
+
 class BrowserScraper:
     """
     Browser-based scraper for JavaScript-rendered sites.
     Uses Playwright with Chromium for headless browsing.
     """
 
-    def __init__(self, headless: bool = True, timeout: int = 30000):
+    VIEWPORT = {'width': 1920, 'height': 1080}
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+    def __init__(self, headless: bool = True, timeout: int = 30000, per_site_context: bool = False,
+                 recycle_every: int = 50, use_cache: bool = True, no_sandbox: bool = None):
         """
         Initialize the browser scraper.
 
         Args:
             headless: Run browser in headless mode (no UI)
             timeout: Default timeout for page operations in ms
+            per_site_context: Give every page its own browser context (isolated cookies and
+                storage) instead of sharing one context across pages
+            recycle_every: Replace the shared context after this many pages, so a long-running
+                browser doesn't keep accumulating per-context state
+            use_cache: Serve repeated requests from the on-disk response cache across runs
+            no_sandbox: Disable Chromium's sandbox, for containers that can't run it
+                (defaults to the BROWSER_NO_SANDBOX environment variable)
         """
         if not PLAYWRIGHT_AVAILABLE:
             raise RuntimeError("Playwright is not installed. Run: pip install playwright && playwright install chromium")
 
         self.headless = headless
         self.timeout = timeout
+        self.per_site_context = per_site_context
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.playwright = None
+        self.recycle_every = recycle_every
+        self._pages_served = 0
+        self._retired_contexts: List[BrowserContext] = []
+        self.cache: Optional[ResponseCache] = ResponseCache() if use_cache else None
+        if no_sandbox is None:
+            no_sandbox = os.environ.get('BROWSER_NO_SANDBOX') == '1'
+        self.no_sandbox = no_sandbox
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=self.headless)
+        await self.start()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
+        await self.close()
+
+    async def start(self):
+        """Launch the browser."""
+        self.playwright = await async_playwright().start()
+        # Signals are handled by run_browser_discovery, which closes the browser on shutdown
+        self.browser = await self.playwright.chromium.launch(
+            headless=self.headless,
+            args=CHROMIUM_ARGS + NO_SANDBOX_ARGS if self.no_sandbox else CHROMIUM_ARGS,
+            chromium_sandbox=not self.no_sandbox,
+            handle_sigint=False, handle_sigterm=False
+        )
+        if not self.per_site_context:
+            self.context = await self.new_context()
+
+    async def close(self):
+        """Close the browser and stop Playwright."""
+        for context in self._retired_contexts:
+            await context.close()
+        self._retired_contexts = []
+        if self.context:
+            await self.context.close()
+            self.context = None
         if self.browser:
             await self.browser.close()
+            self.browser = None
         if self.playwright:
             await self.playwright.stop()
+            self.playwright = None
+
+    def is_alive(self) -> bool:
+        """Whether the browser is launched and still connected."""
+        return self.browser is not None and self.browser.is_connected()
+
+    async def new_context(self, storage_state: Dict = None) -> BrowserContext:
+        """Create a browser context with standard settings that skips asset downloads and uses the response cache."""
+        context = await self.browser.new_context(viewport=self.VIEWPORT, user_agent=self.USER_AGENT,
+                                                 storage_state=storage_state)
+        await context.route('**/*', self._route)
+        return context
+
+    async def _recycle_context(self):
+        """
+        Every `recycle_every` pages, move new pages to a fresh context carrying over cookies
+        and storage. The old context is closed once the pages still open in it are done.
+        """
+        self._pages_served += 1
+        if self._pages_served % self.recycle_every == 0:
+            state = await self.context.storage_state()
+            self._retired_contexts.append(self.context)
+            self.context = await self.new_context(storage_state=state)
+
+        for context in [c for c in self._retired_contexts if not c.pages]:
+            self._retired_contexts.remove(context)
+            await context.close()
+
+    async def _route(self, route):
+        """
+        Abort requests for resources the scrapers never read, and answer cacheable GETs
+        from the response cache, revalidating stale entries that carry an ETag or Last-Modified.
+        """
+        request = route.request
+        if request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+            return
+        if self.cache is None or request.method != 'GET' or request.resource_type not in CACHED_RESOURCE_TYPES:
+            await route.continue_()
+            return
+
+        entry = self.cache.get(request.url)
+        if entry and self.cache.is_fresh(entry):
+            await route.fulfill(status=entry['status'], headers=entry['headers'], body=entry['body'])
+            return
+
+        headers = dict(request.headers)
+        if entry:
+            if entry['headers'].get('etag'):
+                headers['if-none-match'] = entry['headers']['etag']
+            if entry['headers'].get('last-modified'):
+                headers['if-modified-since'] = entry['headers']['last-modified']
+
+        try:
+            response = await route.fetch(headers=headers)
+        except Exception as e:
+            logger.debug(f"Fetch failed for {request.url}: {e}")
+            await route.abort()
+            return
+
+        if response.status == 304 and entry:
+            self.cache.touch(request.url, response.headers)
+            await route.fulfill(status=entry['status'], headers=entry['headers'], body=entry['body'])
+            return
+        if response.status == 200:
+            self.cache.store(request.url, response.status, response.headers, await response.body())
+        await route.fulfill(response=response)
 
     async def get_page(self) -> Page:
-        """Create a new page with standard settings."""
-        context = await self.browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        )
+        """Create a new page with standard settings, in the shared context unless per_site_context is set."""
+        if self.context:
+            await self._recycle_context()
+        context = self.context or await self.new_context()
         page = await context.new_page()
         page.set_default_timeout(self.timeout)
         return page
 
+    async def extract_rows(self, page: Page, row_selector: str, fields: Dict[str, Tuple[str, Optional[str]]],
+                           limit: int, cells: bool = False) -> List[Dict]:
+        """
+        Extract fields from the first `limit` rows of a list or table.
+        Runs as one script inside the page instead of several browser round trips per row;
+        selectors that aren't plain CSS (e.g. Playwright's text=) fall back to locators.
+
+        Args:
+            page: Loaded page
+            row_selector: Selector matching each row
+            fields: Field name -> (selector within the row, attribute to read or None for text)
+            limit: Maximum rows to extract
+            cells: Also return the text of every <td> in the row as 'cells'
+
+        Returns:
+            One dict per row with each field (None when the selector doesn't match)
+        """
+        try:
+            return await page.evaluate(EXTRACT_ROWS_JS, {
+                'rows': row_selector, 'fields': fields, 'limit': limit, 'cells': cells
+            })
+        except Exception as e:
+            logger.debug(f"In-page extraction failed for '{row_selector}', using locators: {e}")
+            return await self._extract_rows_with_locators(page, row_selector, fields, limit, cells)
+
+    async def _extract_rows_with_locators(self, page: Page, row_selector: str,
+                                          fields: Dict[str, Tuple[str, Optional[str]]],
+                                          limit: int, cells: bool = False) -> List[Dict]:
+        """Row extraction through Playwright locators, one element at a time."""
+        rows = page.locator(row_selector)
+        count = await rows.count()
+
+        extracted = []
+        for i in range(min(count, limit)):
+            try:
+                row = rows.nth(i)
+
+                item = {}
+                for name, (selector, attribute) in fields.items():
+                    el = row.locator(selector)
+                    item[name] = await _safe_attr(el, attribute) if attribute else await _safe_text(el)
+
+                if cells:
+                    item['cells'] = await row.locator('td').all_text_contents()
+
+                extracted.append(item)
+            except Exception as e:
+                logger.debug(f"Error extracting row {i}: {e}")
+                continue
+
+        return extracted
+
     async def fetch_page_content(self, url: str, wait_for: str = None) -> str:
         """
         Fetch page content after JavaScript rendering.
@@ -84,10 +311,13 @@ class BrowserScraper:
         """
         page = await self.get_page()
         try:
-            await page.goto(url, wait_until='networkidle')
+            await page.goto(url, wait_until='domcontentloaded')
 
+            # Wait for the content we need rather than for the network to go quiet
             if wait_for:
                 await page.wait_for_selector(wait_for, timeout=self.timeout)
+            else:
+                await page.wait_for_load_state('load')
 
             content = await page.content()
             return content
@@ -109,7 +339,7 @@ class BrowserScraper:
 
         try:
             # Go to DemandStar bid search
-            await page.goto('https://www.demandstar.com/app/bids', wait_until='networkidle')
+            await page.goto('https://www.demandstar.com/app/bids', wait_until='domcontentloaded')
 
             # Wait for the bid list to load
             await page.wait_for_selector('[data-testid="bid-list"]', timeout=15000)
@@ -118,42 +348,36 @@ class BrowserScraper:
             try:
                 state_filter = page.locator('text=Florida')
                 if await state_filter.count() > 0:
-                    await state_filter.first.click()
-                    await page.wait_for_load_state('networkidle')
+                    # Wait for the request that fetches the filtered bids, then for the rows it renders
+                    async with page.expect_response(lambda r: '/bids' in r.url and r.status == 200,
+                                                    timeout=15000):
+                        await state_filter.first.click()
+                    await page.wait_for_selector('[data-testid="bid-item"]', state='visible', timeout=5000)
             except Exception:
                 pass
 
             # Get bid items
-            bid_items = page.locator('[data-testid="bid-item"], .bid-list-item, .opportunity-card')
-            count = await bid_items.count()
-
-            for i in range(min(count, 50)):  # Limit to 50 items
-                try:
-                    item = bid_items.nth(i)
-
-                    title_el = item.locator('h2, h3, .bid-title, .opportunity-title').first
-                    title = await title_el.text_content() if await title_el.count() > 0 else None
-
-                    agency_el = item.locator('.agency, .organization, .buyer-name').first
-                    agency = await agency_el.text_content() if await agency_el.count() > 0 else None
-
-                    date_el = item.locator('.due-date, .close-date, [data-testid="due-date"]').first
-                    due_date = await date_el.text_content() if await date_el.count() > 0 else None
-
-                    link_el = item.locator('a').first
-                    url = await link_el.get_attribute('href') if await link_el.count() > 0 else None
-
-                    if title:
-                        rfps.append({
-                            'title': title.strip(),
-                            'agency': agency.strip() if agency else None,
-                            'due_date': due_date.strip() if due_date else None,
-                            'source_url': f"https://www.demandstar.com{url}" if url and not url.startswith('http') else url,
-                            'source_portal': 'demandstar'
-                        })
-                except Exception as e:
-                    logger.debug(f"Error extracting bid item {i}: {e}")
-                    continue
+            items = await self.extract_rows(
+                page, '[data-testid="bid-item"], .bid-list-item, .opportunity-card',
+                {
+                    'title': ('h2, h3, .bid-title, .opportunity-title', None),
+                    'agency': ('.agency, .organization, .buyer-name', None),
+                    'due_date': ('.due-date, .close-date, [data-testid="due-date"]', None),
+                    'url': ('a', 'href'),
+                },
+                limit=50
+            )
+
+            for item in items:
+                title, agency, due_date, url = item['title'], item['agency'], item['due_date'], item['url']
+                if title:
+                    rfps.append({
+                        'title': title.strip(),
+                        'agency': agency.strip() if agency else None,
+                        'due_date': due_date.strip() if due_date else None,
+                        'source_url': f"https://www.demandstar.com{url}" if url and not url.startswith('http') else url,
+                        'source_portal': 'demandstar'
+                    })
 
         except Exception as e:
             logger.error(f"Error scraping DemandStar: {e}")
@@ -176,38 +400,31 @@ class BrowserScraper:
         page = await self.get_page()
 
         try:
-            await page.goto(f"{portal_url}/opportunities", wait_until='networkidle')
+            await page.goto(f"{portal_url}/opportunities", wait_until='domcontentloaded')
 
             # Wait for opportunities to load
             await page.wait_for_selector('.opportunity-card, .opportunity-list-item', timeout=15000)
 
             # Get opportunity items
-            items = page.locator('.opportunity-card, .opportunity-list-item')
-            count = await items.count()
-
-            for i in range(min(count, 50)):
-                try:
-                    item = items.nth(i)
-
-                    title_el = item.locator('.opportunity-title, h2, h3').first
-                    title = await title_el.text_content() if await title_el.count() > 0 else None
-
-                    date_el = item.locator('.close-date, .due-date').first
-                    due_date = await date_el.text_content() if await date_el.count() > 0 else None
-
-                    link_el = item.locator('a').first
-                    url = await link_el.get_attribute('href') if await link_el.count() > 0 else None
-
-                    if title:
-                        rfps.append({
-                            'title': title.strip(),
-                            'due_date': due_date.strip() if due_date else None,
-                            'source_url': url if url and url.startswith('http') else f"{portal_url}{url}",
-                            'source_portal': 'bonfire'
-                        })
-                except Exception as e:
-                    logger.debug(f"Error extracting opportunity {i}: {e}")
-                    continue
+            items = await self.extract_rows(
+                page, '.opportunity-card, .opportunity-list-item',
+                {
+                    'title': ('.opportunity-title, h2, h3', None),
+                    'due_date': ('.close-date, .due-date', None),
+                    'url': ('a', 'href'),
+                },
+                limit=50
+            )
+
+            for item in items:
+                title, due_date, url = item['title'], item['due_date'], item['url']
+                if title:
+                    rfps.append({
+                        'title': title.strip(),
+                        'due_date': due_date.strip() if due_date else None,
+                        'source_url': url if url and url.startswith('http') else f"{portal_url}{url}",
+                        'source_portal': 'bonfire'
+                    })
 
         except Exception as e:
             logger.error(f"Error scraping Bonfire portal: {e}")
@@ -231,37 +448,26 @@ class BrowserScraper:
 
         try:
             # IonWave typically has a bid board
-            await page.goto(f"{portal_url}/BidBoard", wait_until='networkidle')
+            await page.goto(f"{portal_url}/BidBoard", wait_until='domcontentloaded')
 
             # Wait for bid table
             await page.wait_for_selector('table, .bid-list, .solicitation-list', timeout=15000)
 
             # Get table rows
-            rows = page.locator('table tbody tr, .bid-item, .solicitation-item')
-            count = await rows.count()
-
-            for i in range(min(count, 50)):
-                try:
-                    row = rows.nth(i)
-
-                    cells = row.locator('td')
-                    if await cells.count() >= 3:
-                        title = await cells.nth(0).text_content()
-                        due_date = await cells.nth(2).text_content() if await cells.count() > 2 else None
-
-                        link_el = row.locator('a').first
-                        url = await link_el.get_attribute('href') if await link_el.count() > 0 else None
-
-                        if title:
-                            rfps.append({
-                                'title': title.strip(),
-                                'due_date': due_date.strip() if due_date else None,
-                                'source_url': url,
-                                'source_portal': 'ionwave'
-                            })
-                except Exception as e:
-                    logger.debug(f"Error extracting row {i}: {e}")
-                    continue
+            rows = await self.extract_rows(page, 'table tbody tr, .bid-item, .solicitation-item',
+                                           {'url': ('a', 'href')}, limit=50, cells=True)
+
+            for row in rows:
+                cells = row['cells']
+                if len(cells) >= 3:
+                    title, due_date = cells[0], cells[2]
+                    if title:
+                        rfps.append({
+                            'title': title.strip(),
+                            'due_date': due_date.strip() if due_date else None,
+                            'source_url': row['url'],
+                            'source_portal': 'ionwave'
+                        })
 
         except Exception as e:
             logger.error(f"Error scraping IonWave portal: {e}")
@@ -286,41 +492,50 @@ class BrowserScraper:
         Returns:
             List of RFP dictionaries
         """
-        rfps = []
-        page = await self.get_page()
+        return await compile_scraper(config)(self, url)
 
-        try:
-            await page.goto(url, wait_until='networkidle')
 
-            if config.get('wait_selector'):
-                await page.wait_for_selector(config['wait_selector'], timeout=15000)
+def compile_scraper(config: Dict) -> Callable[[BrowserScraper, str], Awaitable[List[Dict]]]:
+    """
+    Build a generic table scraper with a site's selectors resolved once, taking (scraper, url).
+    Scrapers are memoized per config, so a site configured the same way every run reuses its own.
+    """
+    return _compile_scraper(tuple(sorted(config.items())))
 
-            rows = page.locator(config.get('row_selector', 'table tbody tr'))
-            count = await rows.count()
 
-            for i in range(min(count, 100)):
-                try:
-                    row = rows.nth(i)
+@functools.lru_cache(maxsize=64)
+def _compile_scraper(config_items: Tuple) -> Callable[[BrowserScraper, str], Awaitable[List[Dict]]]:
+    config = dict(config_items)
 
-                    title_el = row.locator(config.get('title_selector', 'td:first-child')).first
-                    title = await title_el.text_content() if await title_el.count() > 0 else None
+    # Without an explicit wait selector, wait for the first row instead
+    row_selector = config.get('row_selector', 'table tbody tr')
+    wait_selector = config.get('wait_selector') or row_selector
+    fields = {
+        'title': (config.get('title_selector', 'td:first-child'), None),
+        'due_date': (config.get('date_selector', 'td:nth-child(3)'), None),
+        'url': (config.get('link_selector', 'a'), 'href'),
+    }
+    portal_name = config.get('portal_name', 'generic')
+
+    async def scrape(scraper: BrowserScraper, url: str) -> List[Dict]:
+        rfps = []
+        page = await scraper.get_page()
 
-                    date_el = row.locator(config.get('date_selector', 'td:nth-child(3)')).first
-                    due_date = await date_el.text_content() if await date_el.count() > 0 else None
+        try:
+            await page.goto(url, wait_until='domcontentloaded')
+            await page.wait_for_selector(wait_selector, timeout=15000)
 
-                    link_el = row.locator(config.get('link_selector', 'a')).first
-                    link_url = await link_el.get_attribute('href') if await link_el.count() > 0 else None
+            rows = await scraper.extract_rows(page, row_selector, fields, limit=100)
 
-                    if title and title.strip():
-                        rfps.append({
-                            'title': title.strip(),
-                            'due_date': due_date.strip() if due_date else None,
-                            'source_url': link_url,
-                            'source_portal': config.get('portal_name', 'generic')
-                        })
-                except Exception as e:
-                    logger.debug(f"Error extracting row {i}: {e}")
-                    continue
+            for row in rows:
+                title, due_date = row['title'], row['due_date']
+                if title and title.strip():
+                    rfps.append({
+                        'title': title.strip(),
+                        'due_date': due_date.strip() if due_date else None,
+                        'source_url': row['url'],
+                        'source_portal': portal_name
+                    })
 
         except Exception as e:
             logger.error(f"Error scraping {url}: {e}")
@@ -329,16 +544,71 @@ class BrowserScraper:
 
         return rfps
 
+    return scrape
+
+
+class _BrowserPool:
+    """
+    Launched browsers kept between discovery runs, so repeated runs
+    (e.g. scheduler ticks) skip the Chromium start-up.
+    """
+
+    def __init__(self, max_size: int = 2):
+        self.max_size = max_size
+        self.idle: List[BrowserScraper] = []
+        self.lock = asyncio.Lock()
+
+    async def acquire(self) -> BrowserScraper:
+        """Take an idle browser that is still connected, or launch a new one."""
+        async with self.lock:
+            while self.idle:
+                scraper = self.idle.pop()
+                if scraper.is_alive():
+                    return scraper
+                await self._close_quietly(scraper)
+
+        scraper = BrowserScraper(headless=True)
+        await scraper.start()
+        return scraper
+
+    async def release(self, scraper: BrowserScraper):
+        """Return a browser to the pool, closing it if the pool is full or it has died."""
+        async with self.lock:
+            if scraper.is_alive() and len(self.idle) < self.max_size:
+                self.idle.append(scraper)
+                return
+        await self._close_quietly(scraper)
+
+    async def close(self):
+        """Close every idle browser."""
+        async with self.lock:
+            idle, self.idle = self.idle, []
+        for scraper in idle:
+            await self._close_quietly(scraper)
+
+    @staticmethod
+    async def _close_quietly(scraper: BrowserScraper):
+        try:
+            await scraper.close()
+        except Exception as e:
+            logger.debug(f"Error closing browser: {e}")
+
 
-async def run_browser_discovery(sites: List[Dict] = None) -> Dict:
+async def run_browser_discovery(sites: List[Dict] = None, max_concurrency: int = 5,
+                                pool: _BrowserPool = None, use_cache: bool = True) -> Dict:
     """
     Run browser-based discovery on configured sites.
+    Sites are scraped concurrently, each on its own page of one shared browser.
 
     Args:
         sites: List of site configurations. Each should have:
             - url: Site URL
             - type: 'demandstar', 'bonfire', 'ionwave', or 'generic'
             - config: Additional config for generic scraper
+        max_concurrency: Maximum number of sites scraped at once
+        pool: Browser pool to borrow a running browser from, instead of launching one for this run
+        use_cache: Serve repeated requests from the on-disk response cache (ignored with a pool,
+            whose browsers keep their own setting)
 
     Returns:
         Discovery statistics
@@ -354,27 +624,64 @@ async def run_browser_discovery(sites: List[Dict] = None) -> Dict:
 
     sites = sites or default_sites
     all_rfps = []
+    semaphore = asyncio.Semaphore(max_concurrency)
 
-    async with BrowserScraper(headless=True) as scraper:
-        for site in sites:
+    # Chromium is launched without Playwright's own signal handlers, so cancel the run on
+    # SIGINT/SIGTERM and let the browser close on the way out
+    loop = asyncio.get_running_loop()
+    handled_signals = []
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, asyncio.current_task().cancel)
+            handled_signals.append(sig)
+        except (NotImplementedError, RuntimeError, ValueError):
+            # Windows, or not running in the main thread
+            pass
+
+    async def scrape_site(scraper: BrowserScraper, site: Dict) -> List[Dict]:
+        async with semaphore:
+            site_type = site.get('type', 'generic')
+
+            if site_type == 'demandstar':
+                rfps = await scraper.scrape_demandstar()
+            elif site_type == 'bonfire':
+                rfps = await scraper.scrape_bonfire(site['url'])
+            elif site_type == 'ionwave':
+                rfps = await scraper.scrape_ionwave(site['url'])
+            else:
+                rfps = await compile_scraper(site.get('config', {}))(scraper, site['url'])
+
+            logger.info(f"Found {len(rfps)} RFPs from {site.get('url', site_type)}")
+            return rfps
+
+    try:
+        if pool is not None:
+            scraper = await pool.acquire()
             try:
-                site_type = site.get('type', 'generic')
-
-                if site_type == 'demandstar':
-                    rfps = await scraper.scrape_demandstar()
-                elif site_type == 'bonfire':
-                    rfps = await scraper.scrape_bonfire(site['url'])
-                elif site_type == 'ionwave':
-                    rfps = await scraper.scrape_ionwave(site['url'])
-                else:
-                    rfps = await scraper.scrape_generic_table(site['url'], site.get('config', {}))
-
-                all_rfps.extend(rfps)
-                logger.info(f"Found {len(rfps)} RFPs from {site.get('url', site_type)}")
-
-            except Exception as e:
-                logger.error(f"Error processing site {site}: {e}")
+                results = await asyncio.gather(*(scrape_site(scraper, site) for site in sites), return_exceptions=True)
+            finally:
+                await pool.release(scraper)
+        else:
+            async with BrowserScraper(headless=True, use_cache=use_cache) as scraper:
+                results = await asyncio.gather(*(scrape_site(scraper, site) for site in sites), return_exceptions=True)
+    finally:
+        for sig in handled_signals:
+            loop.remove_signal_handler(sig)
+
+    # The same bid is often listed on several portals (e.g. DemandStar mirrors county bids).
+    # Only some portals name the agency, so it tells listings apart only when both have one.
+    seen: Dict[Tuple[str, Optional[str]], set] = {}
+    for site, rfps in zip(sites, results):
+        if isinstance(rfps, Exception):
+            logger.error(f"Error processing site {site}: {rfps}")
+            continue
+        for rfp in rfps:
+            agencies = seen.setdefault(_listing_key(rfp), set())
+            agency = (rfp.get('agency') or '').strip().lower() or None
+            if agencies and (agency is None or None in agencies or agency in agencies):
                 continue
+            agencies.add(agency)
+            all_rfps.append(rfp)
 
     return {
         'found': len(all_rfps),
@@ -382,19 +689,80 @@ async def run_browser_discovery(sites: List[Dict] = None) -> Dict:
     }
 
 
+def _listing_key(rfp: Dict) -> Tuple[str, Optional[str]]:
+    """
+    Identify a bid across portals: its title with case, punctuation and spacing ignored,
+    plus its due date parsed to YYYYMMDD (None if the portal's text isn't a date).
+    """
+    title = ' '.join(re.findall(r'\w+', rfp['title'].lower()))[:80]
+    due_date = rfp.get('due_date') or ''
+    parsed = format_ics_date(due_date)
+    if parsed is None and due_date:
+        try:
+            parsed = date_parser.parse(due_date, fuzzy=True, ignoretz=True).strftime('%Y%m%d')
+        except (ValueError, OverflowError):
+            pass
+    return title, parsed
+
+
+# Event loop (run on a background thread) and browser pool shared by every sync_browser_discovery call
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_browser_pool: Optional[_BrowserPool] = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Start the background event loop and browser pool on first use."""
+    global _loop, _browser_pool
+
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name='browser-discovery', daemon=True).start()
+            _browser_pool = _BrowserPool(max_size=2)
+            atexit.register(_close_browser_pool)
+        return _loop
+
+
+def _close_browser_pool():
+    """Close pooled browsers and stop the background loop at interpreter exit."""
+    if _loop is not None and _loop.is_running():
+        try:
+            asyncio.run_coroutine_threadsafe(_browser_pool.close(), _loop).result(timeout=30)
+        except Exception as e:
+            logger.debug(f"Error closing browser pool: {e}")
+        _loop.call_soon_threadsafe(_loop.stop)
+
+
 def sync_browser_discovery(sites: List[Dict] = None) -> Dict:
-    """Synchronous wrapper for browser discovery."""
-    return asyncio.run(run_browser_discovery(sites))
+    """
+    Synchronous wrapper for browser discovery.
+    Runs on a persistent background event loop with a warm browser pool, so only the first
+    call launches Chromium and calls from several threads can overlap.
+    """
+    loop = _get_loop()
+    future = asyncio.run_coroutine_threadsafe(run_browser_discovery(sites, pool=_browser_pool), loop)
+    return future.result()
 
 
 if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Test browser-based scraping')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Fetch everything from the network instead of the response cache')
+    args = parser.parse_args()
+
     logging.basicConfig(level=logging.INFO)
 
     print("Testing browser-based scraping...")
     print(f"Playwright available: {PLAYWRIGHT_AVAILABLE}")
 
     if PLAYWRIGHT_AVAILABLE:
-        results = sync_browser_discovery()
+        if args.no_cache:
+            results = asyncio.run(run_browser_discovery(use_cache=False))
+        else:
+            results = sync_browser_discovery()
         print(f"\nFound {results['found']} RFPs")
         for rfp in results.get('rfps', [])[:5]:
             print(f"  - {rfp['title'][:60]}...")
@@ -5,14 +5,26 @@ Generates ICS files for importing into calendar applications.
 
 import os
 import sys
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from datetime import datetime, date, timedelta
+from typing import List, Dict, Optional, Iterable, Iterator, Union
 import uuid
+import itertools
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src import database as db
+from src.http_cache import TTLCache
+
+# Characters RFC 5545 requires escaping in TEXT values; bare carriage returns are dropped
+_ICS_TRANS = str.maketrans({'\\': '\\\\', '\n': '\\n', ',': '\\,', ';': '\\;', '\r': None})
+
+# Maximum length of a content line before it must be folded
+ICS_LINE_OCTETS = 75
+
+# RFP lists per (status, relevant_only), so repeated exports don't re-query; kept short since
+# discovery can add RFPs from another process without calling clear_cache()
+_rfps_cache = TTLCache(maxsize=8, ttl=60)
 
 
 def generate_uid() -> str:
@@ -21,14 +33,8 @@ def generate_uid() -> str:
 
 
 def escape_ics_text(text: str) -> str:
-    """Escape special characters for ICS format."""
-    if not text:
-        return ""
-    text = text.replace('\\', '\\\\')
-    text = text.replace('\n', '\\n')
-    text = text.replace(',', '\\,')
-    text = text.replace(';', '\\;')
-    return text
+    """Escape special characters for ICS format, in a single pass."""
+    return text.translate(_ICS_TRANS) if text else ""
 
 
 def format_ics_datetime(dt: datetime) -> str:
@@ -39,14 +45,49 @@ def format_ics_datetime(dt: datetime) -> str:
 def format_ics_date(date_str: str) -> str:
     """Format date string for ICS file (all-day event)."""
     try:
-        dt = datetime.strptime(date_str[:10], '%Y-%m-%d')
-        return dt.strftime('%Y%m%d')
-    except (ValueError, TypeError):
+        d = date.fromisoformat(date_str[:10])
+    except ValueError:
+        # Unpadded dates like 2026-1-5 aren't ISO but were always accepted
+        try:
+            d = datetime.strptime(date_str[:10], '%Y-%m-%d')
+        except ValueError:
+            return None
+    except TypeError:
         return None
-
-
-def create_rfp_event(rfp: Dict, reminder_hours: int = 24) -> str:
-    """Create an ICS event for an RFP deadline."""
+    return f"{d.year:04d}{d.month:02d}{d.day:02d}"
+
+
+def fold_ics_line(line: str) -> str:
+    """Fold a content line at 75 octets, continuing on lines that start with a space (RFC 5545 3.1)."""
+    data = line.encode('utf-8')
+    if len(data) <= ICS_LINE_OCTETS:
+        return line
+
+    parts = []
+    start, width = 0, ICS_LINE_OCTETS
+    while len(data) - start > width:
+        end = start + width
+        # Never split inside a multi-byte UTF-8 character
+        while data[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(data[start:end].decode('utf-8'))
+        # Continuation lines lose one octet to the leading space
+        start, width = end, ICS_LINE_OCTETS - 1
+    parts.append(data[start:].decode('utf-8'))
+    return '\r\n '.join(parts)
+
+
+def create_rfp_event(rfp: Dict, reminder_hours: int = 24, uid: str = None,
+                     now: str = None) -> Optional[List[str]]:
+    """
+    Create the content lines of an ICS event for an RFP deadline.
+
+    Args:
+        rfp: RFP row
+        reminder_hours: Hours before the deadline to show a reminder
+        uid: Event UID; a random one is generated if not given
+        now: DTSTAMP value shared by a batch of events; the current time if not given
+    """
     if not rfp.get('due_date'):
         return None
 
@@ -54,8 +95,8 @@ def create_rfp_event(rfp: Dict, reminder_hours: int = 24) -> str:
     if not due_date:
         return None
 
-    uid = generate_uid()
-    now = format_ics_datetime(datetime.utcnow())
+    uid = uid or generate_uid()
+    now = now or format_ics_datetime(datetime.utcnow())
     title = escape_ics_text(f"RFP Due: {rfp['title'][:80]}")
 
     description_parts = []
@@ -68,38 +109,39 @@ def create_rfp_event(rfp: Dict, reminder_hours: int = 24) -> str:
     if rfp.get('source_url'):
         description_parts.append(f"URL: {rfp['source_url']}")
     if rfp.get('description'):
-        description_parts.append(f"\\n{rfp['description'][:500]}")
+        description_parts.append(f"\n{rfp['description'][:500]}")
 
-    description = escape_ics_text("\\n".join(description_parts))
+    # Real newlines here; escape_ics_text turns them into \n
+    description = escape_ics_text("\n".join(description_parts))
 
     location = escape_ics_text(rfp.get('entity_name', ''))
 
     # Calculate alarm time (default 24 hours before)
     alarm_trigger = f"-PT{reminder_hours}H"
 
-    event = f"""BEGIN:VEVENT
-UID:{uid}
-DTSTAMP:{now}
-DTSTART;VALUE=DATE:{due_date}
-DTEND;VALUE=DATE:{due_date}
-SUMMARY:{title}
-DESCRIPTION:{description}
-LOCATION:{location}
-STATUS:CONFIRMED
-CATEGORIES:RFP,Procurement
-PRIORITY:5
-BEGIN:VALARM
-ACTION:DISPLAY
-DESCRIPTION:RFP deadline reminder
-TRIGGER:{alarm_trigger}
-END:VALARM
-END:VEVENT"""
-
-    return event
-
-
-def create_bid_event(bid: Dict) -> str:
-    """Create an ICS event for a bid submission."""
+    return [
+        "BEGIN:VEVENT",
+        f"UID:{uid}",
+        f"DTSTAMP:{now}",
+        f"DTSTART;VALUE=DATE:{due_date}",
+        f"DTEND;VALUE=DATE:{due_date}",
+        f"SUMMARY:{title}",
+        f"DESCRIPTION:{description}",
+        f"LOCATION:{location}",
+        "STATUS:CONFIRMED",
+        "CATEGORIES:RFP,Procurement",
+        "PRIORITY:5",
+        "BEGIN:VALARM",
+        "ACTION:DISPLAY",
+        "DESCRIPTION:RFP deadline reminder",
+        f"TRIGGER:{alarm_trigger}",
+        "END:VALARM",
+        "END:VEVENT",
+    ]
+
+
+def create_bid_event(bid: Dict, uid: str = None, now: str = None) -> Optional[List[str]]:
+    """Create the content lines of an ICS event for a bid submission (uid/now as in create_rfp_event)."""
     if not bid.get('due_date'):
         return None
 
@@ -107,8 +149,8 @@ def create_bid_event(bid: Dict) -> str:
     if not due_date:
         return None
 
-    uid = generate_uid()
-    now = format_ics_datetime(datetime.utcnow())
+    uid = uid or generate_uid()
+    now = now or format_ics_datetime(datetime.utcnow())
 
     status_text = bid.get('status', 'pending').replace('_', ' ').title()
     title = escape_ics_text(f"[{status_text}] {bid.get('rfp_title', 'Bid')[:60]}")
@@ -123,80 +165,105 @@ def create_bid_event(bid: Dict) -> str:
     if bid.get('notes'):
         description_parts.append(f"Notes: {bid['notes'][:300]}")
 
-    description = escape_ics_text("\\n".join(description_parts))
-
-    event = f"""BEGIN:VEVENT
-UID:{uid}
-DTSTAMP:{now}
-DTSTART;VALUE=DATE:{due_date}
-DTEND;VALUE=DATE:{due_date}
-SUMMARY:{title}
-DESCRIPTION:{description}
-STATUS:CONFIRMED
-CATEGORIES:Bid,Proposal
-PRIORITY:3
-BEGIN:VALARM
-ACTION:DISPLAY
-DESCRIPTION:Bid deadline reminder
-TRIGGER:-PT48H
-END:VALARM
-BEGIN:VALARM
-ACTION:DISPLAY
-DESCRIPTION:Bid deadline - 24 hours remaining
-TRIGGER:-PT24H
-END:VALARM
-END:VEVENT"""
-
-    return event
+    description = escape_ics_text("\n".join(description_parts))
+
+    return [
+        "BEGIN:VEVENT",
+        f"UID:{uid}",
+        f"DTSTAMP:{now}",
+        f"DTSTART;VALUE=DATE:{due_date}",
+        f"DTEND;VALUE=DATE:{due_date}",
+        f"SUMMARY:{title}",
+        f"DESCRIPTION:{description}",
+        "STATUS:CONFIRMED",
+        "CATEGORIES:Bid,Proposal",
+        "PRIORITY:3",
+        "BEGIN:VALARM",
+        "ACTION:DISPLAY",
+        "DESCRIPTION:Bid deadline reminder",
+        "TRIGGER:-PT48H",
+        "END:VALARM",
+        "BEGIN:VALARM",
+        "ACTION:DISPLAY",
+        "DESCRIPTION:Bid deadline - 24 hours remaining",
+        "TRIGGER:-PT24H",
+        "END:VALARM",
+        "END:VEVENT",
+    ]
+
+
+def _iter_calendar(product: str, calendar_name: str, events: Iterable[Optional[List[str]]]) -> Iterator[str]:
+    """
+    Yield a VCALENDAR one event at a time, folded and CRLF-terminated as RFC 5545 requires,
+    so only one event's lines are held in memory.
+    """
+    header = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:-//Procurement Intel//{product}//EN",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{escape_ics_text(calendar_name)}",
+        "X-WR-TIMEZONE:America/New_York",
+    ]
+    yield "".join(fold_ics_line(line) + "\r\n" for line in header)
+
+    for lines in events:
+        if lines:
+            yield "".join(fold_ics_line(line) + "\r\n" for line in lines)
+
+    yield "END:VCALENDAR\r\n"
+
+
+def _batch_uids() -> Iterator[str]:
+    """Event UIDs for one calendar: a single random prefix plus a counter, instead of a uuid4 per event."""
+    batch = uuid.uuid4().hex
+    return (f"{batch}-{i}@procurement-intel" for i in itertools.count())
+
+
+def iter_rfp_calendar(rfps: Iterable[Dict], calendar_name: str = "RFP Deadlines") -> Iterator[str]:
+    """Stream an ICS calendar for RFP deadlines, one chunk per event."""
+    now = format_ics_datetime(datetime.utcnow())
+    events = (create_rfp_event(rfp, uid=uid, now=now) for rfp, uid in zip(rfps, _batch_uids()))
+    return _iter_calendar("RFP Calendar", calendar_name, events)
 
 
-def generate_rfp_calendar(rfps: List[Dict], calendar_name: str = "RFP Deadlines") -> str:
-    """Generate a complete ICS calendar for RFP deadlines."""
-    events = []
-    for rfp in rfps:
-        event = create_rfp_event(rfp)
-        if event:
-            events.append(event)
+def iter_bid_calendar(bids: Iterable[Dict], calendar_name: str = "Bid Deadlines") -> Iterator[str]:
+    """Stream an ICS calendar for bid deadlines, one chunk per event."""
+    now = format_ics_datetime(datetime.utcnow())
+    events = (create_bid_event(bid, uid=uid, now=now) for bid, uid in zip(bids, _batch_uids()))
+    return _iter_calendar("Bid Calendar", calendar_name, events)
 
-    calendar = f"""BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//Procurement Intel//RFP Calendar//EN
-CALSCALE:GREGORIAN
-METHOD:PUBLISH
-X-WR-CALNAME:{escape_ics_text(calendar_name)}
-X-WR-TIMEZONE:America/New_York
-{chr(10).join(events)}
-END:VCALENDAR"""
 
-    return calendar
+def generate_rfp_calendar(rfps: List[Dict], calendar_name: str = "RFP Deadlines") -> str:
+    """Generate a complete ICS calendar for RFP deadlines."""
+    return "".join(iter_rfp_calendar(rfps, calendar_name))
 
 
 def generate_bid_calendar(bids: List[Dict], calendar_name: str = "Bid Deadlines") -> str:
     """Generate a complete ICS calendar for bid deadlines."""
-    events = []
-    for bid in bids:
-        event = create_bid_event(bid)
-        if event:
-            events.append(event)
+    return "".join(iter_bid_calendar(bids, calendar_name))
 
-    calendar = f"""BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//Procurement Intel//Bid Calendar//EN
-CALSCALE:GREGORIAN
-METHOD:PUBLISH
-X-WR-CALNAME:{escape_ics_text(calendar_name)}
-X-WR-TIMEZONE:America/New_York
-{chr(10).join(events)}
-END:VCALENDAR"""
 
-    return calendar
+def _get_rfps_cached(status: Optional[str], relevant_only: bool) -> List[Dict]:
+    """RFPs for an export, reused across exports with the same filters for a short while."""
+    key = (status, relevant_only)
+    rfps = _rfps_cache.get(key)
+    if rfps is None:
+        rfps = db.get_all_rfps(status=status, relevant_only=relevant_only)
+        _rfps_cache.set(key, rfps)
+    return rfps
+
+
+def clear_cache():
+    """Forget cached RFP lists; call after RFPs are added or changed."""
+    _rfps_cache.clear()
 
 
 def export_rfp_deadlines(relevant_only: bool = True,
                           status: str = 'open') -> str:
     """Export all RFP deadlines to ICS format."""
-    rfps = db.get_all_rfps(status=status, relevant_only=relevant_only)
-    return generate_rfp_calendar(rfps)
+    return generate_rfp_calendar(_get_rfps_cached(status, relevant_only))
 
 
 def export_bid_deadlines(status: str = None) -> str:
@@ -213,14 +280,23 @@ def export_single_rfp(rfp_id: int) -> str:
     return generate_rfp_calendar([rfp], f"RFP: {rfp['title'][:50]}")
 
 
-def save_calendar_file(content: str, filename: str) -> str:
-    """Save calendar content to a file."""
+def export_rfps_bulk(rfp_ids: List[int], calendar_name: str = "RFP Deadlines") -> str:
+    """Export several RFP deadlines to one ICS calendar, fetched in a single query."""
+    return generate_rfp_calendar(db.get_rfps_by_ids(rfp_ids), calendar_name)
+
+
+def save_calendar_file(content: Union[str, Iterable[str]], filename: str) -> str:
+    """Save calendar content to a file, either a whole string or chunks from iter_*_calendar."""
     data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'calendars')
     os.makedirs(data_dir, exist_ok=True)
 
     filepath = os.path.join(data_dir, filename)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
+    # newline='' keeps the CRLF line endings as they are on every platform
+    with open(filepath, 'w', encoding='utf-8', newline='') as f:
+        if isinstance(content, str):
+            f.write(content)
+        else:
+            f.writelines(content)
 
     return filepath
 
@@ -228,11 +304,11 @@ def save_calendar_file(content: str, filename: str) -> str:
 if __name__ == '__main__':
     # Test calendar generation
     print("Generating RFP calendar...")
-    rfp_cal = export_rfp_deadlines()
+    rfp_cal = iter_rfp_calendar(db.get_all_rfps(status='open', relevant_only=True))
     filepath = save_calendar_file(rfp_cal, 'rfp_deadlines.ics')
     print(f"Saved to: {filepath}")
 
     print("\nGenerating Bid calendar...")
-    bid_cal = export_bid_deadlines()
+    bid_cal = iter_bid_calendar(db.get_all_bid_responses())
     filepath = save_calendar_file(bid_cal, 'bid_deadlines.ics')
     print(f"Saved to: {filepath}")
@@ -5,24 +5,169 @@ Handles all database operations for opportunities, entities, sources, and articl
 
 import sqlite3
 import os
+import time
+import queue
 import logging
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Database path
-DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'intel.db')
+# Database path, made absolute once so connections don't depend on the working directory
+DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'intel.db')
+
+# Idle connections kept open for reuse by get_connection()
+POOL_SIZE = 5
+
+# How often (seconds) a connection returned to the pool runs PRAGMA optimize to refresh planner stats
+OPTIMIZE_INTERVAL = 60 * 60
+
+# Prepared statements each connection keeps; pooled connections live long enough to reuse them all
+CACHED_STATEMENTS = 256
+
+# Applied once when a connection is opened. WAL lets readers run during a write, and NORMAL
+# sync is safe under WAL; the rest keep temp tables, a 64 MB page cache and mmap in memory.
+CONNECTION_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-64000',
+    'PRAGMA mmap_size=268435456',
+)
+
+
+class _PooledConnection(sqlite3.Connection):
+    """
+    Connection handed out by get_connection().
+    close() returns it to the pool instead of closing it, so the operation
+    functions keep their open/close shape without reopening the file each call.
+    While shared by transaction(), commit and close are deferred instead so the
+    whole block lands as one transaction.
+    """
+
+    shared = False
+
+    def commit(self):
+        if not self.shared:
+            super().commit()
+
+    def close(self):
+        global _last_optimize
+        if self.shared:
+            return
+        if self.in_transaction:
+            self.rollback()
+        if time.monotonic() - _last_optimize > OPTIMIZE_INTERVAL:
+            _last_optimize = time.monotonic()
+            # Re-analyzes only tables whose size changed enough to matter; near free otherwise
+            try:
+                self.execute('PRAGMA optimize')
+            except sqlite3.Error as e:
+                logger.debug(f"PRAGMA optimize failed: {e}")
+        try:
+            _pool.put_nowait(self)
+        except queue.Full:
+            sqlite3.Connection.close(self)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """`with get_connection() as conn:` commits (or rolls back on error), then returns it to the pool."""
+        if self.shared:
+            # transaction() commits or rolls back the whole block
+            return False
+        try:
+            return super().__exit__(exc_type, exc_val, exc_tb)
+        finally:
+            self.close()
 
 
-def get_connection() -> sqlite3.Connection:
-    """Get database connection with row factory."""
-    conn = sqlite3.connect(DB_PATH)
+def _open_connection() -> _PooledConnection:
+    """Open a new connection and apply the row factory and PRAGMAs; the only place that connects."""
+    # Connections move between threads through the pool, but only one thread holds each at a time
+    conn = sqlite3.connect(DB_PATH, timeout=30, factory=_PooledConnection, check_same_thread=False,
+                           cached_statements=CACHED_STATEMENTS)
+    conn.path = DB_PATH
     conn.row_factory = sqlite3.Row
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
     return conn
 
 
+_local = threading.local()
+_last_optimize = time.monotonic()
+_pool: 'queue.LifoQueue[_PooledConnection]' = queue.LifoQueue(maxsize=POOL_SIZE)
+
+
+def get_connection() -> sqlite3.Connection:
+    """Get database connection with row factory, reusing an idle one from the pool if possible."""
+    shared = getattr(_local, 'conn', None)
+    if shared is not None:
+        return shared
+
+    while True:
+        try:
+            conn = _pool.get_nowait()
+        except queue.Empty:
+            break
+        # DB_PATH may have been pointed at another file since this connection was opened
+        if conn.path == DB_PATH:
+            return conn
+        sqlite3.Connection.close(conn)
+
+    return _open_connection()
+
+
+@contextmanager
+def transaction():
+    """
+    Run every database operation in the block (on this thread) in a single
+    transaction, committed once at the end and rolled back on error.
+    """
+    if getattr(_local, 'conn', None) is not None:
+        yield _local.conn
+        return
+
+    conn = get_connection()
+    conn.isolation_level = None
+    conn.execute('BEGIN IMMEDIATE')
+    conn.shared = True
+    _local.conn = conn
+    try:
+        yield conn
+        conn.execute('COMMIT')
+    except BaseException:
+        conn.execute('ROLLBACK')
+        raise
+    finally:
+        _local.conn = None
+        conn.shared = False
+        conn.isolation_level = ''
+        conn.close()
+
+
+@contextmanager
+def savepoint(name: str = 'sp'):
+    """
+    Inside transaction(), undo just this block's writes if it raises.
+    Outside a transaction each operation already commits on its own, so this does nothing.
+    """
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        yield
+        return
+
+    conn.execute(f'SAVEPOINT {name}')
+    try:
+        yield
+    except BaseException:
+        conn.execute(f'ROLLBACK TO {name}')
+        conn.execute(f'RELEASE {name}')
+        raise
+    conn.execute(f'RELEASE {name}')
+
+
 def init_database():
     """Initialize the database with all required tables."""
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
@@ -289,170 +434,259 @@ def init_database():
         )
     ''')
 
+    # Discovery query cache (lets reruns skip searches done recently)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS query_cache (
+            signature TEXT PRIMARY KEY,  -- normalized place::kind|issue-tags key
+            query TEXT NOT NULL,
+            last_run TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Discovery runs (progress checkpoints for long bulk discovery campaigns)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS discovery_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            status TEXT DEFAULT 'running',  -- running, completed, failed
+            queries_total INTEGER DEFAULT 0,
+            queries_done INTEGER DEFAULT 0,
+            articles_processed INTEGER DEFAULT 0,
+            opportunities_found INTEGER DEFAULT 0,
+            started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            finished_at TIMESTAMP
+        )
+    ''')
+
+    # Opportunities found by each discovery run
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS discovery_results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id INTEGER NOT NULL,
+            opportunity_id INTEGER,
+            entity_name TEXT,
+            entity_type TEXT,
+            issue_type TEXT,
+            heat_score REAL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (run_id) REFERENCES discovery_runs(id),
+            FOREIGN KEY (opportunity_id) REFERENCES opportunities(id)
+        )
+    ''')
+
+    # Indexes for join and filter columns. opportunity_articles(opportunity_id) and
+    # article_keywords(article_id) are already covered by their UNIQUE constraints.
+    cursor.executescript('''
+        CREATE INDEX IF NOT EXISTS idx_opp_entity ON opportunities(entity_id);
+        CREATE INDEX IF NOT EXISTS idx_opp_status ON opportunities(status);
+        CREATE INDEX IF NOT EXISTS idx_opp_heat ON opportunities(heat_score DESC);
+        CREATE INDEX IF NOT EXISTS idx_opp_detected ON opportunities(first_detected);
+        CREATE INDEX IF NOT EXISTS idx_opp_high_heat ON opportunities(heat_score DESC, last_activity DESC)
+            WHERE heat_score >= 70;
+        CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source_id);
+        CREATE INDEX IF NOT EXISTS idx_oa_article ON opportunity_articles(article_id);
+        CREATE INDEX IF NOT EXISTS idx_contacts_entity ON contacts(entity_id);
+        CREATE INDEX IF NOT EXISTS idx_activity_opp ON activity_log(opportunity_id);
+        CREATE INDEX IF NOT EXISTS idx_rfps_entity ON rfps(entity_id);
+        CREATE INDEX IF NOT EXISTS idx_results_run ON discovery_results(run_id);
+    ''')
+
+    # Full-text index over articles, kept in sync by triggers
+    fts_exists = cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+    ).fetchone()
+    cursor.executescript('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+            title, content, summary,
+            content='articles', content_rowid='id', tokenize='porter unicode61'
+        );
+        CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+            INSERT INTO articles_fts(rowid, title, content, summary)
+            VALUES (new.id, new.title, new.content, new.summary);
+        END;
+        CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+            INSERT INTO articles_fts(articles_fts, rowid, title, content, summary)
+            VALUES ('delete', old.id, old.title, old.content, old.summary);
+        END;
+        CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE OF title, content, summary ON articles BEGIN
+            INSERT INTO articles_fts(articles_fts, rowid, title, content, summary)
+            VALUES ('delete', old.id, old.title, old.content, old.summary);
+            INSERT INTO articles_fts(rowid, title, content, summary)
+            VALUES (new.id, new.title, new.content, new.summary);
+        END;
+    ''')
+    if not fts_exists:
+        # Index the articles saved before the table existed
+        cursor.execute("INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')")
+
+    # Give the query planner row-count statistics for the join and filter indexes
+    cursor.execute('ANALYZE')
+
     conn.commit()
     conn.close()
     logger.info(f"Database initialized at {DB_PATH}")
 
 
+_SEED_KEYWORDS = (
+    # Procurement violations
+    ('bid rigging', 'procurement', 2.0),
+    ('bid manipulation', 'procurement', 2.0),
+    ('procurement violation', 'procurement', 1.8),
+    ('cone of silence', 'procurement', 1.5),
+    ('no-bid contract', 'procurement', 1.3),
+    ('sole source', 'procurement', 1.0),
+    ('contract steering', 'procurement', 2.0),
+    ('vendor favoritism', 'procurement', 1.8),
+    ('kickback', 'procurement', 2.5),
+    ('collusion', 'procurement', 2.5),
+    ('rigged bid', 'procurement', 2.0),
+    ('procurement fraud', 'procurement', 2.5),
+
+    # Audit findings
+    ('audit finding', 'audit', 1.5),
+    ('audit report', 'audit', 1.0),
+    ('inspector general', 'audit', 1.8),
+    ('internal investigation', 'audit', 1.5),
+    ('financial irregularities', 'audit', 1.8),
+    ('misspending', 'audit', 1.5),
+    ('misappropriation', 'audit', 2.0),
+    ('unaccounted funds', 'audit', 1.8),
+    ('missing funds', 'audit', 2.0),
+    ('forensic audit', 'audit', 2.0),
+
+    # Ethics issues
+    ('ethics violation', 'ethics', 1.8),
+    ('ethics complaint', 'ethics', 1.5),
+    ('conflict of interest', 'ethics', 1.5),
+    ('self-dealing', 'ethics', 2.0),
+    ('nepotism', 'ethics', 1.5),
+    ('corruption', 'ethics', 2.5),
+    ('bribery', 'ethics', 2.5),
+    ('misconduct', 'ethics', 1.5),
+    ('malfeasance', 'ethics', 2.0),
+
+    # Budget problems
+    ('budget crisis', 'budget', 1.5),
+    ('budget shortfall', 'budget', 1.3),
+    ('cost overrun', 'budget', 1.5),
+    ('over budget', 'budget', 1.3),
+    ('budget deficit', 'budget', 1.3),
+    ('fiscal mismanagement', 'budget', 1.8),
+    ('taxpayer waste', 'budget', 1.5),
+    ('wasteful spending', 'budget', 1.5),
+
+    # Legal/investigation
+    ('grand jury', 'legal', 2.0),
+    ('FBI investigation', 'legal', 2.5),
+    ('federal investigation', 'legal', 2.5),
+    ('FDLE investigation', 'legal', 2.0),
+    ('criminal investigation', 'legal', 2.5),
+    ('indictment', 'legal', 2.5),
+    ('arrested', 'legal', 2.0),
+    ('charged with', 'legal', 2.0),
+    ('lawsuit', 'legal', 1.3),
+    ('whistleblower', 'legal', 1.8),
+
+    # Construction/contracts specific
+    ('change order', 'procurement', 1.2),
+    ('construction fraud', 'procurement', 2.0),
+    ('construction bid', 'procurement', 1.0),
+    ('contract award', 'procurement', 0.8),
+    ('RFP violation', 'procurement', 1.5),
+    ('vendor protest', 'procurement', 1.3),
+)
+
+
 def seed_keywords():
     """Seed the database with initial keywords for matching."""
-    keywords = [
-        # Procurement violations
-        ('bid rigging', 'procurement', 2.0),
-        ('bid manipulation', 'procurement', 2.0),
-        ('procurement violation', 'procurement', 1.8),
-        ('cone of silence', 'procurement', 1.5),
-        ('no-bid contract', 'procurement', 1.3),
-        ('sole source', 'procurement', 1.0),
-        ('contract steering', 'procurement', 2.0),
-        ('vendor favoritism', 'procurement', 1.8),
-        ('kickback', 'procurement', 2.5),
-        ('collusion', 'procurement', 2.5),
-        ('rigged bid', 'procurement', 2.0),
-        ('procurement fraud', 'procurement', 2.5),
-
-        # Audit findings
-        ('audit finding', 'audit', 1.5),
-        ('audit report', 'audit', 1.0),
-        ('inspector general', 'audit', 1.8),
-        ('internal investigation', 'audit', 1.5),
-        ('financial irregularities', 'audit', 1.8),
-        ('misspending', 'audit', 1.5),
-        ('misappropriation', 'audit', 2.0),
-        ('unaccounted funds', 'audit', 1.8),
-        ('missing funds', 'audit', 2.0),
-        ('forensic audit', 'audit', 2.0),
-
-        # Ethics issues
-        ('ethics violation', 'ethics', 1.8),
-        ('ethics complaint', 'ethics', 1.5),
-        ('conflict of interest', 'ethics', 1.5),
-        ('self-dealing', 'ethics', 2.0),
-        ('nepotism', 'ethics', 1.5),
-        ('corruption', 'ethics', 2.5),
-        ('bribery', 'ethics', 2.5),
-        ('misconduct', 'ethics', 1.5),
-        ('malfeasance', 'ethics', 2.0),
-
-        # Budget problems
-        ('budget crisis', 'budget', 1.5),
-        ('budget shortfall', 'budget', 1.3),
-        ('cost overrun', 'budget', 1.5),
-        ('over budget', 'budget', 1.3),
-        ('budget deficit', 'budget', 1.3),
-        ('fiscal mismanagement', 'budget', 1.8),
-        ('taxpayer waste', 'budget', 1.5),
-        ('wasteful spending', 'budget', 1.5),
-
-        # Legal/investigation
-        ('grand jury', 'legal', 2.0),
-        ('FBI investigation', 'legal', 2.5),
-        ('federal investigation', 'legal', 2.5),
-        ('FDLE investigation', 'legal', 2.0),
-        ('criminal investigation', 'legal', 2.5),
-        ('indictment', 'legal', 2.5),
-        ('arrested', 'legal', 2.0),
-        ('charged with', 'legal', 2.0),
-        ('lawsuit', 'legal', 1.3),
-        ('whistleblower', 'legal', 1.8),
-
-        # Construction/contracts specific
-        ('change order', 'procurement', 1.2),
-        ('construction fraud', 'procurement', 2.0),
-        ('construction bid', 'procurement', 1.0),
-        ('contract award', 'procurement', 0.8),
-        ('RFP violation', 'procurement', 1.5),
-        ('vendor protest', 'procurement', 1.3),
-    ]
-
     conn = get_connection()
     cursor = conn.cursor()
 
-    for keyword, category, weight in keywords:
-        try:
-            cursor.execute('''
-                INSERT OR IGNORE INTO keywords (keyword, category, weight)
-                VALUES (?, ?, ?)
-            ''', (keyword, category, weight))
-        except sqlite3.Error as e:
-            logger.error(f"Error inserting keyword {keyword}: {e}")
+    try:
+        cursor.executemany('''
+            INSERT OR IGNORE INTO keywords (keyword, category, weight)
+            VALUES (?, ?, ?)
+        ''', _SEED_KEYWORDS)
+    except sqlite3.Error as e:
+        logger.error(f"Error inserting keywords: {e}")
 
     conn.commit()
     conn.close()
-    logger.info(f"Seeded {len(keywords)} keywords")
+    logger.info(f"Seeded {len(_SEED_KEYWORDS)} keywords")
+
+
+_SEED_SOURCES = (
+    # Florida news sources
+    ('Ocala Gazette', 'news', 'https://www.ocalagazette.com/', 'FL'),
+    ('Ocala Star Banner', 'news', 'https://www.ocala.com/', 'FL'),
+    ('Tampa Bay Times', 'news', 'https://www.tampabay.com/', 'FL'),
+    ('Orlando Sentinel', 'news', 'https://www.orlandosentinel.com/', 'FL'),
+    ('Miami Herald', 'news', 'https://www.miamiherald.com/', 'FL'),
+    ('Sun Sentinel', 'news', 'https://www.sun-sentinel.com/', 'FL'),
+    ('Jacksonville Times-Union', 'news', 'https://www.jacksonville.com/', 'FL'),
+    ('Gainesville Sun', 'news', 'https://www.gainesville.com/', 'FL'),
+    ('Sarasota Herald-Tribune', 'news', 'https://www.heraldtribune.com/', 'FL'),
+    ('Palm Beach Post', 'news', 'https://www.palmbeachpost.com/', 'FL'),
+    ('News-Press (Fort Myers)', 'news', 'https://www.news-press.com/', 'FL'),
+    ('Pensacola News Journal', 'news', 'https://www.pnj.com/', 'FL'),
+    ('Florida Politics', 'news', 'https://floridapolitics.com/', 'FL'),
+    ('Florida Phoenix', 'news', 'https://floridaphoenix.com/', 'FL'),
+
+    # Official sources
+    ('FL Auditor General', 'audit_portal', 'https://flauditor.gov/', 'FL'),
+    ('FL Ethics Commission', 'ethics_commission', 'https://ethics.state.fl.us/', 'FL'),
+    ('FL Inspector General', 'audit_portal', 'https://www.floridaoig.com/', 'FL'),
+
+    # National sources that cover local government
+    ('Government Technology', 'news', 'https://www.govtech.com/', None),
+    ('Governing Magazine', 'news', 'https://www.governing.com/', None),
+)
 
 
 def seed_sources():
     """Seed initial news sources for Florida."""
-    sources = [
-        # Florida news sources
-        ('Ocala Gazette', 'news', 'https://www.ocalagazette.com/', 'FL'),
-        ('Ocala Star Banner', 'news', 'https://www.ocala.com/', 'FL'),
-        ('Tampa Bay Times', 'news', 'https://www.tampabay.com/', 'FL'),
-        ('Orlando Sentinel', 'news', 'https://www.orlandosentinel.com/', 'FL'),
-        ('Miami Herald', 'news', 'https://www.miamiherald.com/', 'FL'),
-        ('Sun Sentinel', 'news', 'https://www.sun-sentinel.com/', 'FL'),
-        ('Jacksonville Times-Union', 'news', 'https://www.jacksonville.com/', 'FL'),
-        ('Gainesville Sun', 'news', 'https://www.gainesville.com/', 'FL'),
-        ('Sarasota Herald-Tribune', 'news', 'https://www.heraldtribune.com/', 'FL'),
-        ('Palm Beach Post', 'news', 'https://www.palmbeachpost.com/', 'FL'),
-        ('News-Press (Fort Myers)', 'news', 'https://www.news-press.com/', 'FL'),
-        ('Pensacola News Journal', 'news', 'https://www.pnj.com/', 'FL'),
-        ('Florida Politics', 'news', 'https://floridapolitics.com/', 'FL'),
-        ('Florida Phoenix', 'news', 'https://floridaphoenix.com/', 'FL'),
-
-        # Official sources
-        ('FL Auditor General', 'audit_portal', 'https://flauditor.gov/', 'FL'),
-        ('FL Ethics Commission', 'ethics_commission', 'https://ethics.state.fl.us/', 'FL'),
-        ('FL Inspector General', 'audit_portal', 'https://www.floridaoig.com/', 'FL'),
-
-        # National sources that cover local government
-        ('Government Technology', 'news', 'https://www.govtech.com/', None),
-        ('Governing Magazine', 'news', 'https://www.governing.com/', None),
-    ]
-
     conn = get_connection()
     cursor = conn.cursor()
 
-    for name, source_type, url, state in sources:
-        try:
-            cursor.execute('''
-                INSERT OR IGNORE INTO sources (name, source_type, url, state)
-                VALUES (?, ?, ?, ?)
-            ''', (name, source_type, url, state))
-        except sqlite3.Error as e:
-            logger.error(f"Error inserting source {name}: {e}")
+    try:
+        cursor.executemany('''
+            INSERT OR IGNORE INTO sources (name, source_type, url, state)
+            VALUES (?, ?, ?, ?)
+        ''', _SEED_SOURCES)
+    except sqlite3.Error as e:
+        logger.error(f"Error inserting sources: {e}")
 
     conn.commit()
     conn.close()
-    logger.info(f"Seeded {len(sources)} sources")
+    logger.info(f"Seeded {len(_SEED_SOURCES)} sources")
 
 
 # ============== Entity Operations ==============
 
 def create_entity(name: str, entity_type: str, state: str, **kwargs) -> int:
     """Create a new entity and return its ID."""
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute('''
-        INSERT OR IGNORE INTO entities (name, entity_type, state, county, population, annual_budget, website)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-    ''', (name, entity_type, state, kwargs.get('county'), kwargs.get('population'),
-          kwargs.get('annual_budget'), kwargs.get('website')))
-
-    conn.commit()
-    entity_id = cursor.lastrowid
-
-    # If INSERT OR IGNORE didn't insert (duplicate), fetch the existing ID
-    if entity_id == 0:
-        cursor.execute('SELECT id FROM entities WHERE name = ? AND entity_type = ? AND state = ?',
-                      (name, entity_type, state))
-        row = cursor.fetchone()
-        entity_id = row['id'] if row else None
-
-    conn.close()
-    return entity_id
+    with get_connection() as conn:
+        # The upsert returns the ID whether the entity is new or already exists
+        cursor = conn.execute('''
+            INSERT INTO entities (name, entity_type, state, county, population, annual_budget, website)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(name, entity_type, state) DO UPDATE SET updated_at = CURRENT_TIMESTAMP
+            RETURNING id
+        ''', (name, entity_type, state, kwargs.get('county'), kwargs.get('population'),
+              kwargs.get('annual_budget'), kwargs.get('website')))
+        return cursor.fetchone()['id']
+
+
+def create_entities_bulk(rows: Iterable[tuple]) -> int:
+    """
+    Insert many entities in a single transaction.
+    Each row is (name, entity_type, state, county, population).
+    Returns the number of rows actually inserted (duplicates are ignored).
+    """
+    with get_connection() as conn:
+        return conn.executemany('''
+            INSERT OR IGNORE INTO entities (name, entity_type, state, county, population)
+            VALUES (?, ?, ?, ?, ?)
+        ''', rows).rowcount
 
 
 def get_entity(entity_id: int) -> Optional[Dict]:
@@ -476,35 +710,35 @@ def get_entity_by_name(name: str, entity_type: str, state: str) -> Optional[Dict
     return dict(row) if row else None
 
 
+def iter_entities() -> Iterator[Dict]:
+    """Yield every entity, one row at a time."""
+    with get_connection() as conn:
+        yield from map(dict, conn.execute('SELECT * FROM entities ORDER BY name'))
+
+
 def get_all_entities() -> List[Dict]:
     """Get all entities."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute('SELECT * FROM entities ORDER BY name')
-    rows = cursor.fetchall()
-    conn.close()
-    return [dict(row) for row in rows]
+    return list(iter_entities())
+
+
+def get_entity_names_only() -> List[str]:
+    """Get just the entity names, for dropdowns and lookups that need nothing else."""
+    with get_connection() as conn:
+        return [name for name, in conn.execute('SELECT name FROM entities ORDER BY name')]
 
 
 # ============== Opportunity Operations ==============
 
 def create_opportunity(entity_id: int, title: str, **kwargs) -> int:
     """Create a new opportunity and return its ID."""
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute('''
-        INSERT INTO opportunities (entity_id, title, summary, heat_score, status, priority, issue_type, attack_brief)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (entity_id, title, kwargs.get('summary'), kwargs.get('heat_score', 0),
-          kwargs.get('status', 'new'), kwargs.get('priority', 'medium'),
-          kwargs.get('issue_type'), kwargs.get('attack_brief')))
-
-    conn.commit()
-    opportunity_id = cursor.lastrowid
-    conn.close()
-
-    return opportunity_id
+    with get_connection() as conn:
+        cursor = conn.execute('''
+            INSERT INTO opportunities (entity_id, title, summary, heat_score, status, priority, issue_type, attack_brief)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (entity_id, title, kwargs.get('summary'), kwargs.get('heat_score', 0),
+              kwargs.get('status', 'new'), kwargs.get('priority', 'medium'),
+              kwargs.get('issue_type'), kwargs.get('attack_brief')))
+        return cursor.lastrowid
 
 
 def get_opportunity(opportunity_id: int) -> Optional[Dict]:
@@ -522,11 +756,9 @@ def get_opportunity(opportunity_id: int) -> Optional[Dict]:
     return dict(row) if row else None
 
 
-def get_all_opportunities(status: str = None, min_heat_score: float = None) -> List[Dict]:
-    """Get all opportunities with optional filtering."""
-    conn = get_connection()
-    cursor = conn.cursor()
-
+def iter_opportunities(status: str = None, min_heat_score: float = None,
+                       entity_id: int = None) -> Iterator[Dict]:
+    """Yield opportunities with optional filtering, one row at a time."""
     query = '''
         SELECT o.*, e.name as entity_name, e.entity_type, e.state, e.county
         FROM opportunities o
@@ -543,52 +775,54 @@ def get_all_opportunities(status: str = None, min_heat_score: float = None) -> L
         query += ' AND o.heat_score >= ?'
         params.append(min_heat_score)
 
+    if entity_id is not None:
+        query += ' AND o.entity_id = ?'
+        params.append(entity_id)
+
     query += ' ORDER BY o.heat_score DESC, o.last_activity DESC'
 
-    cursor.execute(query, params)
-    rows = cursor.fetchall()
-    conn.close()
-    return [dict(row) for row in rows]
+    with get_connection() as conn:
+        yield from map(dict, conn.execute(query, params))
 
 
-def update_opportunity(opportunity_id: int, **kwargs) -> bool:
-    """Update an opportunity."""
-    conn = get_connection()
-    cursor = conn.cursor()
+def get_all_opportunities(status: str = None, min_heat_score: float = None,
+                          entity_id: int = None) -> List[Dict]:
+    """Get all opportunities with optional filtering."""
+    return list(iter_opportunities(status, min_heat_score, entity_id))
 
-    valid_fields = ['title', 'summary', 'heat_score', 'status', 'priority', 'issue_type', 'notes', 'attack_brief']
-    updates = []
-    params = []
 
-    for field in valid_fields:
-        if field in kwargs:
-            updates.append(f'{field} = ?')
-            params.append(kwargs[field])
+OPPORTUNITY_FIELDS = ('title', 'summary', 'heat_score', 'status', 'priority', 'issue_type', 'notes', 'attack_brief')
 
-    if not updates:
+# One fixed statement for every combination of fields, so it is prepared once and reused.
+# Each field takes a (set it?, value) pair; unlike COALESCE this still allows setting NULL.
+_UPDATE_OPPORTUNITY_SQL = (
+    'UPDATE opportunities SET '
+    + ', '.join(f'{field} = CASE WHEN ? THEN ? ELSE {field} END' for field in OPPORTUNITY_FIELDS)
+    + ', last_activity = CURRENT_TIMESTAMP WHERE id = ?'
+)
+
+
+def update_opportunity(opportunity_id: int, **kwargs) -> bool:
+    """Update an opportunity."""
+    if not any(field in kwargs for field in OPPORTUNITY_FIELDS):
         return False
 
-    updates.append('last_activity = CURRENT_TIMESTAMP')
+    params = []
+    for field in OPPORTUNITY_FIELDS:
+        params += (field in kwargs, kwargs.get(field))
     params.append(opportunity_id)
 
-    query = f'UPDATE opportunities SET {", ".join(updates)} WHERE id = ?'
-    cursor.execute(query, params)
-    conn.commit()
-    success = cursor.rowcount > 0
-    conn.close()
-    return success
+    with get_connection() as conn:
+        return conn.execute(_UPDATE_OPPORTUNITY_SQL, params).rowcount > 0
 
 
 def add_activity_log(opportunity_id: int, activity_type: str, description: str):
     """Add an activity log entry."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute('''
-        INSERT INTO activity_log (opportunity_id, activity_type, description)
-        VALUES (?, ?, ?)
-    ''', (opportunity_id, activity_type, description))
-    conn.commit()
-    conn.close()
+    with get_connection() as conn:
+        conn.execute('''
+            INSERT INTO activity_log (opportunity_id, activity_type, description)
+            VALUES (?, ?, ?)
+        ''', (opportunity_id, activity_type, description))
 
 
 def get_opportunity_activities(opportunity_id: int) -> List[Dict]:
@@ -610,24 +844,62 @@ def create_article(url: str, title: str, source_id: int = None, **kwargs) -> int
     conn = get_connection()
     cursor = conn.cursor()
 
-    try:
-        cursor.execute('''
-            INSERT INTO articles (source_id, url, title, content, summary, published_date)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (source_id, url, title, kwargs.get('content'), kwargs.get('summary'),
-              kwargs.get('published_date')))
-        conn.commit()
-        article_id = cursor.lastrowid
-    except sqlite3.IntegrityError:
-        # Article already exists
-        cursor.execute('SELECT id FROM articles WHERE url = ?', (url,))
-        row = cursor.fetchone()
-        article_id = row['id'] if row else None
+    # An existing article is left as is (the no-op update only makes RETURNING yield its ID)
+    cursor.execute('''
+        INSERT INTO articles (source_id, url, title, content, summary, published_date)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(url) DO UPDATE SET url = excluded.url
+        RETURNING id
+    ''', (source_id, url, title, kwargs.get('content'), kwargs.get('summary'),
+          kwargs.get('published_date')))
+    article_id = cursor.fetchone()['id']
 
+    conn.commit()
     conn.close()
     return article_id
 
 
+def find_articles_matching_keywords(keyword_ids: Iterable[int] = None) -> List[int]:
+    """
+    Find articles mentioning any of the given keywords, using the full-text index.
+
+    Args:
+        keyword_ids: Keywords to search for (default: all active keywords)
+
+    Returns:
+        Matching article IDs, best match first
+    """
+    with get_connection() as conn:
+        if keyword_ids is None:
+            rows = conn.execute('SELECT keyword FROM keywords WHERE is_active = 1').fetchall()
+        else:
+            keyword_ids = list(keyword_ids)
+            rows = []
+            for start in range(0, len(keyword_ids), 500):
+                chunk = keyword_ids[start:start + 500]
+                rows += conn.execute(
+                    f"SELECT keyword FROM keywords WHERE id IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall()
+
+        if not rows:
+            return []
+
+        # Each keyword is a quoted phrase; embedded quotes are doubled per FTS5 syntax
+        match = ' OR '.join('"' + keyword.replace('"', '""') + '"' for keyword, in rows)
+        cursor = conn.execute('SELECT rowid FROM articles_fts WHERE articles_fts MATCH ? ORDER BY rank', (match,))
+        return [article_id for article_id, in cursor]
+
+
+def get_article_urls() -> List[str]:
+    """Get the URL of every saved article."""
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute('SELECT url FROM articles')
+    rows = cursor.fetchall()
+    conn.close()
+    return [row['url'] for row in rows]
+
+
 def get_article(article_id: int) -> Optional[Dict]:
     """Get article by ID."""
     conn = get_connection()
@@ -643,27 +915,50 @@ def get_article(article_id: int) -> Optional[Dict]:
     return dict(row) if row else None
 
 
-def link_article_to_opportunity(article_id: int, opportunity_id: int, relevance_score: float = 1.0):
-    """Link an article to an opportunity."""
+def get_article_summary(article_id: int) -> Optional[Dict]:
+    """Get an article's listing fields by ID, without the full body."""
     conn = get_connection()
     cursor = conn.cursor()
+    cursor.execute('''
+        SELECT a.id, a.url, a.title, a.summary, a.published_date, s.name as source_name
+        FROM articles a
+        LEFT JOIN sources s ON a.source_id = s.id
+        WHERE a.id = ?
+    ''', (article_id,))
+    row = cursor.fetchone()
+    conn.close()
+    return dict(row) if row else None
+
+
+def get_article_content(article_id: int) -> Optional[str]:
+    """Get just an article's full body text."""
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute('SELECT content FROM articles WHERE id = ?', (article_id,))
+    row = cursor.fetchone()
+    conn.close()
+    return row['content'] if row else None
+
+
+def link_article_to_opportunity(article_id: int, opportunity_id: int, relevance_score: float = 1.0):
+    """Link an article to an opportunity."""
     try:
-        cursor.execute('''
-            INSERT OR IGNORE INTO opportunity_articles (opportunity_id, article_id, relevance_score)
-            VALUES (?, ?, ?)
-        ''', (opportunity_id, article_id, relevance_score))
-        conn.commit()
+        with get_connection() as conn:
+            conn.execute('''
+                INSERT OR IGNORE INTO opportunity_articles (opportunity_id, article_id, relevance_score)
+                VALUES (?, ?, ?)
+            ''', (opportunity_id, article_id, relevance_score))
     except sqlite3.Error as e:
         logger.error(f"Error linking article {article_id} to opportunity {opportunity_id}: {e}")
-    conn.close()
 
 
 def get_opportunity_articles(opportunity_id: int) -> List[Dict]:
-    """Get all articles linked to an opportunity."""
+    """Get all articles linked to an opportunity (listing fields only; see get_article_content)."""
     conn = get_connection()
     cursor = conn.cursor()
     cursor.execute('''
-        SELECT a.*, s.name as source_name, oa.relevance_score
+        SELECT a.id, a.source_id, a.url, a.title, a.summary, a.published_date, a.scraped_at,
+               s.name as source_name, oa.relevance_score
         FROM articles a
         LEFT JOIN sources s ON a.source_id = s.id
         JOIN opportunity_articles oa ON a.id = oa.article_id
@@ -677,74 +972,191 @@ def get_opportunity_articles(opportunity_id: int) -> List[Dict]:
 
 # ============== Keywords Operations ==============
 
+def iter_keywords() -> Iterator[Dict]:
+    """Yield every active keyword, one row at a time."""
+    with get_connection() as conn:
+        yield from map(dict, conn.execute('SELECT * FROM keywords WHERE is_active = 1 ORDER BY weight DESC'))
+
+
 def get_all_keywords() -> List[Dict]:
     """Get all active keywords."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute('SELECT * FROM keywords WHERE is_active = 1 ORDER BY weight DESC')
-    rows = cursor.fetchall()
-    conn.close()
-    return [dict(row) for row in rows]
+    return list(iter_keywords())
 
 
 def add_keyword_match(article_id: int, keyword_id: int, match_count: int = 1):
     """Record a keyword match for an article."""
+    add_keyword_matches_bulk([(article_id, keyword_id, match_count)])
+
+
+def add_keyword_matches_bulk(matches: Iterable[tuple]):
+    """
+    Record many keyword matches in one transaction.
+
+    Args:
+        matches: (article_id, keyword_id, match_count) tuples
+    """
     conn = get_connection()
     cursor = conn.cursor()
     try:
-        cursor.execute('''
+        cursor.executemany('''
             INSERT OR REPLACE INTO article_keywords (article_id, keyword_id, match_count)
             VALUES (?, ?, ?)
-        ''', (article_id, keyword_id, match_count))
+        ''', matches)
         conn.commit()
     except sqlite3.Error as e:
-        logger.error(f"Error adding keyword match: {e}")
+        logger.error(f"Error adding keyword matches: {e}")
     conn.close()
 
 
-# ============== Source Operations ==============
+# ============== Query Cache Operations ==============
 
-def get_all_sources(active_only: bool = True) -> List[Dict]:
-    """Get all sources."""
+def get_recent_query_signatures(days: int) -> set:
+    """Get signatures of discovery queries run within the last N days."""
     conn = get_connection()
     cursor = conn.cursor()
-    query = 'SELECT * FROM sources'
-    if active_only:
-        query += ' WHERE is_active = 1'
-    query += ' ORDER BY name'
-    cursor.execute(query)
+    cursor.execute('''
+        SELECT signature FROM query_cache
+        WHERE last_run >= datetime('now', ?)
+    ''', (f'-{days} days',))
     rows = cursor.fetchall()
     conn.close()
-    return [dict(row) for row in rows]
+    return {row['signature'] for row in rows}
 
 
-def update_source_last_scraped(source_id: int):
-    """Update the last_scraped timestamp for a source."""
+def mark_query_run(signature: str, query: str):
+    """Record that a discovery query signature was just searched."""
     conn = get_connection()
     cursor = conn.cursor()
-    cursor.execute('UPDATE sources SET last_scraped = CURRENT_TIMESTAMP WHERE id = ?', (source_id,))
+    cursor.execute('''
+        INSERT INTO query_cache (signature, query, last_run)
+        VALUES (?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(signature) DO UPDATE SET query = excluded.query, last_run = CURRENT_TIMESTAMP
+    ''', (signature, query))
     conn.commit()
     conn.close()
 
 
-# ============== Contact Operations ==============
+# ============== Discovery Run Operations ==============
 
-def create_contact(entity_id: int, name: str, **kwargs) -> int:
-    """Create a new contact."""
+def create_discovery_run(queries_total: int = 0) -> int:
+    """Start a discovery run record and return its ID."""
     conn = get_connection()
     cursor = conn.cursor()
+    cursor.execute('INSERT INTO discovery_runs (queries_total) VALUES (?)', (queries_total,))
+    conn.commit()
+    run_id = cursor.lastrowid
+    conn.close()
+    return run_id
 
-    cursor.execute('''
-        INSERT INTO contacts (entity_id, name, title, role, email, phone, linkedin, notes)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (entity_id, name, kwargs.get('title'), kwargs.get('role'),
-          kwargs.get('email'), kwargs.get('phone'), kwargs.get('linkedin'),
-          kwargs.get('notes')))
 
+def update_discovery_run(run_id: int, **kwargs) -> bool:
+    """Update progress counters or status for a discovery run."""
+    valid_fields = ['status', 'queries_total', 'queries_done', 'articles_processed', 'opportunities_found']
+    updates = []
+    params = []
+
+    for field in valid_fields:
+        if field in kwargs:
+            updates.append(f'{field} = ?')
+            params.append(kwargs[field])
+
+    if kwargs.get('status') in ('completed', 'failed'):
+        updates.append('finished_at = CURRENT_TIMESTAMP')
+
+    if not updates:
+        return False
+
+    params.append(run_id)
+
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(f'UPDATE discovery_runs SET {", ".join(updates)} WHERE id = ?', params)
+    conn.commit()
+    success = cursor.rowcount > 0
+    conn.close()
+    return success
+
+
+def insert_discovery_results(run_id: int, results: List[Dict]):
+    """Append a batch of discovery results (as returned by process_article) to a run."""
+    if not results:
+        return
+
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.executemany('''
+        INSERT INTO discovery_results (run_id, opportunity_id, entity_name, entity_type, issue_type, heat_score)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', [(run_id, r.get('opportunity_id'), r['entity']['name'], r['entity']['entity_type'],
+           r.get('issue_type'), r.get('heat_score')) for r in results])
     conn.commit()
-    contact_id = cursor.lastrowid
     conn.close()
-    return contact_id
+
+
+def get_discovery_run_breakdown(run_id: int, column: str) -> List[tuple]:
+    """Count a run's results grouped by entity_type or issue_type, most common first."""
+    if column not in ('entity_type', 'issue_type'):
+        raise ValueError(f"Unsupported breakdown column: {column}")
+
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute(f'''
+        SELECT COALESCE({column}, 'unknown') as value, COUNT(*) as count
+        FROM discovery_results
+        WHERE run_id = ?
+        GROUP BY value
+        ORDER BY count DESC
+    ''', (run_id,))
+    rows = cursor.fetchall()
+    conn.close()
+    return [(row['value'], row['count']) for row in rows]
+
+
+def get_discovery_run(run_id: int) -> Optional[Dict]:
+    """Get a discovery run by ID."""
+    conn = get_connection()
+    cursor = conn.cursor()
+    cursor.execute('SELECT * FROM discovery_runs WHERE id = ?', (run_id,))
+    row = cursor.fetchone()
+    conn.close()
+    return dict(row) if row else None
+
+
+# ============== Source Operations ==============
+
+def iter_sources(active_only: bool = True) -> Iterator[Dict]:
+    """Yield sources one row at a time."""
+    query = 'SELECT * FROM sources'
+    if active_only:
+        query += ' WHERE is_active = 1'
+    query += ' ORDER BY name'
+    with get_connection() as conn:
+        yield from map(dict, conn.execute(query))
+
+
+def get_all_sources(active_only: bool = True) -> List[Dict]:
+    """Get all sources."""
+    return list(iter_sources(active_only))
+
+
+def update_source_last_scraped(source_id: int):
+    """Update the last_scraped timestamp for a source."""
+    with get_connection() as conn:
+        conn.execute('UPDATE sources SET last_scraped = CURRENT_TIMESTAMP WHERE id = ?', (source_id,))
+
+
+# ============== Contact Operations ==============
+
+def create_contact(entity_id: int, name: str, **kwargs) -> int:
+    """Create a new contact."""
+    with get_connection() as conn:
+        cursor = conn.execute('''
+            INSERT INTO contacts (entity_id, name, title, role, email, phone, linkedin, notes)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (entity_id, name, kwargs.get('title'), kwargs.get('role'),
+              kwargs.get('email'), kwargs.get('phone'), kwargs.get('linkedin'),
+              kwargs.get('notes')))
+        return cursor.lastrowid
 
 
 def get_entity_contacts(entity_id: int) -> List[Dict]:
@@ -764,197 +1176,215 @@ def get_dashboard_stats() -> Dict:
     conn = get_connection()
     cursor = conn.cursor()
 
-    stats = {}
-
-    # Total opportunities by status
+    # Scalar counts in one query
     cursor.execute('''
-        SELECT status, COUNT(*) as count FROM opportunities GROUP BY status
+        SELECT
+            (SELECT COUNT(*) FROM opportunities) AS total_opportunities,
+            (SELECT COUNT(*) FROM opportunities WHERE heat_score >= 70) AS high_heat_count,
+            (SELECT COUNT(*) FROM opportunities
+             WHERE first_detected >= datetime('now', '-7 days')) AS new_this_week,
+            (SELECT COUNT(*) FROM entities) AS total_entities,
+            (SELECT COUNT(*) FROM articles) AS total_articles
     ''')
-    stats['opportunities_by_status'] = {row['status']: row['count'] for row in cursor.fetchall()}
+    stats = dict(cursor.fetchone())
 
-    # Total opportunities
-    cursor.execute('SELECT COUNT(*) as count FROM opportunities')
-    stats['total_opportunities'] = cursor.fetchone()['count']
-
-    # High heat opportunities (score >= 70)
-    cursor.execute('SELECT COUNT(*) as count FROM opportunities WHERE heat_score >= 70')
-    stats['high_heat_count'] = cursor.fetchone()['count']
-
-    # New opportunities (last 7 days)
+    # Opportunities by status and by type in one query
     cursor.execute('''
-        SELECT COUNT(*) as count FROM opportunities
-        WHERE first_detected >= datetime('now', '-7 days')
+        SELECT 'status' AS grouping, status AS value, COUNT(*) AS count
+        FROM opportunities GROUP BY status
+        UNION ALL
+        SELECT 'issue_type', issue_type, COUNT(*)
+        FROM opportunities WHERE issue_type IS NOT NULL GROUP BY issue_type
     ''')
-    stats['new_this_week'] = cursor.fetchone()['count']
-
-    # Total entities tracked
-    cursor.execute('SELECT COUNT(*) as count FROM entities')
-    stats['total_entities'] = cursor.fetchone()['count']
-
-    # Total articles
-    cursor.execute('SELECT COUNT(*) as count FROM articles')
-    stats['total_articles'] = cursor.fetchone()['count']
-
-    # Opportunities by type
-    cursor.execute('''
-        SELECT issue_type, COUNT(*) as count FROM opportunities
-        WHERE issue_type IS NOT NULL GROUP BY issue_type
-    ''')
-    stats['opportunities_by_type'] = {row['issue_type']: row['count'] for row in cursor.fetchall()}
+    stats['opportunities_by_status'] = {}
+    stats['opportunities_by_type'] = {}
+    for row in cursor.fetchall():
+        key = 'opportunities_by_status' if row['grouping'] == 'status' else 'opportunities_by_type'
+        stats[key][row['value']] = row['count']
 
     conn.close()
     return stats
 
 
+_SEED_RFP_KEYWORDS = (
+    # IT Consulting & Assessment
+    ('application rationalization', 'it_consulting', 3.0),
+    ('IT assessment', 'it_consulting', 2.5),
+    ('technology assessment', 'it_consulting', 2.5),
+    ('IT consulting', 'it_consulting', 2.0),
+    ('IT strategic plan', 'it_consulting', 2.5),
+    ('IT modernization', 'it_consulting', 2.5),
+    ('digital transformation', 'it_consulting', 2.5),
+    ('systems assessment', 'it_consulting', 2.0),
+    ('infrastructure assessment', 'it_consulting', 2.0),
+    ('network assessment', 'it_consulting', 2.0),
+    ('cybersecurity assessment', 'it_consulting', 2.5),
+    ('security audit', 'it_consulting', 2.0),
+    ('penetration testing', 'it_consulting', 2.0),
+    ('IT audit', 'it_consulting', 2.0),
+    ('technology roadmap', 'it_consulting', 2.5),
+    ('enterprise architecture', 'it_consulting', 2.5),
+    ('cloud migration', 'it_consulting', 2.0),
+    ('cloud assessment', 'it_consulting', 2.0),
+    ('data center', 'it_consulting', 1.5),
+
+    # Software & Systems
+    ('software implementation', 'software', 2.0),
+    ('ERP implementation', 'software', 2.5),
+    ('ERP assessment', 'software', 2.5),
+    ('financial system', 'software', 2.0),
+    ('HRIS', 'software', 1.5),
+    ('human resources system', 'software', 1.5),
+    ('permitting software', 'software', 2.0),
+    ('utility billing', 'software', 1.5),
+    ('asset management system', 'software', 2.0),
+    ('work order system', 'software', 1.5),
+    ('GIS', 'software', 1.5),
+    ('document management', 'software', 1.5),
+    ('records management', 'software', 1.5),
+
+    # Studies & Analysis
+    ('feasibility study', 'study', 2.5),
+    ('feasibility assessment', 'study', 2.5),
+    ('needs assessment', 'study', 2.0),
+    ('gap analysis', 'study', 2.0),
+    ('business process', 'study', 2.0),
+    ('process improvement', 'study', 2.0),
+    ('workflow analysis', 'study', 2.0),
+    ('cost benefit analysis', 'study', 2.0),
+    ('return on investment', 'study', 1.5),
+    ('benchmark', 'study', 1.5),
+    ('best practices', 'study', 1.5),
+
+    # Professional Services
+    ('management consulting', 'professional_services', 2.0),
+    ('organizational assessment', 'professional_services', 2.0),
+    ('staffing study', 'professional_services', 2.0),
+    ('performance audit', 'professional_services', 2.0),
+    ('operational review', 'professional_services', 2.0),
+    ('efficiency study', 'professional_services', 2.0),
+    ('strategic planning', 'professional_services', 2.0),
+    ('master plan', 'professional_services', 1.5),
+    ('comprehensive plan', 'professional_services', 1.5),
+
+    # Data & Analytics
+    ('data analytics', 'data', 2.0),
+    ('business intelligence', 'data', 2.0),
+    ('dashboard', 'data', 1.5),
+    ('reporting system', 'data', 1.5),
+    ('data warehouse', 'data', 2.0),
+    ('data governance', 'data', 2.0),
+    ('data migration', 'data', 2.0),
+)
+
+
 def seed_rfp_keywords():
     """Seed RFP keywords for IT consulting opportunities."""
-    keywords = [
-        # IT Consulting & Assessment
-        ('application rationalization', 'it_consulting', 3.0),
-        ('IT assessment', 'it_consulting', 2.5),
-        ('technology assessment', 'it_consulting', 2.5),
-        ('IT consulting', 'it_consulting', 2.0),
-        ('IT strategic plan', 'it_consulting', 2.5),
-        ('IT modernization', 'it_consulting', 2.5),
-        ('digital transformation', 'it_consulting', 2.5),
-        ('systems assessment', 'it_consulting', 2.0),
-        ('infrastructure assessment', 'it_consulting', 2.0),
-        ('network assessment', 'it_consulting', 2.0),
-        ('cybersecurity assessment', 'it_consulting', 2.5),
-        ('security audit', 'it_consulting', 2.0),
-        ('penetration testing', 'it_consulting', 2.0),
-        ('IT audit', 'it_consulting', 2.0),
-        ('technology roadmap', 'it_consulting', 2.5),
-        ('enterprise architecture', 'it_consulting', 2.5),
-        ('cloud migration', 'it_consulting', 2.0),
-        ('cloud assessment', 'it_consulting', 2.0),
-        ('data center', 'it_consulting', 1.5),
-
-        # Software & Systems
-        ('software implementation', 'software', 2.0),
-        ('ERP implementation', 'software', 2.5),
-        ('ERP assessment', 'software', 2.5),
-        ('financial system', 'software', 2.0),
-        ('HRIS', 'software', 1.5),
-        ('human resources system', 'software', 1.5),
-        ('permitting software', 'software', 2.0),
-        ('utility billing', 'software', 1.5),
-        ('asset management system', 'software', 2.0),
-        ('work order system', 'software', 1.5),
-        ('GIS', 'software', 1.5),
-        ('document management', 'software', 1.5),
-        ('records management', 'software', 1.5),
-
-        # Studies & Analysis
-        ('feasibility study', 'study', 2.5),
-        ('feasibility assessment', 'study', 2.5),
-        ('needs assessment', 'study', 2.0),
-        ('gap analysis', 'study', 2.0),
-        ('business process', 'study', 2.0),
-        ('process improvement', 'study', 2.0),
-        ('workflow analysis', 'study', 2.0),
-        ('cost benefit analysis', 'study', 2.0),
-        ('return on investment', 'study', 1.5),
-        ('benchmark', 'study', 1.5),
-        ('best practices', 'study', 1.5),
-
-        # Professional Services
-        ('management consulting', 'professional_services', 2.0),
-        ('organizational assessment', 'professional_services', 2.0),
-        ('staffing study', 'professional_services', 2.0),
-        ('performance audit', 'professional_services', 2.0),
-        ('operational review', 'professional_services', 2.0),
-        ('efficiency study', 'professional_services', 2.0),
-        ('strategic planning', 'professional_services', 2.0),
-        ('master plan', 'professional_services', 1.5),
-        ('comprehensive plan', 'professional_services', 1.5),
-
-        # Data & Analytics
-        ('data analytics', 'data', 2.0),
-        ('business intelligence', 'data', 2.0),
-        ('dashboard', 'data', 1.5),
-        ('reporting system', 'data', 1.5),
-        ('data warehouse', 'data', 2.0),
-        ('data governance', 'data', 2.0),
-        ('data migration', 'data', 2.0),
-    ]
-
     conn = get_connection()
     cursor = conn.cursor()
 
-    for keyword, category, weight in keywords:
-        try:
-            cursor.execute('''
-                INSERT OR IGNORE INTO rfp_keywords (keyword, category, weight)
-                VALUES (?, ?, ?)
-            ''', (keyword, category, weight))
-        except sqlite3.Error as e:
-            logger.error(f"Error inserting RFP keyword {keyword}: {e}")
+    try:
+        cursor.executemany('''
+            INSERT OR IGNORE INTO rfp_keywords (keyword, category, weight)
+            VALUES (?, ?, ?)
+        ''', _SEED_RFP_KEYWORDS)
+    except sqlite3.Error as e:
+        logger.error(f"Error inserting RFP keywords: {e}")
 
     conn.commit()
     conn.close()
-    logger.info(f"Seeded {len(keywords)} RFP keywords")
+    logger.info(f"Seeded {len(_SEED_RFP_KEYWORDS)} RFP keywords")
 
 
 # ============== RFP Operations ==============
 
+# An existing RFP is left as is (the no-op update only makes RETURNING yield its ID)
+_INSERT_RFP_SQL = '''
+    INSERT INTO rfps (entity_id, title, description, solicitation_number, rfp_type,
+                    category, status, posted_date, due_date, estimated_value,
+                    source_url, source_portal, contact_name, contact_email,
+                    contact_phone, attachments_url, is_relevant, relevance_score,
+                    is_quick_response, response_deadline_hours, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(solicitation_number, source_portal) DO UPDATE SET solicitation_number = excluded.solicitation_number
+    RETURNING id
+'''
+
+
+def _rfp_params(title: str, fields: Dict) -> tuple:
+    """Bind parameters for _INSERT_RFP_SQL, with the column defaults applied."""
+    return (fields.get('entity_id'), title, fields.get('description'),
+            fields.get('solicitation_number'), fields.get('rfp_type'),
+            fields.get('category'), fields.get('status', 'open'),
+            fields.get('posted_date'), fields.get('due_date'),
+            fields.get('estimated_value'), fields.get('source_url'),
+            fields.get('source_portal'), fields.get('contact_name'),
+            fields.get('contact_email'), fields.get('contact_phone'),
+            fields.get('attachments_url'), fields.get('is_relevant', 0),
+            fields.get('relevance_score', 0), fields.get('is_quick_response', 0),
+            fields.get('response_deadline_hours'), fields.get('notes'))
+
+
 def create_rfp(title: str, **kwargs) -> int:
     """Create a new RFP and return its ID."""
-    conn = get_connection()
-    cursor = conn.cursor()
+    with get_connection() as conn:
+        return conn.execute(_INSERT_RFP_SQL, _rfp_params(title, kwargs)).fetchone()['id']
 
-    try:
-        cursor.execute('''
-            INSERT INTO rfps (entity_id, title, description, solicitation_number, rfp_type,
-                            category, status, posted_date, due_date, estimated_value,
-                            source_url, source_portal, contact_name, contact_email,
-                            contact_phone, attachments_url, is_relevant, relevance_score,
-                            is_quick_response, response_deadline_hours, notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (kwargs.get('entity_id'), title, kwargs.get('description'),
-              kwargs.get('solicitation_number'), kwargs.get('rfp_type'),
-              kwargs.get('category'), kwargs.get('status', 'open'),
-              kwargs.get('posted_date'), kwargs.get('due_date'),
-              kwargs.get('estimated_value'), kwargs.get('source_url'),
-              kwargs.get('source_portal'), kwargs.get('contact_name'),
-              kwargs.get('contact_email'), kwargs.get('contact_phone'),
-              kwargs.get('attachments_url'), kwargs.get('is_relevant', 0),
-              kwargs.get('relevance_score', 0), kwargs.get('is_quick_response', 0),
-              kwargs.get('response_deadline_hours'), kwargs.get('notes')))
-        conn.commit()
-        rfp_id = cursor.lastrowid
-    except sqlite3.IntegrityError:
-        # RFP already exists
-        cursor.execute('SELECT id FROM rfps WHERE solicitation_number = ? AND source_portal = ?',
-                      (kwargs.get('solicitation_number'), kwargs.get('source_portal')))
-        row = cursor.fetchone()
-        rfp_id = row['id'] if row else None
 
-    conn.close()
-    return rfp_id
+def create_rfps_bulk(rfps: Iterable[Dict]) -> List[int]:
+    """
+    Create many RFPs in a single transaction.
+
+    Args:
+        rfps: Dicts holding 'title' plus any of create_rfp's keyword fields
+
+    Returns:
+        The ID of each RFP, in input order (existing RFPs keep theirs)
+    """
+    with get_connection() as conn:
+        # One commit for the whole batch; the statement is prepared once and reused per row.
+        # executemany can't return the IDs, since it doesn't support RETURNING.
+        return [conn.execute(_INSERT_RFP_SQL, _rfp_params(rfp['title'], rfp)).fetchone()['id']
+                for rfp in rfps]
 
 
 def get_rfp(rfp_id: int) -> Optional[Dict]:
     """Get RFP by ID with entity info."""
+    with get_connection() as conn:
+        row = conn.execute('''
+            SELECT r.*, e.name as entity_name, e.entity_type, e.state
+            FROM rfps r
+            LEFT JOIN entities e ON r.entity_id = e.id
+            WHERE r.id = ?
+        ''', (rfp_id,)).fetchone()
+    return dict(row) if row else None
+
+
+def get_rfps_by_ids(rfp_ids: Iterable[int]) -> List[Dict]:
+    """Get several RFPs with entity info in one query per 500 IDs, in the order given."""
+    rfp_ids = list(dict.fromkeys(rfp_ids))
+    found = {}
+
     conn = get_connection()
     cursor = conn.cursor()
-    cursor.execute('''
-        SELECT r.*, e.name as entity_name, e.entity_type, e.state
-        FROM rfps r
-        LEFT JOIN entities e ON r.entity_id = e.id
-        WHERE r.id = ?
-    ''', (rfp_id,))
-    row = cursor.fetchone()
+    for start in range(0, len(rfp_ids), 500):
+        chunk = rfp_ids[start:start + 500]
+        cursor.execute(f'''
+            SELECT r.*, e.name as entity_name, e.entity_type, e.state
+            FROM rfps r
+            LEFT JOIN entities e ON r.entity_id = e.id
+            WHERE r.id IN ({','.join('?' * len(chunk))})
+        ''', chunk)
+        for row in cursor.fetchall():
+            found[row['id']] = dict(row)
     conn.close()
-    return dict(row) if row else None
+
+    return [found[rfp_id] for rfp_id in rfp_ids if rfp_id in found]
 
 
 def get_all_rfps(status: str = None, relevant_only: bool = False, category: str = None,
                   quick_only: bool = False, rfp_type: str = None, search: str = None) -> List[Dict]:
     """Get all RFPs with optional filtering."""
-    conn = get_connection()
-    cursor = conn.cursor()
-
     query = '''
         SELECT r.*, e.name as entity_name, e.entity_type, e.state
         FROM rfps r
@@ -988,17 +1418,12 @@ def get_all_rfps(status: str = None, relevant_only: bool = False, category: str
 
     query += ' ORDER BY r.is_quick_response DESC, r.due_date ASC, r.relevance_score DESC'
 
-    cursor.execute(query, params)
-    rows = cursor.fetchall()
-    conn.close()
-    return [dict(row) for row in rows]
+    with get_connection() as conn:
+        return list(map(dict, conn.execute(query, params)))
 
 
 def get_open_rfps(relevant_only: bool = True) -> List[Dict]:
     """Get all open RFPs, optionally filtered to relevant ones."""
-    conn = get_connection()
-    cursor = conn.cursor()
-
     query = '''
         SELECT r.*, e.name as entity_name, e.entity_type, e.state
         FROM rfps r
@@ -1012,17 +1437,12 @@ def get_open_rfps(relevant_only: bool = True) -> List[Dict]:
 
     query += ' ORDER BY r.due_date ASC, r.relevance_score DESC'
 
-    cursor.execute(query)
-    rows = cursor.fetchall()
-    conn.close()
-    return [dict(row) for row in rows]
+    with get_connection() as conn:
+        return list(map(dict, conn.execute(query)))
 
 
 def update_rfp(rfp_id: int, **kwargs) -> bool:
     """Update an RFP."""
-    conn = get_connection()
-    cursor = conn.cursor()
-
     valid_fields = ['title', 'description', 'status', 'category', 'due_date',
                    'is_relevant', 'relevance_score', 'notes']
     updates = []
@@ -1040,66 +1460,91 @@ def update_rfp(rfp_id: int, **kwargs) -> bool:
     params.append(rfp_id)
 
     query = f'UPDATE rfps SET {", ".join(updates)} WHERE id = ?'
-    cursor.execute(query, params)
-    conn.commit()
-    success = cursor.rowcount > 0
-    conn.close()
-    return success
+    with get_connection() as conn:
+        return conn.execute(query, params).rowcount > 0
+
+
+def bulk_update_rfp_scores(rows: Iterable[tuple]) -> int:
+    """
+    Update many RFPs' scores in a single transaction.
+    Each row is (relevance_score, is_relevant, category, rfp_id).
+    Returns the number of RFPs updated.
+    """
+    with get_connection() as conn:
+        return conn.executemany('''
+            UPDATE rfps SET relevance_score = ?, is_relevant = ?, category = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        ''', rows).rowcount
+
+
+def iter_rfps(batch: int = 500) -> Iterator[List[Dict]]:
+    """
+    Yield every RFP in pages of `batch` rows, ordered by ID.
+    Each page is its own short query, so no read transaction stays open
+    while the caller writes between pages.
+    """
+    last_id = 0
+    while True:
+        conn = get_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT * FROM rfps WHERE id > ? ORDER BY id LIMIT ?', (last_id, batch))
+        rows = [dict(row) for row in cursor.fetchall()]
+        conn.close()
+
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1]['id']
 
 
 def get_rfp_keywords() -> List[Dict]:
     """Get all active RFP keywords."""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute('SELECT * FROM rfp_keywords WHERE is_active = 1 ORDER BY weight DESC')
-    rows = cursor.fetchall()
-    conn.close()
-    return [dict(row) for row in rows]
+    with get_connection() as conn:
+        return list(map(dict, conn.execute('SELECT * FROM rfp_keywords WHERE is_active = 1 ORDER BY weight DESC')))
 
 
 def get_rfp_stats() -> Dict:
     """Get RFP statistics for dashboard."""
-    conn = get_connection()
-    cursor = conn.cursor()
-
     stats = {}
 
-    # Total RFPs
-    cursor.execute('SELECT COUNT(*) as count FROM rfps')
-    stats['total_rfps'] = cursor.fetchone()['count']
+    with get_connection() as conn:
+        cursor = conn.cursor()
 
-    # Open RFPs
-    cursor.execute("SELECT COUNT(*) as count FROM rfps WHERE status = 'open'")
-    stats['open_rfps'] = cursor.fetchone()['count']
+        # Total RFPs
+        cursor.execute('SELECT COUNT(*) as count FROM rfps')
+        stats['total_rfps'] = cursor.fetchone()['count']
 
-    # Relevant RFPs (IT/consulting)
-    cursor.execute('SELECT COUNT(*) as count FROM rfps WHERE is_relevant = 1')
-    stats['relevant_rfps'] = cursor.fetchone()['count']
+        # Open RFPs
+        cursor.execute("SELECT COUNT(*) as count FROM rfps WHERE status = 'open'")
+        stats['open_rfps'] = cursor.fetchone()['count']
 
-    # Closing soon (within 7 days)
-    cursor.execute('''
-        SELECT COUNT(*) as count FROM rfps
-        WHERE status = 'open' AND due_date BETWEEN datetime('now') AND datetime('now', '+7 days')
-    ''')
-    stats['closing_soon'] = cursor.fetchone()['count']
+        # Relevant RFPs (IT/consulting)
+        cursor.execute('SELECT COUNT(*) as count FROM rfps WHERE is_relevant = 1')
+        stats['relevant_rfps'] = cursor.fetchone()['count']
 
-    # By category
-    cursor.execute('''
-        SELECT category, COUNT(*) as count FROM rfps
-        WHERE category IS NOT NULL AND is_relevant = 1
-        GROUP BY category ORDER BY count DESC
-    ''')
-    stats['by_category'] = {row['category']: row['count'] for row in cursor.fetchall()}
+        # Closing soon (within 7 days)
+        cursor.execute('''
+            SELECT COUNT(*) as count FROM rfps
+            WHERE status = 'open' AND due_date BETWEEN datetime('now') AND datetime('now', '+7 days')
+        ''')
+        stats['closing_soon'] = cursor.fetchone()['count']
 
-    # By source portal
-    cursor.execute('''
-        SELECT source_portal, COUNT(*) as count FROM rfps
-        WHERE source_portal IS NOT NULL
-        GROUP BY source_portal ORDER BY count DESC
-    ''')
-    stats['by_portal'] = {row['source_portal']: row['count'] for row in cursor.fetchall()}
+        # By category
+        cursor.execute('''
+            SELECT category, COUNT(*) as count FROM rfps
+            WHERE category IS NOT NULL AND is_relevant = 1
+            GROUP BY category ORDER BY count DESC
+        ''')
+        stats['by_category'] = {row['category']: row['count'] for row in cursor.fetchall()}
+
+        # By source portal
+        cursor.execute('''
+            SELECT source_portal, COUNT(*) as count FROM rfps
+            WHERE source_portal IS NOT NULL
+            GROUP BY source_portal ORDER BY count DESC
+        ''')
+        stats['by_portal'] = {row['source_portal']: row['count'] for row in cursor.fetchall()}
 
-    conn.close()
     return stats
 
 
@@ -0,0 +1,221 @@
+"""
+Article de-duplication helpers for discovery runs.
+Canonicalizes URLs and fingerprints article text so syndicated copies,
+AMP pages and tracking-parameter variants are only processed once.
+"""
+
+import os
+import re
+import math
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Optional
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+
+from . import database as db
+
+logger = logging.getLogger(__name__)
+
+# Where the persisted filters live (next to the SQLite database)
+DATA_DIR = os.path.dirname(db.DB_PATH)
+URL_FILTER_PATH = os.path.join(DATA_DIR, 'article_urls.bloom')
+CONTENT_FILTER_PATH = os.path.join(DATA_DIR, 'article_fingerprints.bloom')
+
+# Query parameters that only track the click, not the content
+TRACKING_PARAMS = {'fbclid', 'gclid', 'ocid', 'cmpid', 'ref', 'outputtype', 'amp'}
+
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a URL so trivially different links to the same article compare equal."""
+    parsed = urlparse(url.strip())
+
+    host = parsed.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+
+    # Drop AMP path segments (/amp/, trailing /amp)
+    path = re.sub(r'/amp(?=/|$)', '', parsed.path) or '/'
+    if len(path) > 1:
+        path = path.rstrip('/')
+
+    query = [(k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+             if not k.lower().startswith('utm_') and k.lower() not in TRACKING_PARAMS]
+
+    return urlunparse((parsed.scheme.lower() or 'https', host, path, '', urlencode(sorted(query)), ''))
+
+
+def simhash(text: str) -> int:
+    """
+    Compute a 64-bit simhash of article text.
+    Digits are dropped first so dates, view counts and timestamps don't change the fingerprint.
+    """
+    words = re.findall(r'[a-z]+', re.sub(r'\d+', ' ', text.lower()))
+    if not words:
+        return 0
+
+    vector = [0] * 64
+    for word in words:
+        h = int.from_bytes(hashlib.blake2b(word.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(64):
+            vector[bit] += 1 if h >> bit & 1 else -1
+
+    return sum(1 << bit for bit in range(64) if vector[bit] > 0)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings, persisted as a small binary file."""
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 1e-4):
+        """
+        Initialize the filter.
+
+        Args:
+            capacity: Expected number of items
+            error_rate: Target false-positive rate at capacity
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:], 'big') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str):
+        """Add an item to the filter."""
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def save(self, path: str):
+        """Write the filter to disk."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        header = f"{self.capacity} {self.error_rate} {self.count}\n".encode('ascii')
+        with open(path, 'wb') as f:
+            f.write(header)
+            f.write(self.bits)
+
+    @classmethod
+    def load(cls, path: str, capacity: int = 1_000_000, error_rate: float = 1e-4) -> 'BloomFilter':
+        """Load a filter from disk, or return an empty one if it doesn't exist yet."""
+        if not os.path.exists(path):
+            return cls(capacity, error_rate)
+
+        with open(path, 'rb') as f:
+            header = f.readline().decode('ascii').split()
+            bloom = cls(int(header[0]), float(header[1]))
+            bloom.count = int(header[2])
+            bloom.bits = bytearray(f.read())
+        return bloom
+
+
+class ScalableBloomFilter:
+    """
+    Bloom filter that adds larger, stricter stages as it fills, so memory grows
+    with the number of items while the overall false-positive rate stays bounded.
+    """
+
+    def __init__(self, initial_capacity: int = 1_000_000, error_rate: float = 1e-4,
+                 growth: int = 2, tightening: float = 0.5):
+        self.error_rate = error_rate
+        self.growth = growth
+        self.tightening = tightening
+        self.stages = [BloomFilter(initial_capacity, error_rate * (1 - tightening))]
+
+    def add(self, item: str):
+        """Add an item, opening a new stage once the current one is at capacity."""
+        stage = self.stages[-1]
+        if stage.count >= stage.capacity:
+            stage = BloomFilter(stage.capacity * self.growth, stage.error_rate * self.tightening)
+            self.stages.append(stage)
+        stage.add(item)
+
+    def __contains__(self, item: str) -> bool:
+        return any(item in stage for stage in self.stages)
+
+    def __len__(self) -> int:
+        return sum(stage.count for stage in self.stages)
+
+
+class SeenURLs:
+    """
+    Memory-bounded "already processed?" set for canonical URLs.
+    A small exact LRU answers repeats of recently seen URLs; everything else
+    goes through a scalable Bloom filter, where a rare false positive just skips one article.
+    """
+
+    def __init__(self, recent_size: int = 1024, initial_capacity: int = 1_000_000,
+                 error_rate: float = 1e-4):
+        self.recent_size = recent_size
+        self.recent = OrderedDict()
+        self.bloom = ScalableBloomFilter(initial_capacity, error_rate)
+
+    def check_and_add(self, url: str) -> bool:
+        """Record a URL; return True if it had already been recorded."""
+        if url in self.recent:
+            self.recent.move_to_end(url)
+            return True
+
+        self.recent[url] = None
+        if len(self.recent) > self.recent_size:
+            self.recent.popitem(last=False)
+
+        if url in self.bloom:
+            return True
+        self.bloom.add(url)
+        return False
+
+    def __len__(self) -> int:
+        return len(self.bloom)
+
+
+class ArticleFingerprints:
+    """Persistent record of article URLs and content already processed."""
+
+    def __init__(self, url_path: str = None, content_path: str = None):
+        self.url_path = url_path or URL_FILTER_PATH
+        self.content_path = content_path or CONTENT_FILTER_PATH
+        self.urls = BloomFilter.load(self.url_path)
+        self.contents = BloomFilter.load(self.content_path)
+
+    def seen_url(self, url: str) -> bool:
+        """Check whether a (canonicalized) URL was processed in this or an earlier run."""
+        return canonicalize_url(url) in self.urls
+
+    def add_url(self, url: str):
+        """Record a URL as processed."""
+        self.urls.add(canonicalize_url(url))
+
+    def check_and_add_content(self, text: str) -> Optional[bool]:
+        """
+        Record an article's text fingerprint.
+        Returns True if an identical fingerprint was already recorded, False otherwise,
+        and None when the text is too short to fingerprint reliably.
+        """
+        if not text or len(text) < 200:
+            return None
+
+        fingerprint = format(simhash(text), '016x')
+        if fingerprint in self.contents:
+            return True
+        self.contents.add(fingerprint)
+        return False
+
+    def save(self):
+        """Persist both filters so the next run skips what this one processed."""
+        self.urls.save(self.url_path)
+        self.contents.save(self.content_path)
+        logger.info(f"Saved article fingerprints ({len(self.urls)} URLs, {len(self.contents)} articles)")
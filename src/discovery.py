@@ -3,16 +3,33 @@ Discovery Engine for Procurement Intelligence Tool.
 Handles scraping news sources and identifying potential opportunities.
 """
 
+import os
 import re
 import logging
+import asyncio
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
-from urllib.parse import urljoin, urlparse
-import time
+from typing import List, Dict, Optional, Tuple, Iterator
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urljoin, urlparse, quote_plus
 
 from . import database as db
+from . import seed_data
+from .dedup import ArticleFingerprints
+from .rate_limit import HostRateLimiter
+from .http_cache import HTTPCache, TTLCache, SEED_EXPIRE_AFTER
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -25,18 +42,7 @@ HEADERS = {
 }
 
 # Florida counties for entity extraction
-FLORIDA_COUNTIES = [
-    'Alachua', 'Baker', 'Bay', 'Bradford', 'Brevard', 'Broward', 'Calhoun',
-    'Charlotte', 'Citrus', 'Clay', 'Collier', 'Columbia', 'DeSoto', 'Dixie',
-    'Duval', 'Escambia', 'Flagler', 'Franklin', 'Gadsden', 'Gilchrist',
-    'Glades', 'Gulf', 'Hamilton', 'Hardee', 'Hendry', 'Hernando', 'Highlands',
-    'Hillsborough', 'Holmes', 'Indian River', 'Jackson', 'Jefferson', 'Lafayette',
-    'Lake', 'Lee', 'Leon', 'Levy', 'Liberty', 'Madison', 'Manatee', 'Marion',
-    'Martin', 'Miami-Dade', 'Monroe', 'Nassau', 'Okaloosa', 'Okeechobee',
-    'Orange', 'Osceola', 'Palm Beach', 'Pasco', 'Pinellas', 'Polk', 'Putnam',
-    'Santa Rosa', 'Sarasota', 'Seminole', 'St. Johns', 'St. Lucie', 'Sumter',
-    'Suwannee', 'Taylor', 'Union', 'Volusia', 'Wakulla', 'Walton', 'Washington'
-]
+FLORIDA_COUNTIES = [name for name, _ in seed_data.florida_counties()]
 
 # Entity type patterns - improved for better extraction
 ENTITY_PATTERNS = [
@@ -54,42 +60,258 @@ ENTITY_PATTERNS = [
     (r'FPL|Florida\s+Power', 'utility'),
 ]
 
-# Major Florida cities for direct matching
-FLORIDA_CITIES = [
-    'Jacksonville', 'Miami', 'Tampa', 'Orlando', 'St. Petersburg', 'Hialeah',
-    'Port St. Lucie', 'Cape Coral', 'Tallahassee', 'Fort Lauderdale',
-    'Pembroke Pines', 'Hollywood', 'Gainesville', 'Miramar', 'Coral Springs',
-    'Clearwater', 'Miami Gardens', 'Palm Bay', 'Pompano Beach', 'West Palm Beach',
-    'Lakeland', 'Davie', 'Boca Raton', 'Sunrise', 'Deltona', 'Plantation',
-    'Fort Myers', 'Deerfield Beach', 'Palm Coast', 'Melbourne', 'Boynton Beach',
-    'Largo', 'Kissimmee', 'Homestead', 'Doral', 'Tamarac', 'Delray Beach',
-    'Daytona Beach', 'Weston', 'North Port', 'Wellington', 'North Miami',
-    'Jupiter', 'Ocala', 'Port Orange', 'Margate', 'Coconut Creek', 'Sanford',
-    'Sarasota', 'Pensacola', 'Bradenton', 'St. Cloud', 'Winter Haven', 'Apopka',
+# Compiled once at import. The JEA pattern is left out since extract_entities checks for JEA first.
+# The patterns stay separate rather than one alternation: they overlap (e.g. "X County School Board"
+# also matches "X County"), and a single scan would report only one of them per position.
+COMPILED_ENTITY_PATTERNS = [(re.compile(pattern, re.IGNORECASE), entity_type)
+                            for pattern, entity_type in ENTITY_PATTERNS
+                            if not (entity_type == 'utility' and 'JEA' in pattern)]
+
+# Captured words that are never entity names
+ENTITY_STOPWORDS = frozenset(['the', 'a', 'an', 'by', 'to', 'in', 'for', 'and', 'or', 'this'])
+
+# Class-name patterns for locating the title, body and date in article HTML
+TITLE_CLASS_RE = re.compile(r'title|headline', re.I)
+CONTENT_CLASS_RE = re.compile(r'article|content|story|post', re.I)
+DATE_CLASS_RE = re.compile(r'date|time|published', re.I)
+
+
+def _xpath(expression: str) -> etree.XPath:
+    """Compile an XPath expression that may use EXSLT regular expressions (re:test)."""
+    return etree.XPath(expression, namespaces={'re': 'http://exslt.org/regular-expressions'})
+
+
+# Candidates for the article title, body and date, tried in order; each yields its first match.
+# Kept as separate expressions since an XPath union would return document order, not priority order.
+TITLE_XPATHS = [
+    _xpath(f"(//h1[re:test(@class, '{TITLE_CLASS_RE.pattern}', 'i')])[1]"),
+    _xpath('(//h1)[1]'),
+    _xpath("(//meta[@property='og:title'])[1]"),
+    _xpath('(//title)[1]'),
+]
+CONTENT_XPATHS = [
+    _xpath('(//article)[1]'),
+    _xpath(f"(//div[re:test(@class, '{CONTENT_CLASS_RE.pattern}', 'i')])[1]"),
+    _xpath('(//main)[1]'),
+]
+DATE_XPATHS = [
+    _xpath("(//meta[@property='article:published_time'])[1]"),
+    _xpath("(//meta[@property='og:published_time'])[1]"),
+    _xpath('(//time)[1]'),
+    _xpath(f"(//*[re:test(@class, '{DATE_CLASS_RE.pattern}', 'i')])[1]"),
 ]
 
+# Elements whose contents are never page text
+CODE_TAGS = ('script', 'style')
+
+# Page furniture dropped from the article body before taking its text
+NON_CONTENT_TAGS = CODE_TAGS + ('nav', 'header', 'footer')
+
+
+def _parse_html(html: str) -> Optional[lxml.html.HtmlElement]:
+    """Parse a page with lxml, or return None if there is nothing to parse."""
+    try:
+        return lxml.html.fromstring(html)
+    except ValueError:
+        # lxml refuses str input that carries an XML encoding declaration
+        return lxml.html.fromstring(html.encode('utf-8'))
+    except etree.ParserError:
+        return None
+
+
+def _collapse_blank(text: str) -> str:
+    """Collapse whitespace-only text to one newline or space, as BeautifulSoup did for these pages."""
+    if text.strip(' \t\n\r\f'):
+        return text
+    return '\n' if '\n' in text else ' '
+
+
+def _visible_text(node: lxml.html.HtmlElement, skip: Tuple[str, ...] = CODE_TAGS) -> Iterator[str]:
+    """Yield the text pieces of a node, skipping comments and the subtrees of `skip` tags."""
+    if node.text and node.tag not in skip:
+        yield _collapse_blank(node.text)
+    for child in node:
+        if isinstance(child.tag, str) and child.tag not in skip:
+            yield from _visible_text(child, skip)
+        if child.tail:
+            yield _collapse_blank(child.tail)
+
+
+def _first(expressions: List[etree.XPath], doc: lxml.html.HtmlElement) -> Iterator:
+    """Yield the first match of each expression that matches, in order."""
+    for expression in expressions:
+        found = expression(doc)
+        if found:
+            yield found[0]
+
+
+# Lowercased once for the substring checks in extract_entities
+_FLORIDA_COUNTIES_LOWER = [(name.lower(), name) for name in FLORIDA_COUNTIES]
+
+# Major Florida cities for direct matching
+FLORIDA_CITIES = [name for name, _, _ in seed_data.florida_cities()]
+
+
+class RateLimitedError(Exception):
+    """Raised by the async fetchers when a server answers 429 Too Many Requests."""
+
+
+def google_news_rss_url(encoded_query: str) -> str:
+    """Build the Google News RSS search URL for an already URL-encoded query."""
+    return f"https://news.google.com/rss/search?q={encoded_query}&hl=en-US&gl=US&ceid=US:en"
+
 
 class DiscoveryEngine:
     """Engine for discovering procurement-related opportunities from news sources."""
 
-    def __init__(self):
-        self.keywords = db.get_all_keywords()
-        self.keyword_patterns = self._compile_keyword_patterns()
+    def __init__(self, keywords: List[Dict] = None):
+        self.keywords = keywords if keywords is not None else db.get_all_keywords()
+        self.keyword_automaton = self._build_keyword_automaton()
+        self._keyword_patterns = None
+
+        # One keep-alive pool for blocking fetches so TCP/TLS handshakes are reused
+        self.session = requests.Session()
+        self.session.headers.update(HEADERS)
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=100,
+                              max_retries=Retry(total=2, backoff_factor=0.3))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Async session is created on __aenter__, since aiohttp needs a running event loop
+        self.async_session: Optional[aiohttp.ClientSession] = None
+
+        # HTML parsing and scoring run in worker processes during async runs
+        self.pool: Optional[ProcessPoolExecutor] = None
+
+        # Re-runs reuse previously downloaded pages instead of re-fetching them
+        self.http_cache = HTTPCache()
+        # Search results are memoized in-process for an hour; pages go through the disk cache
+        self.search_cache = TTLCache(maxsize=4096, ttl=3600)
+
+        # Politeness is enforced per host, so different sites are fetched in parallel
+        self.host_limiter = HostRateLimiter(rate=2, per=1.0)
+
+        # Optional cross-run duplicate detection; bulk runs set this, one-off adds don't
+        self.fingerprints: Optional[ArticleFingerprints] = None
+
+    async def __aenter__(self):
+        """Open the shared aiohttp session used by the async methods."""
+        self.async_session = aiohttp.ClientSession(
+            headers=HEADERS,
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=8,
+                                           ttl_dns_cache=300, keepalive_timeout=60),
+        )
+        return self
 
-    def _compile_keyword_patterns(self) -> List[Tuple[re.Pattern, Dict]]:
-        """Compile keyword patterns for efficient matching."""
-        patterns = []
-        for kw in self.keywords:
+    async def prewarm(self, urls: List[str] = None) -> int:
+        """
+        Open a keep-alive connection to each host we expect to fetch from, so DNS and
+        TLS setup happen up front instead of on the first query's critical path.
+        Defaults to Google News plus every active source. Returns the number of hosts reached.
+        """
+        if urls is None:
+            urls = ['https://news.google.com/'] + [source['url'] for source in db.iter_sources() if source['url']]
+
+        # One request per host is enough to populate the DNS cache and connection pool
+        hosts = {}
+        for url in urls:
+            parsed = urlparse(url)
+            if parsed.scheme and parsed.netloc:
+                hosts.setdefault(parsed.netloc.lower(), f"{parsed.scheme}://{parsed.netloc}/")
+
+        async def head(url):
+            await self.host_limiter.acquire_async(url)
+            try:
+                async with self.async_session.head(url, allow_redirects=True,
+                                                   timeout=aiohttp.ClientTimeout(total=10)):
+                    return True
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.debug(f"Prewarm failed for {url}: {e}")
+                return False
+
+        reached = sum(await asyncio.gather(*(head(url) for url in hosts.values())))
+        logger.info(f"Prewarmed connections to {reached}/{len(hosts)} hosts")
+        return reached
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the shared aiohttp session and analysis workers."""
+        if self.async_session:
+            await self.async_session.close()
+            self.async_session = None
+        if self.pool:
+            self.pool.shutdown(wait=True)
+            self.pool = None
+
+    def close(self):
+        """Close the blocking HTTP session."""
+        self.session.close()
+
+    def get_keyword_patterns(self) -> List[Tuple[re.Pattern, Dict]]:
+        """
+        Build (on first use) and return one whole-word regex per keyword.
+        Only needed without pyahocorasick, or for text the automaton can't scan.
+        """
+        if self._keyword_patterns is None:
             # Create case-insensitive pattern for each keyword
-            pattern = re.compile(r'\b' + re.escape(kw['keyword']) + r'\b', re.IGNORECASE)
-            patterns.append((pattern, kw))
-        return patterns
+            self._keyword_patterns = [(re.compile(r'\b' + re.escape(kw['keyword']) + r'\b', re.IGNORECASE), kw)
+                                      for kw in self.keywords]
+        return self._keyword_patterns
 
-    def fetch_page(self, url: str) -> Optional[str]:
-        """Fetch a web page and return its HTML content."""
+    def _build_keyword_automaton(self):
+        """
+        Build an Aho-Corasick automaton over all keywords, so one pass over an article finds
+        every keyword instead of running one regex per keyword. None without pyahocorasick.
+        """
+        if not AHOCORASICK_AVAILABLE or not self.keywords:
+            return None
+        automaton = ahocorasick.Automaton()
+        for index, kw in enumerate(self.keywords):
+            automaton.add_word(kw['keyword'].lower(), index)
+        automaton.make_automaton()
+        return automaton
+
+    def count_keywords(self, content: str) -> List[Tuple[Dict, int]]:
+        """
+        Count whole-word, case-insensitive occurrences of each keyword in content.
+        Returns (keyword row, count) for every keyword present.
+        """
+        content_lower = content.lower()
+        if self.keyword_automaton is None or len(content_lower) != len(content):
+            # Lowercasing changed the length (rare Unicode), so offsets wouldn't line up
+            counts = [(kw, len(pattern.findall(content))) for pattern, kw in self.get_keyword_patterns()]
+            return [(kw, count) for kw, count in counts if count]
+
+        def is_word(i: int) -> bool:
+            return 0 <= i < len(content_lower) and (content_lower[i].isalnum() or content_lower[i] == '_')
+
+        counts = Counter()
+        last_end = {}
+        for end, index in self.keyword_automaton.iter(content_lower):
+            start = end - len(self.keywords[index]['keyword']) + 1
+            # Same rules as the \b...\b patterns: word boundaries at both ends, no overlaps
+            if (is_word(start - 1) != is_word(start) and is_word(end) != is_word(end + 1)
+                    and start > last_end.get(index, -1)):
+                counts[index] += 1
+                last_end[index] = end
+
+        return [(kw, counts[index]) for index, kw in enumerate(self.keywords) if counts[index]]
+
+    def fetch_page(self, url: str, use_cache: bool = True) -> Optional[str]:
+        """Fetch a web page and return its HTML content, served from the disk cache when possible."""
+        cached = self.http_cache.get(url) if use_cache else None
+        if cached and self.http_cache.is_fresh(cached):
+            return cached['body']
+
+        self.host_limiter.acquire(url)
         try:
-            response = requests.get(url, headers=HEADERS, timeout=30)
+            response = self.session.get(url, headers=HTTPCache.conditional_headers(cached), timeout=30)
+            if cached and response.status_code == 304:
+                self.http_cache.touch(url)
+                return cached['body']
             response.raise_for_status()
+            if use_cache:
+                self.http_cache.store(url, response.text, response.headers.get('ETag'),
+                                      response.headers.get('Last-Modified'))
             return response.text
         except requests.RequestException as e:
             logger.error(f"Error fetching {url}: {e}")
@@ -97,57 +319,38 @@ class DiscoveryEngine:
 
     def extract_article_content(self, html: str, url: str) -> Dict:
         """Extract article title, content, and metadata from HTML."""
-        soup = BeautifulSoup(html, 'lxml')
+        doc = _parse_html(html)
+        if doc is None:
+            return {'title': 'Unknown Title', 'content': '', 'published_date': None, 'url': url}
 
         # Try to find the title
         title = None
-        title_candidates = [
-            soup.find('h1', class_=re.compile(r'title|headline', re.I)),
-            soup.find('h1'),
-            soup.find('meta', property='og:title'),
-            soup.find('title'),
-        ]
-        for candidate in title_candidates:
-            if candidate:
-                title = candidate.get('content') if candidate.name == 'meta' else candidate.get_text()
-                if title:
-                    title = title.strip()
-                    break
+        for candidate in _first(TITLE_XPATHS, doc):
+            title = candidate.get('content') if candidate.tag == 'meta' else ''.join(_visible_text(candidate))
+            if title:
+                title = title.strip()
+                break
 
         # Try to find the main content
         content = ''
-        content_candidates = [
-            soup.find('article'),
-            soup.find('div', class_=re.compile(r'article|content|story|post', re.I)),
-            soup.find('main'),
-        ]
-        for candidate in content_candidates:
-            if candidate:
-                # Remove script and style elements
-                for script in candidate(['script', 'style', 'nav', 'header', 'footer']):
-                    script.decompose()
-                content = candidate.get_text(separator=' ', strip=True)
-                break
+        for candidate in _first(CONTENT_XPATHS, doc):
+            content = ' '.join(text.strip() for text in _visible_text(candidate, NON_CONTENT_TAGS) if text.strip())
+            # Also drop those elements from the page, so the date lookup below skips them too
+            etree.strip_elements(candidate, *NON_CONTENT_TAGS, with_tail=False)
+            break
 
         # Try to find published date
         published_date = None
-        date_candidates = [
-            soup.find('meta', property='article:published_time'),
-            soup.find('meta', property='og:published_time'),
-            soup.find('time'),
-            soup.find(class_=re.compile(r'date|time|published', re.I)),
-        ]
-        for candidate in date_candidates:
-            if candidate:
-                date_str = candidate.get('content') or candidate.get('datetime') or candidate.get_text()
-                if date_str:
-                    try:
-                        # Try parsing various date formats
-                        from dateutil import parser
-                        published_date = parser.parse(date_str)
-                        break
-                    except:
-                        pass
+        for candidate in _first(DATE_XPATHS, doc):
+            date_str = candidate.get('content') or candidate.get('datetime') or ''.join(_visible_text(candidate))
+            if date_str:
+                try:
+                    # Try parsing various date formats
+                    from dateutil import parser
+                    published_date = parser.parse(date_str)
+                    break
+                except:
+                    pass
 
         return {
             'title': title or 'Unknown Title',
@@ -166,26 +369,23 @@ class DiscoveryEngine:
 
         matched_keywords = []
         total_score = 0
-        category_scores = {}
-
-        for pattern, kw in self.keyword_patterns:
-            matches = pattern.findall(content)
-            if matches:
-                match_count = len(matches)
-                score = kw['weight'] * match_count
-                total_score += score
-                matched_keywords.append({
-                    'keyword': kw['keyword'],
-                    'category': kw['category'],
-                    'count': match_count,
-                    'score': score
-                })
-                category_scores[kw['category']] = category_scores.get(kw['category'], 0) + score
+        category_scores = Counter()
+
+        for kw, match_count in self.count_keywords(content):
+            score = kw['weight'] * match_count
+            total_score += score
+            matched_keywords.append({
+                'keyword': kw['keyword'],
+                'category': kw['category'],
+                'count': match_count,
+                'score': score
+            })
+            category_scores[kw['category']] += score
 
         # Determine primary issue type based on highest category score
         issue_type = None
         if category_scores:
-            issue_type = max(category_scores, key=category_scores.get)
+            issue_type = category_scores.most_common(1)[0][0]
 
         # Normalize score to 0-100 scale
         heat_score = min(100, total_score * 5)  # Adjust multiplier as needed
@@ -217,22 +417,20 @@ class DiscoveryEngine:
                     entities.append({'name': 'Duval', 'entity_type': 'county', 'state': 'FL'})
 
         # Check for county patterns
-        for pattern_str, entity_type in ENTITY_PATTERNS:
-            if entity_type == 'utility' and 'JEA' in pattern_str:
-                continue  # Already handled above
-            pattern = re.compile(pattern_str, re.IGNORECASE)
+        for pattern, entity_type in COMPILED_ENTITY_PATTERNS:
             matches = pattern.findall(full_text)
             for match in matches:
                 name = match.strip() if isinstance(match, str) else match
+                name_lower = name.lower()
                 # Skip common false positives
-                if name.lower() in ['the', 'a', 'an', 'by', 'to', 'in', 'for', 'and', 'or', 'this']:
+                if name_lower in ENTITY_STOPWORDS:
                     continue
 
                 # Validate it's a real Florida county if county-related
                 if entity_type in ['county', 'school_board']:
                     county_match = None
-                    for county in FLORIDA_COUNTIES:
-                        if county.lower() in name.lower():
+                    for county_lower, county in _FLORIDA_COUNTIES_LOWER:
+                        if county_lower in name_lower:
                             county_match = county
                             break
                     if not county_match:
@@ -318,7 +516,7 @@ class DiscoveryEngine:
 
         return '\n'.join(brief_parts)
 
-    def process_article(self, url: str, source_id: int = None) -> Optional[Dict]:
+    def process_article(self, url: str, source_id: int = None) -> Optional[List[Dict]]:
         """
         Process a single article URL.
         Returns opportunity data if relevant, None otherwise.
@@ -329,18 +527,55 @@ class DiscoveryEngine:
         if not html:
             return None
 
+        return self.process_html(html, url, source_id)
+
+    def analyze_html(self, html: str, url: str) -> Dict:
+        """
+        Parse and score article HTML without touching the database.
+        Pure CPU work, so async runs execute it in worker processes.
+        """
         article_data = self.extract_article_content(html, url)
         full_content = f"{article_data['title']} {article_data['content']}"
 
         # Analyze for keywords
         heat_score, matched_keywords, issue_type = self.analyze_content(full_content)
 
+        # Only pay for entity extraction when the article clears the threshold
+        entities = []
+        if heat_score >= 10:
+            entities = self.extract_entities(full_content, article_data['title'])
+
+        return {
+            'article_data': article_data,
+            'heat_score': heat_score,
+            'matched_keywords': matched_keywords,
+            'issue_type': issue_type,
+            'entities': entities,
+        }
+
+    def process_html(self, html: str, url: str, source_id: int = None) -> Optional[List[Dict]]:
+        """
+        Analyze already-fetched article HTML and save any opportunities found.
+        Shared by the blocking and async article pipelines.
+        """
+        return self.save_analysis(self.analyze_html(html, url), url, source_id)
+
+    def save_analysis(self, analysis: Dict, url: str, source_id: int = None) -> Optional[List[Dict]]:
+        """Save an analyze_html result as an article plus one opportunity per entity."""
+        article_data = analysis['article_data']
+        heat_score = analysis['heat_score']
+        matched_keywords = analysis['matched_keywords']
+        issue_type = analysis['issue_type']
+        entities = analysis['entities']
+
+        if self.fingerprints and self.fingerprints.check_and_add_content(article_data['content']):
+            logger.info(f"Skipping duplicate article content: {url}")
+            return None
+
         if heat_score < 10:  # Minimum threshold
             logger.info(f"Article below threshold (score: {heat_score})")
             return None
 
-        # Extract entities
-        entities = self.extract_entities(full_content, article_data['title'])
         if not entities:
             logger.info("No government entities found in article")
             return None
@@ -356,10 +591,9 @@ class DiscoveryEngine:
         )
 
         # Record keyword matches
-        for kw_match in matched_keywords:
-            kw_data = next((k for k in self.keywords if k['keyword'] == kw_match['keyword']), None)
-            if kw_data:
-                db.add_keyword_match(article_id, kw_data['id'], kw_match['count'])
+        keyword_ids = {k['keyword']: k['id'] for k in self.keywords}
+        db.add_keyword_matches_bulk([(article_id, keyword_ids[kw_match['keyword']], kw_match['count'])
+                                     for kw_match in matched_keywords if kw_match['keyword'] in keyword_ids])
 
         results = []
         for entity in entities:
@@ -411,26 +645,114 @@ class DiscoveryEngine:
 
         return results
 
-    def search_google_news(self, query: str, num_results: int = 10) -> List[str]:
+    def search_google_news(self, query: str, num_results: int = 10, encoded: str = None) -> List[str]:
         """
         Search Google News for relevant articles.
+        Pass `encoded` (the URL-quoted query) to skip re-encoding precomputed queries.
         Returns list of article URLs.
         """
+        cached = self.search_cache.get((query, num_results))
+        if cached is not None:
+            return list(cached)
+
         # Use Google News RSS feed
-        search_url = f"https://news.google.com/rss/search?q={requests.utils.quote(query)}&hl=en-US&gl=US&ceid=US:en"
+        search_url = google_news_rss_url(encoded or quote_plus(query))
+
+        # Fetch through the pooled session rather than letting feedparser open its own connection
+        # Search results change quickly, so they bypass the page cache
+        feed_xml = self.fetch_page(search_url, use_cache=False)
+        if not feed_xml:
+            return []
 
         try:
             import feedparser
-            feed = feedparser.parse(search_url)
+            feed = feedparser.parse(feed_xml)
             urls = []
             for entry in feed.entries[:num_results]:
                 # Google News redirects through their URL, try to get the actual URL
                 urls.append(entry.link)
+            self.search_cache.set((query, num_results), tuple(urls))
+            return urls
+        except Exception as e:
+            logger.error(f"Error searching Google News: {e}")
+            return []
+
+    # ============== Async variants (used for large concurrent runs) ==============
+
+    async def fetch_page_async(self, url: str, use_cache: bool = True) -> Optional[str]:
+        """Fetch a web page without blocking the event loop. Use inside `async with engine:`."""
+        cached = self.http_cache.get(url) if use_cache else None
+        if cached and self.http_cache.is_fresh(cached):
+            return cached['body']
+
+        await self.host_limiter.acquire_async(url)
+        try:
+            async with self.async_session.get(url, headers=HTTPCache.conditional_headers(cached),
+                                              timeout=aiohttp.ClientTimeout(total=30)) as response:
+                if cached and response.status == 304:
+                    self.http_cache.touch(url)
+                    return cached['body']
+                if response.status == 429:
+                    # Surfaced rather than swallowed so callers can back off and retry
+                    raise RateLimitedError(url)
+                response.raise_for_status()
+                body = await response.text()
+                if use_cache:
+                    self.http_cache.store(url, body, response.headers.get('ETag'),
+                                          response.headers.get('Last-Modified'))
+                return body
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Error fetching {url}: {e}")
+            return None
+
+    async def search_google_news_async(self, query: str, num_results: int = 10,
+                                       encoded: str = None) -> List[str]:
+        """
+        Async version of search_google_news; fetches the RSS feed over the shared session.
+        Raises RateLimitedError if Google News answers 429.
+        """
+        cached = self.search_cache.get((query, num_results))
+        if cached is not None:
+            return list(cached)
+
+        search_url = google_news_rss_url(encoded or quote_plus(query))
+
+        feed_xml = await self.fetch_page_async(search_url, use_cache=False)
+        if not feed_xml:
+            return []
+
+        try:
+            import feedparser
+            feed = feedparser.parse(feed_xml)
+            urls = [entry.link for entry in feed.entries[:num_results]]
+            self.search_cache.set((query, num_results), tuple(urls))
             return urls
         except Exception as e:
             logger.error(f"Error searching Google News: {e}")
             return []
 
+    async def process_article_async(self, url: str, source_id: int = None) -> Optional[List[Dict]]:
+        """Async version of process_article; only the fetch is awaited."""
+        logger.info(f"Processing article: {url}")
+
+        html = await self.fetch_page_async(url)
+        if not html:
+            return None
+
+        if self.async_session is None:
+            # Outside `async with` nothing would shut workers down, so analyze in-process
+            return self.process_html(html, url, source_id)
+
+        if self.pool is None:
+            # Started on first use, so fetch-only runs (prewarm, adding articles) never spawn workers.
+            # Workers build their own engine from our keyword list once, not per article.
+            self.pool = ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_analysis_worker,
+                                            initargs=(self.keywords,))
+
+        loop = asyncio.get_running_loop()
+        analysis = await loop.run_in_executor(self.pool, _analyze_in_worker, html, url)
+        return self.save_analysis(analysis, url, source_id)
+
     def run_discovery(self, search_queries: List[str] = None) -> List[Dict]:
         """
         Run a full discovery cycle.
@@ -467,22 +789,91 @@ class DiscoveryEngine:
                 except Exception as e:
                     logger.error(f"Error processing {url}: {e}")
 
-                # Be nice to servers
-                time.sleep(1)
-
         logger.info(f"Discovery complete. Found {len(all_results)} opportunities.")
         return all_results
 
 
-def manual_add_article(url: str) -> Optional[List[Dict]]:
+# ============== Process-pool workers ==============
+
+_worker_engine: Optional[DiscoveryEngine] = None
+
+
+def _init_analysis_worker(keywords: List[Dict]):
+    """Build the per-process engine used for HTML analysis."""
+    global _worker_engine
+    _worker_engine = DiscoveryEngine(keywords=keywords)
+
+
+def _analyze_in_worker(html: str, url: str) -> Dict:
+    """Run analyze_html in a worker process."""
+    return _worker_engine.analyze_html(html, url)
+
+
+def manual_add_article(url: str, engine: DiscoveryEngine = None) -> Optional[List[Dict]]:
     """
     Manually add and process an article URL.
     Useful for adding specific articles you've found.
+    Pass `engine` to reuse its keywords and connection pool across calls.
     """
-    engine = DiscoveryEngine()
+    engine = engine or DiscoveryEngine()
     return engine.process_article(url)
 
 
+def ingest_html(engine: DiscoveryEngine, url: str, html) -> Optional[List[Dict]]:
+    """
+    Ingest stage of manual_add_articles: turn one fetch result into opportunities.
+    Fetch failures (None or an exception) are passed through unchanged.
+    """
+    if not html or isinstance(html, BaseException):
+        return html or None
+    try:
+        # A failing article rolls back only its own rows when run inside db.transaction()
+        with db.savepoint('article'):
+            return engine.process_html(html, url)
+    except Exception as e:
+        return e
+
+
+async def _add_articles_async(urls: List[str], concurrency: int) -> List:
+    semaphore = asyncio.Semaphore(concurrency)
+    # One engine for the whole batch, so its keep-alive pool and host limiter are shared.
+    # Each host may burst two requests, then gets one per second; other hosts never wait on it.
+    engine = DiscoveryEngine()
+    engine.host_limiter = HostRateLimiter(rate=1, per=1.0, capacity=2)
+    # Re-running a seed serves pages from disk; stale ones are revalidated with a conditional GET
+    engine.http_cache = HTTPCache(expire_after=SEED_EXPIRE_AFTER)
+
+    async def fetch(url):
+        async with semaphore:
+            return await engine.fetch_page_async(url)
+
+    # Start same-host URLs back to back so they reuse the pooled connection
+    order = sorted(range(len(urls)), key=lambda i: urlparse(urls[i]).netloc.lower())
+    try:
+        # Fetch stage: every page concurrently over the shared aiohttp session
+        async with engine:
+            pages = await asyncio.gather(*(fetch(urls[i]) for i in order), return_exceptions=True)
+
+        # Ingest stage: parsing, scoring and database writes, one article at a time,
+        # all committed together
+        ordered = [None] * len(urls)
+        with db.transaction():
+            for i, html in zip(order, pages):
+                ordered[i] = ingest_html(engine, urls[i], html)
+    finally:
+        engine.close()
+
+    return ordered
+
+
+def manual_add_articles(urls: List[str], concurrency: int = 8) -> List:
+    """
+    Manually add many article URLs, fetching up to `concurrency` at a time.
+    Returns one entry per URL, in order: the opportunity list, None, or the exception raised.
+    """
+    return asyncio.run(_add_articles_async(list(urls), concurrency))
+
+
 if __name__ == '__main__':
     # Initialize database if needed
     db.init_database()
@@ -0,0 +1,100 @@
+"""
+Persistent cache of sentence-transformer embeddings.
+Embeddings are stored as float16 blobs in a small SQLite file, keyed by the model
+name and a hash of the normalized text, so unchanged RFPs - and RFPs whose only edits
+are case, whitespace or punctuation - are never re-encoded on rescore.
+"""
+
+import os
+import re
+import sqlite3
+import hashlib
+import logging
+from typing import Dict, Iterable
+
+import numpy as np
+
+from . import database as db
+
+logger = logging.getLogger(__name__)
+
+# Kept separate from the main database so it can be deleted freely
+CACHE_PATH = os.path.join(os.path.dirname(db.DB_PATH), 'embedding_cache.db')
+
+# Hashes per SELECT, well under SQLite's bound-parameter limit
+LOOKUP_CHUNK = 500
+
+
+def normalize_text(text: str) -> str:
+    """Reduce text to lowercase words so cosmetic edits don't change its cache key."""
+    return ' '.join(re.findall(r'\w+', text.lower()))
+
+
+def text_key(text: str) -> str:
+    """Hash the normalized text into a fixed-size cache key."""
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+
+
+class EmbeddingCache:
+    """On-disk cache of text embeddings for one model."""
+
+    def __init__(self, model_name: str, path: str = None):
+        """
+        Initialize the cache.
+
+        Args:
+            model_name: Model the embeddings come from; other models' entries are ignored
+            path: SQLite file to store embeddings in
+        """
+        self.model_name = model_name
+        self.path = path or CACHE_PATH
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                dim INTEGER NOT NULL,
+                embedding BLOB NOT NULL,
+                PRIMARY KEY (model, text_hash)
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, np.ndarray]:
+        """Look up embeddings by text hash; missing hashes are left out of the result."""
+        keys = list(dict.fromkeys(keys))
+        found = {}
+
+        conn = self._connect()
+        for start in range(0, len(keys), LOOKUP_CHUNK):
+            chunk = keys[start:start + LOOKUP_CHUNK]
+            rows = conn.execute(
+                f"SELECT text_hash, embedding FROM embeddings WHERE model = ? "
+                f"AND text_hash IN ({','.join('?' * len(chunk))})",
+                (self.model_name, *chunk)
+            ).fetchall()
+            for text_hash, blob in rows:
+                found[text_hash] = np.frombuffer(blob, dtype=np.float16).astype(np.float32)
+        conn.close()
+
+        return found
+
+    def put_many(self, embeddings: Dict[str, np.ndarray]):
+        """Store embeddings by text hash, as float16 to halve the file size."""
+        if not embeddings:
+            return
+
+        conn = self._connect()
+        conn.executemany('''
+            INSERT OR REPLACE INTO embeddings (model, text_hash, dim, embedding)
+            VALUES (?, ?, ?, ?)
+        ''', [(self.model_name, key, len(vector), np.asarray(vector, dtype=np.float16).tobytes())
+              for key, vector in embeddings.items()])
+        conn.commit()
+        conn.close()
@@ -0,0 +1,256 @@
+"""
+HTTP response caches for discovery fetches.
+HTTPCache stores page bodies in a small SQLite file keyed by a hash of the URL, and
+revalidates stale entries with ETag / Last-Modified conditional requests.
+ResponseCache does the same for the browser scraper, keeping status, headers and raw bytes.
+TTLCache is a small in-process LRU for results that are cheap to keep in memory.
+"""
+
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Hashable, Any
+
+from . import database as db
+
+logger = logging.getLogger(__name__)
+
+# Kept separate from the main database so it can be deleted freely
+CACHE_PATH = os.path.join(os.path.dirname(db.DB_PATH), 'http_cache.db')
+BROWSER_CACHE_PATH = os.path.join(os.path.dirname(db.DB_PATH), 'browser_cache.db')
+
+# Serve cached pages without revalidating for this long (seconds)
+DEFAULT_EXPIRE_AFTER = 24 * 60 * 60
+
+# Published articles rarely change, so hand-picked seed articles are trusted for longer
+SEED_EXPIRE_AFTER = 30 * 24 * 60 * 60
+
+# Browser responses without a max-age are reused for this long; bid lists change during the day
+BROWSER_EXPIRE_AFTER = 60 * 60
+
+
+def url_key(url: str) -> str:
+    """Hash a URL into a fixed-size cache key."""
+    return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+
+class HTTPCache:
+    """On-disk cache of fetched pages."""
+
+    def __init__(self, path: str = None, expire_after: int = DEFAULT_EXPIRE_AFTER):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file to store responses in
+            expire_after: Seconds before an entry must be revalidated
+        """
+        self.path = path or CACHE_PATH
+        self.expire_after = expire_after
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                url_hash TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                body TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Get the cached entry for a URL, fresh or not."""
+        conn = self._connect()
+        row = conn.execute('SELECT * FROM responses WHERE url_hash = ?', (url_key(url),)).fetchone()
+        conn.close()
+        return dict(row) if row else None
+
+    def is_fresh(self, entry: Dict) -> bool:
+        """Whether an entry can be served without contacting the server."""
+        return time.time() - entry['fetched_at'] < self.expire_after
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict]) -> Dict[str, str]:
+        """Revalidation headers for a stale entry, so an unchanged page costs only a 304."""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url: str, body: str, etag: str = None, last_modified: str = None):
+        """Save a freshly fetched page."""
+        conn = self._connect()
+        conn.execute('''
+            INSERT OR REPLACE INTO responses (url_hash, url, body, etag, last_modified, fetched_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (url_key(url), url, body, etag, last_modified, time.time()))
+        conn.commit()
+        conn.close()
+
+    def touch(self, url: str):
+        """Mark an entry as revalidated (the server answered 304 Not Modified)."""
+        conn = self._connect()
+        conn.execute('UPDATE responses SET fetched_at = ? WHERE url_hash = ?', (time.time(), url_key(url)))
+        conn.commit()
+        conn.close()
+
+
+class ResponseCache:
+    """
+    On-disk cache of full responses (status, headers, body bytes) for the browser scraper.
+    Entries expire per the response's Cache-Control max-age, or after a default time.
+    """
+
+    # Headers describing the original transfer, which no longer apply to the stored (decoded) body
+    TRANSFER_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding'}
+
+    def __init__(self, path: str = None, expire_after: int = BROWSER_EXPIRE_AFTER):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file to store responses in
+            expire_after: Seconds an entry stays fresh when the response sets no max-age
+        """
+        self.path = path or BROWSER_CACHE_PATH
+        self.expire_after = expire_after
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        conn = self._connect()
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                url_hash TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Get the cached response for a URL, fresh or not."""
+        conn = self._connect()
+        row = conn.execute('SELECT * FROM responses WHERE url_hash = ?', (url_key(url),)).fetchone()
+        conn.close()
+        if not row:
+            return None
+
+        entry = dict(row)
+        entry['headers'] = json.loads(entry['headers'])
+        return entry
+
+    @staticmethod
+    def is_fresh(entry: Dict) -> bool:
+        """Whether an entry can be served without contacting the server."""
+        return time.time() < entry['expires_at']
+
+    def lifetime(self, headers: Dict[str, str]) -> Optional[int]:
+        """Seconds a response may be cached for, or None if it must not be stored."""
+        cache_control = headers.get('cache-control', '').lower()
+        if 'no-store' in cache_control:
+            return None
+
+        max_age = re.search(r'max-age=(\d+)', cache_control)
+        if max_age:
+            return int(max_age.group(1))
+        return self.expire_after
+
+    def store(self, url: str, status: int, headers: Dict[str, str], body: bytes):
+        """Save a response, unless its Cache-Control forbids it."""
+        headers = {k.lower(): v for k, v in headers.items()}
+        lifetime = self.lifetime(headers)
+        if lifetime is None:
+            return
+
+        headers = {k: v for k, v in headers.items() if k not in self.TRANSFER_HEADERS}
+        conn = self._connect()
+        conn.execute('''
+            INSERT OR REPLACE INTO responses (url_hash, url, status, headers, body, expires_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (url_key(url), url, status, json.dumps(headers), body, time.time() + lifetime))
+        conn.commit()
+        conn.close()
+
+    def touch(self, url: str, headers: Dict[str, str]):
+        """Extend an entry after the server answered 304 Not Modified."""
+        lifetime = self.lifetime({k.lower(): v for k, v in headers.items()})
+        conn = self._connect()
+        conn.execute('UPDATE responses SET expires_at = ? WHERE url_hash = ?',
+                     (time.time() + (lifetime or 0), url_key(url)))
+        conn.commit()
+        conn.close()
+
+
+class TTLCache:
+    """In-memory LRU cache whose entries also expire after a fixed time. Thread-safe."""
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 3600):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries; the least recently used is evicted first
+            ttl: Seconds an entry stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a live entry, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """Store an entry, evicting the least recently used one if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
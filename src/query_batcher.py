@@ -0,0 +1,84 @@
+"""
+Batched, rate-limited Google News searches for large discovery runs.
+Queries are collected into small batches that are searched concurrently,
+under a per-minute ceiling, instead of firing every query at once.
+"""
+
+import time
+import random
+import asyncio
+import logging
+from typing import List, Tuple, Callable, Awaitable
+
+from .discovery import DiscoveryEngine, RateLimitedError
+from .rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBatcher:
+    """Collects search queries and runs them in concurrent batches."""
+
+    def __init__(self, engine: DiscoveryEngine, batch_size: int = 8, max_wait: float = 5.0,
+                 per_minute: int = 60, num_results: int = 10, max_retries: int = 4,
+                 backoff: float = 2.0):
+        """
+        Initialize the batcher.
+
+        Args:
+            engine: Discovery engine whose async session is used for searches
+            batch_size: Flush once this many queries are pending
+            max_wait: Flush once the oldest pending query has waited this many seconds
+            per_minute: Maximum searches started per minute across all batches
+            num_results: Article URLs to keep per query
+            max_retries: Retries for a query that keeps getting 429s
+            backoff: Initial backoff in seconds, doubled on every retry
+        """
+        self.engine = engine
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.num_results = num_results
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.limiter = TokenBucket(per_minute, per=60.0)
+        self.pending: List[Tuple[str, str]] = []
+        self.oldest = None
+
+    def add(self, query: str, encoded: str = None):
+        """Queue a query (optionally with its precomputed URL encoding)."""
+        if not self.pending:
+            self.oldest = time.monotonic()
+        self.pending.append((query, encoded))
+
+    def should_flush(self) -> bool:
+        """Whether the pending batch is full or has waited long enough."""
+        if not self.pending:
+            return False
+        return len(self.pending) >= self.batch_size or time.monotonic() - self.oldest >= self.max_wait
+
+    async def _search(self, query: str, encoded: str) -> List[str]:
+        """Search one query, backing off exponentially while Google News rate-limits us."""
+        for attempt in range(self.max_retries + 1):
+            await self.limiter.acquire_async()
+            try:
+                return await self.engine.search_google_news_async(query, self.num_results, encoded=encoded)
+            except RateLimitedError:
+                if attempt == self.max_retries:
+                    break
+                delay = self.backoff * 2 ** attempt + random.uniform(0, 1)
+                logger.warning(f"Rate limited on '{query}', retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+        logger.error(f"Giving up on '{query}' after {self.max_retries} retries")
+        return []
+
+    async def flush(self) -> List[Tuple[str, List[str]]]:
+        """Search every pending query concurrently and return (query, urls) pairs."""
+        batch, self.pending = self.pending, []
+        results = await asyncio.gather(*(self._search(query, encoded) for query, encoded in batch))
+        return [(query, urls) for (query, _), urls in zip(batch, results)]
+
+    async def flush_into(self, on_urls: Callable[[str, List[str]], Awaitable[None]]):
+        """Flush the pending batch and hand each query's URLs to `on_urls`."""
+        for query, urls in await self.flush():
+            await on_urls(query, urls)
@@ -0,0 +1,79 @@
+"""
+Per-host rate limiting for outbound HTTP requests.
+Keeps politeness delays per domain so requests to different hosts don't wait on each other.
+"""
+
+import time
+import asyncio
+import threading
+from collections import defaultdict
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """
+    Token bucket allowing `rate` requests per `per` seconds, with bursts up to
+    `capacity` (defaults to `rate`).
+    """
+
+    def __init__(self, rate: float, per: float = 1.0, capacity: float = None):
+        self.rate = rate
+        self.per = per
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._async_lock = None
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate / self.per)
+        self.updated = now
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens * self.per / self.rate
+
+    def acquire(self):
+        """Block until a token is available."""
+        with self._lock:
+            wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Wait (without blocking the event loop) until a token is available."""
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        async with self._async_lock:
+            wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+
+class HostRateLimiter:
+    """Lazily creates one TokenBucket per hostname."""
+
+    def __init__(self, rate: float = 2, per: float = 1.0, capacity: float = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Requests allowed per host in each period
+            per: Period length in seconds
+            capacity: Burst size per host (defaults to rate)
+        """
+        self.buckets = defaultdict(lambda: TokenBucket(rate, per, capacity))
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        """Get the bucket for the URL's host."""
+        return self.buckets[urlparse(url).netloc.lower()]
+
+    def acquire(self, url: str):
+        """Block until a request to this URL's host is allowed."""
+        self.bucket_for(url).acquire()
+
+    async def acquire_async(self, url: str):
+        """Await until a request to this URL's host is allowed."""
+        await self.bucket_for(url).acquire_async()
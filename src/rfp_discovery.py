@@ -9,6 +9,7 @@ import requests
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
+from collections import Counter
 from urllib.parse import urljoin, urlparse
 
 from . import database as db
@@ -47,18 +48,18 @@ class RFPDiscoveryEngine:
         """Calculate relevance score and determine category based on keyword matches."""
         text = f"{title} {description}".lower()
         total_score = 0
-        matched_categories = {}
+        matched_categories = Counter()
 
         for keyword, info in self.keyword_patterns.items():
             if info['pattern'].search(text):
                 total_score += info['weight']
                 cat = info['category']
-                matched_categories[cat] = matched_categories.get(cat, 0) + info['weight']
+                matched_categories[cat] += info['weight']
 
         # Determine primary category
         primary_category = None
         if matched_categories:
-            primary_category = max(matched_categories, key=matched_categories.get)
+            primary_category = matched_categories.most_common(1)[0][0]
 
         is_relevant = total_score >= 2.0  # Threshold for relevance
 
@@ -1389,32 +1390,30 @@ class RFPDiscoveryEngine:
         """Save discovered RFPs to database."""
         saved_count = 0
 
+        records = []
         for rfp_data in rfps:
-            # Try to match entity
-            entity_id = self.match_entity(rfp_data.get('agency_name'))
-
-            # Parse dates
-            posted_date = rfp_data.get('posted_date')
-            due_date = rfp_data.get('due_date')
-
-            # Create RFP record
-            rfp_id = db.create_rfp(
-                title=rfp_data['title'],
-                entity_id=entity_id,
-                description=rfp_data.get('description'),
-                solicitation_number=rfp_data.get('solicitation_number'),
-                rfp_type=rfp_data.get('rfp_type', 'RFP'),
-                category=rfp_data.get('category'),
-                posted_date=posted_date,
-                due_date=due_date,
-                source_url=rfp_data.get('source_url'),
-                source_portal=rfp_data.get('source_portal'),
-                is_relevant=1 if rfp_data.get('is_relevant') else 0,
-                relevance_score=rfp_data.get('relevance_score', 0),
-                is_quick_response=1 if rfp_data.get('is_quick_response') else 0,
-                response_deadline_hours=rfp_data.get('response_deadline_hours')
-            )
-
+            records.append({
+                'title': rfp_data['title'],
+                # Try to match entity
+                'entity_id': self.match_entity(rfp_data.get('agency_name')),
+                'description': rfp_data.get('description'),
+                'solicitation_number': rfp_data.get('solicitation_number'),
+                'rfp_type': rfp_data.get('rfp_type', 'RFP'),
+                'category': rfp_data.get('category'),
+                'posted_date': rfp_data.get('posted_date'),
+                'due_date': rfp_data.get('due_date'),
+                'source_url': rfp_data.get('source_url'),
+                'source_portal': rfp_data.get('source_portal'),
+                'is_relevant': 1 if rfp_data.get('is_relevant') else 0,
+                'relevance_score': rfp_data.get('relevance_score', 0),
+                'is_quick_response': 1 if rfp_data.get('is_quick_response') else 0,
+                'response_deadline_hours': rfp_data.get('response_deadline_hours'),
+            })
+
+        # One transaction for the whole batch instead of a commit per RFP
+        rfp_ids = db.create_rfps_bulk(records)
+
+        for rfp_data, rfp_id in zip(rfps, rfp_ids):
             if rfp_id:
                 saved_count += 1
                 if rfp_data.get('is_quick_response'):
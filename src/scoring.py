@@ -6,6 +6,7 @@ Calculates and updates heat scores for opportunities based on multiple factors.
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
+from operator import itemgetter
 
 from . import database as db
 
@@ -164,7 +165,7 @@ class ScoringEngine:
     def determine_priority(self, heat_score: float) -> str:
         """Determine priority level based on heat score."""
         for priority, threshold in sorted(self.PRIORITY_THRESHOLDS.items(),
-                                         key=lambda x: x[1], reverse=True):
+                                         key=itemgetter(1), reverse=True):
             if heat_score >= threshold:
                 return priority
         return 'low'
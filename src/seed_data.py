@@ -0,0 +1,58 @@
+"""
+Reference data for Florida entities and news sources.
+Loaded from the CSV files in data/seeds so the seed scripts and the
+discovery engine share one copy instead of each hardcoding its own lists.
+"""
+
+import os
+import sys
+import csv
+import functools
+from typing import List, Dict, Tuple, Optional
+
+SEEDS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', 'seeds')
+
+# Values repeated on nearly every seeded row
+STATE_FL = sys.intern('FL')
+ENTITY_COUNTY = sys.intern('county')
+ENTITY_SCHOOL_BOARD = sys.intern('school_board')
+ENTITY_CITY = sys.intern('city')
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a categorical column so every row shares one string object."""
+    return sys.intern(value) if value is not None else None
+
+
+def _read_rows(filename: str) -> List[Dict[str, Optional[str]]]:
+    """Read a seed CSV, mapping empty cells to None."""
+    with open(os.path.join(SEEDS_DIR, filename), newline='', encoding='utf-8') as f:
+        return [{key: value or None for key, value in row.items()} for row in csv.DictReader(f)]
+
+
+@functools.cache
+def florida_counties() -> Tuple[Tuple[str, int], ...]:
+    """All 67 Florida counties as (name, population)."""
+    return tuple((row['name'], int(row['population'])) for row in _read_rows('fl_counties.csv'))
+
+
+@functools.cache
+def florida_cities() -> Tuple[Tuple[str, str, int], ...]:
+    """Major Florida cities as (name, county, population)."""
+    return tuple((row['name'], _intern(row['county']), int(row['population']))
+                 for row in _read_rows('fl_cities.csv'))
+
+
+@functools.cache
+def special_districts() -> Tuple[Tuple[str, str, Optional[str]], ...]:
+    """Special districts and authorities as (name, entity_type, county)."""
+    return tuple((row['name'], _intern(row['entity_type']), _intern(row['county']))
+                 for row in _read_rows('fl_special_districts.csv'))
+
+
+@functools.cache
+def florida_news_sources() -> Tuple[Tuple[str, str, str, Optional[str], str], ...]:
+    """News and official sources as (name, source_type, url, state, region)."""
+    return tuple((row['name'], _intern(row['source_type']), row['url'], _intern(row['state']),
+                  _intern(row['region']))
+                 for row in _read_rows('fl_news_sources.csv'))
@@ -22,7 +22,7 @@ from src.scoring import ScoringEngine, get_score_breakdown
 from src.rfp_discovery import RFPDiscoveryEngine, manual_add_rfp
 from src.notifications import NotificationService, send_daily_digest, send_deadline_alerts
 from src.scheduler import get_scheduler, start_scheduler, run_discovery_now
-from src.calendar_export import export_rfp_deadlines, export_bid_deadlines, export_single_rfp
+from src.calendar_export import export_rfp_deadlines, export_bid_deadlines, export_single_rfp, clear_cache as clear_calendar_cache
 from src.document_downloader import DocumentDownloader, download_rfp_documents
 from src.ai_scoring import AIRelevanceScorer, score_rfp as ai_score_rfp
 
@@ -297,8 +297,7 @@ def entity_detail(entity_id):
         return redirect(url_for('entities_list'))
 
     # Get opportunities for this entity
-    all_opportunities = db.get_all_opportunities()
-    entity_opportunities = [o for o in all_opportunities if o['entity_id'] == entity_id]
+    entity_opportunities = db.get_all_opportunities(entity_id=entity_id)
 
     contacts = db.get_entity_contacts(entity_id)
 
@@ -460,6 +459,7 @@ def update_rfp_route(rfp_id):
 
     if updates:
         db.update_rfp(rfp_id, **updates)
+        clear_calendar_cache()
         flash('RFP updated successfully', 'success')
 
     return redirect(url_for('rfp_detail', rfp_id=rfp_id))
@@ -515,6 +515,7 @@ def add_rfp_route():
         )
 
     if rfp_id:
+        clear_calendar_cache()
         flash('RFP added successfully', 'success')
         return redirect(url_for('rfp_detail', rfp_id=rfp_id))
     else:
@@ -1084,6 +1085,7 @@ def api_rescore_rfp(rfp_id):
                      relevance_score=result['final_score'],
                      is_relevant=1 if result['is_relevant'] else 0,
                      category=result.get('category'))
+        clear_calendar_cache()
 
         return jsonify(result)
     except Exception as e:
@@ -1096,6 +1098,7 @@ def api_rescore_all_rfps():
     try:
         scorer = AIRelevanceScorer()
         stats = scorer.rescore_all_rfps()
+        clear_calendar_cache()
         return jsonify(stats)
     except Exception as e:
         return jsonify({'error': str(e)}), 500